@@ -0,0 +1,112 @@
+"""Genera archivos de inscritos y becados ficticios que pasan la validación del programa, para las pruebas de
+rendimiento.
+
+Uso: python benchmarks/generador.py --filas 100000 --carpeta datos [--coincidencia 0.8] [--discrepancia 0.1]
+                                    [--becados 216] [--formato csv] [--semilla 1]
+
+Los inscritos tienen las columnas de la tabla más una columna extra ("Correo"), con cédulas únicas. De los
+becados, la fracción `coincidencia` son inscritos (con los mismos datos salvo la fracción `discrepancia` de
+ellos, que tienen un campo distinto) y el resto no aparece entre los inscritos. La misma semilla genera
+siempre los mismos archivos.
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nucleo import CARRERAS, ENCABEZADOS_VISUALIZACION, LIMITE_BECADOS, SEMESTRES, TIPOS_CEDULA
+
+NOMBRES = ["Ana", "José", "María", "Luis", "Ángel", "Sofía", "Bárbara", "Carlos", "Andrés", "Lucía", "Jesús",
+           "Mónica", "Héctor", "Inés", "Ramón", "Belén", "Iván", "Yolanda", "Óscar", "Zoé", "Rubén", "Ágata"]
+APELLIDOS = ["Pérez", "Gómez", "Borges", "Núñez", "Rodríguez", "Martínez", "López", "Hernández", "Muñoz",
+             "Díaz", "Sánchez", "Ramírez", "Jiménez", "Álvarez", "Peña", "Suárez", "Márquez", "Ortíz"]
+ENCABEZADOS_INSCRITOS = ENCABEZADOS_VISUALIZACION + ["Correo"]
+CEDULA_MINIMA, CEDULA_MAXIMA = 1000000, 40000000
+
+
+def generar_estudiantes(filas, becados=LIMITE_BECADOS, coincidencia=0.8, discrepancia=0.1, semilla=1):
+    """Devuelve (inscritos, becados) como listas de filas en el orden de ENCABEZADOS_INSCRITOS y
+    ENCABEZADOS_VISUALIZACION."""
+    aleatorio = random.Random(semilla)
+    becados = min(becados, LIMITE_BECADOS)
+    en_comun = min(round(becados * coincidencia), filas)
+    cedulas = aleatorio.sample(range(CEDULA_MINIMA, CEDULA_MAXIMA), filas + becados - en_comun)
+    semestres = list(SEMESTRES)
+
+    def estudiante(cedula):
+        return [aleatorio.choice(TIPOS_CEDULA), str(cedula),
+                f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(NOMBRES)}",
+                f"{aleatorio.choice(APELLIDOS)} {aleatorio.choice(APELLIDOS)}",
+                aleatorio.choice(CARRERAS), aleatorio.choice(semestres)]
+
+    inscritos = [estudiante(cedula) + [f"e{cedula}@correo.com"] for cedula in cedulas[:filas]]
+    lista_becados = []
+    for i, fila in enumerate(aleatorio.sample(range(filas), en_comun)):
+        becado = inscritos[fila][:len(ENCABEZADOS_VISUALIZACION)]
+        if i < round(en_comun * discrepancia):
+            campo = aleatorio.choice(["Nombres", "Carrera", "Semestre"])
+            col = ENCABEZADOS_VISUALIZACION.index(campo)
+            opciones = {"Nombres": NOMBRES, "Carrera": CARRERAS, "Semestre": semestres}[campo]
+            if campo == "Nombres":
+                becado[col] = f"{becado[col]} {aleatorio.choice(opciones)}"
+            else:
+                becado[col] = aleatorio.choice([v for v in opciones if v != becado[col]])
+        lista_becados.append(becado)
+    lista_becados.extend(estudiante(cedula) for cedula in cedulas[filas:])
+    aleatorio.shuffle(lista_becados)
+    return inscritos, lista_becados
+
+
+def escribir_archivo(ruta, encabezados, filas):
+    """Escribe las filas en un .csv (separado por ';', como lo guarda Excel en español) o en un .xlsx."""
+    if ruta.endswith('.xlsx'):
+        import xlsxwriter
+        libro = xlsxwriter.Workbook(ruta, {'constant_memory': True})
+        hoja = libro.add_worksheet()
+        hoja.write_row(0, 0, encabezados)
+        for i, fila in enumerate(filas, 1):
+            hoja.write_row(i, 0, fila)
+        libro.close()
+    else:
+        with open(ruta, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.writer(f, delimiter=';')
+            escritor.writerow(encabezados)
+            escritor.writerows(filas)
+
+
+def generar_archivos(carpeta, filas, becados=LIMITE_BECADOS, coincidencia=0.8, discrepancia=0.1, semilla=1, formato='csv'):
+    """Escribe inscritos_<filas>.<formato> y becados_<filas>.csv en `carpeta` y devuelve sus rutas."""
+    inscritos, lista_becados = generar_estudiantes(filas, becados, coincidencia, discrepancia, semilla)
+    ruta_inscritos = os.path.join(carpeta, f"inscritos_{filas}.{formato}")
+    ruta_becados = os.path.join(carpeta, f"becados_{filas}.csv")
+    escribir_archivo(ruta_inscritos, ENCABEZADOS_INSCRITOS, inscritos)
+    escribir_archivo(ruta_becados, ENCABEZADOS_VISUALIZACION, lista_becados)
+    return ruta_inscritos, ruta_becados
+
+
+def argumentos_generador(parser):
+    """Agrega al `parser` las opciones que controlan los datos generados."""
+    parser.add_argument('--becados', type=int, default=LIMITE_BECADOS, help=f"cantidad de becados (máximo {LIMITE_BECADOS})")
+    parser.add_argument('--coincidencia', type=float, default=0.8, help="fracción de los becados que están inscritos")
+    parser.add_argument('--discrepancia', type=float, default=0.1, help="fracción de los becados inscritos con un dato distinto")
+    parser.add_argument('--formato', choices=['csv', 'xlsx'], default='csv', help="formato del archivo de inscritos")
+    parser.add_argument('--semilla', type=int, default=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filas', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--carpeta', default='.')
+    argumentos_generador(parser)
+    args = parser.parse_args()
+
+    os.makedirs(args.carpeta, exist_ok=True)
+    for filas in args.filas:
+        for ruta in generar_archivos(args.carpeta, filas, args.becados, args.coincidencia, args.discrepancia, args.semilla, args.formato):
+            print(ruta, flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Compara la lectura de un .xlsx de inscritos con pd.read_excel (como se hacía antes) y con
+leer_hoja_excel() (openpyxl en modo de solo lectura).
+
+Uso: python benchmarks/lectura_excel.py [--filas 10000 100000 500000] [--repeticiones 1]
+
+Los libros se generan con xlsxwriter en un directorio temporal y se borran al terminar.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+import xlsxwriter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nucleo import CARRERAS, ENCABEZADOS_VISUALIZACION, SEMESTRES, TIPOS_CEDULA, leer_hoja_excel
+
+NOMBRES = ["Ana", "José", "María", "Luis", "Ángel", "Sofía", "Bárbara", "Carlos", "Andrés", "Lucía"]
+APELLIDOS = ["Pérez", "Gómez", "Borges", "Núñez", "Rodríguez", "Martínez", "López"]
+
+
+def generar_libro(ruta, filas):
+    """Escribe un libro con una fila de título, los encabezados y `filas` inscritos con una columna extra."""
+    aleatorio = random.Random(filas)
+    libro = xlsxwriter.Workbook(ruta)
+    hoja = libro.add_worksheet()
+    hoja.write_row(0, 0, ["Listado de inscritos"])
+    hoja.write_row(1, 0, ENCABEZADOS_VISUALIZACION + ["Correo"])
+    semestres = list(SEMESTRES)
+    for i in range(filas):
+        hoja.write_row(i + 2, 0, [
+            aleatorio.choice(TIPOS_CEDULA), 10000000 + i,
+            f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(NOMBRES)}",
+            f"{aleatorio.choice(APELLIDOS)} {aleatorio.choice(APELLIDOS)}",
+            aleatorio.choice(CARRERAS), aleatorio.choice(semestres), f"u{i}@correo.com",
+        ])
+    libro.close()
+
+
+def medir(funcion, repeticiones):
+    """Mejor tiempo en segundos de `repeticiones` llamadas."""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filas', type=int, nargs='+', default=[10000, 100000, 500000])
+    parser.add_argument('--repeticiones', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'filas':>8} {'read_excel (s)':>15} {'leer_hoja_excel (s)':>20} {'aceleración':>12}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for filas in args.filas:
+            ruta = os.path.join(directorio, f"inscritos_{filas}.xlsx")
+            generar_libro(ruta, filas)
+            antes = medir(lambda: pd.read_excel(ruta, sheet_name=0, header=None, dtype=str), args.repeticiones)
+            ahora = medir(lambda: leer_hoja_excel(ruta), args.repeticiones)
+            print(f"{filas:>8} {antes:>15.2f} {ahora:>20.2f} {antes / ahora:>11.1f}x", flush=True)
+
+
+if __name__ == '__main__':
+    main()
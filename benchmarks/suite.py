@@ -0,0 +1,203 @@
+"""Mide cada etapa del programa con datos generados por generador.py: lectura del archivo, validación, guardado
+en SQLite, preparación y poblado de la tabla, filtrado por cada tecla de la búsqueda, comparación y
+exportación a Excel, CSV y PDF.
+
+Uso: python benchmarks/suite.py [--filas 1000 10000 100000 1000000] [--salida resultados.json]
+                                [--formatos excel csv pdf] [opciones de generador.py]
+
+La importación pasa por importar_registros(), como en la ventana, así que los CSV de inscritos de más de
+UMBRAL_IMPORTACION_POR_BLOQUES se leen, validan y guardan por bloques y esas tres etapas se miden juntas
+('lectura_validacion_guardado'). Los resultados se guardan en JSON, junto con la versión del código y los
+datos de la máquina, para comparar entre versiones. Los archivos se generan en un directorio temporal y
+se borran al terminar.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import closing
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generador import argumentos_generador, generar_archivos
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from interfaz import (ARCHIVO_BD, CAPACIDAD_CACHE_BUSQUEDA, ESTADO_AMARILLO, ESTADO_ROJO, ESTADO_VERDE, CacheLRU,
+                  ControladorBusqueda, ModeloTablaColumnar, MotorComparacion, QApplication, exportar_pdf,
+                  exportar_registros, importar_registros, migrar_esquema, normalizar_texto)
+
+# Nombre de cada etapa que anuncia importar_registros() en los resultados.
+ETAPAS_IMPORTACION = {
+    "Leyendo el archivo...": "lectura",
+    "Validando los registros...": "validacion",
+    "Guardando en la base de datos...": "guardado",
+    "Preparando la tabla...": "preparacion_tabla",
+    "Indexando la búsqueda...": "indice_busqueda",
+    "Leyendo, validando y guardando por bloques...": "lectura_validacion_guardado",
+}
+EXTENSIONES = {'excel': 'xlsx', 'csv': 'csv', 'pdf': 'pdf'}
+
+
+class TareaCronometrada:
+    """Hace las veces de TareaSegundoPlano: anota cuánto dura cada etapa que anuncia reportar() y pasa cada
+    lote entregado a `al_entregar`, cuyo tiempo se anota aparte ('poblado_modelo')."""
+
+    def __init__(self, al_entregar=None):
+        self.tiempos = {}
+        self._al_entregar = al_entregar
+        self._etapa = None
+        self._inicio = 0.0
+
+    def verificar_cancelacion(self):
+        pass
+
+    def reportar(self, porcentaje, etapa=None):
+        if etapa is not None:
+            self.terminar()
+            self._etapa, self._inicio = ETAPAS_IMPORTACION.get(etapa, etapa), time.perf_counter()
+
+    def entregar(self, lote):
+        inicio = time.perf_counter()
+        if self._al_entregar:
+            self._al_entregar(lote)
+        duracion = time.perf_counter() - inicio
+        self._sumar('poblado_modelo', duracion)
+        self._inicio += duracion
+
+    def terminar(self):
+        if self._etapa is not None:
+            self._sumar(self._etapa, time.perf_counter() - self._inicio)
+            self._etapa = None
+
+    def _sumar(self, etapa, segundos):
+        self.tiempos[etapa] = self.tiempos.get(etapa, 0.0) + segundos
+
+
+def cronometrar(funcion):
+    """(resultado, segundos) de una llamada."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def importar_a_modelo(ruta, tipo_tabla, ruta_bd, modelo):
+    """Importa el archivo llenando `modelo` por lotes, como cargar_registros_a_tabla(). Devuelve (encabezados, filas, tiempos)."""
+    def recibir_lote(lote):
+        encabezados, inicio, columnas, cedulas, busqueda, codigos = lote
+        if inicio == 0:
+            modelo.iniciar_carga(encabezados)
+        modelo.agregar_lote(columnas, cedulas, busqueda, codigos)
+
+    tarea = TareaCronometrada(recibir_lote)
+    encabezados, filas, indice = importar_registros(ruta, tipo_tabla, ruta_bd, tarea)
+    tarea.terminar()
+    modelo.establecer_indice(indice)
+    return encabezados, filas, tarea.tiempos
+
+
+def medir_busqueda(modelo, consulta):
+    """Escribe `consulta` letra por letra y luego la borra, aplicando el filtro en cada pulsación como
+    ControladorBusqueda al vencer su temporizador. Devuelve los milisegundos de cada pulsación."""
+    texto = {'actual': ""}
+    controlador = ControladorBusqueda('inscritos', modelo, lambda _: (normalizar_texto(texto['actual']).split(), {}, None, None),
+                                      CacheLRU(CAPACIDAD_CACHE_BUSQUEDA))
+    pulsaciones = [consulta[:i] for i in range(1, len(consulta) + 1)]
+    pulsaciones += [consulta[:i] for i in range(len(consulta) - 1, -1, -1)]
+    tiempos = {'escritura': [], 'borrado': []}
+    for i, prefijo in enumerate(pulsaciones):
+        texto['actual'] = prefijo
+        _, segundos = cronometrar(controlador.aplicar)
+        tiempos['escritura' if i < len(consulta) else 'borrado'].append(segundos * 1000)
+    return {clave: {'pulsaciones': len(ms), 'media_ms': sum(ms) / len(ms), 'maximo_ms': max(ms)} for clave, ms in tiempos.items()}
+
+
+def medir_tamano(directorio, filas, args):
+    """Genera los archivos de `filas` inscritos y mide todas las etapas. Devuelve el resultado para el JSON."""
+    ruta_inscritos, ruta_becados = generar_archivos(directorio, filas, args.becados, args.coincidencia, args.discrepancia,
+                                                    args.semilla, args.formato)
+    ruta_bd = os.path.join(directorio, f"{filas}_{ARCHIVO_BD}")
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        migrar_esquema(conexion)
+
+    _, becados, _ = importar_a_modelo(ruta_becados, 'becados', ruta_bd, ModeloTablaColumnar())
+    modelo = ModeloTablaColumnar()
+    encabezados, inscritos, etapas = importar_a_modelo(ruta_inscritos, 'inscritos', ruta_bd, modelo)
+    resultado = {'filas': filas, 'becados': len(becados), 'bytes_archivo': os.path.getsize(ruta_inscritos), 'etapas': etapas}
+
+    consulta = " ".join(inscritos[len(inscritos) // 2][enc] for enc in ("Nombres", "Apellidos")).lower()
+    resultado['busqueda'] = dict(medir_busqueda(modelo, consulta), consulta=consulta)
+
+    def comparar():
+        comparacion = MotorComparacion().comparar(becados, inscritos, (1, 1))
+        modelo.establecer_estados(comparacion.estado_inscritos, comparacion.mascara_inscritos)
+        return comparacion
+    comparacion, etapas['comparacion'] = cronometrar(comparar)
+    resultado['comparacion'] = {nombre: int((comparacion.estado_becados == estado).sum())
+                                for nombre, estado in (('verde', ESTADO_VERDE), ('amarillo', ESTADO_AMARILLO), ('rojo', ESTADO_ROJO))}
+
+    tarea = TareaCronometrada()
+    for formato in args.formatos:
+        ruta = os.path.join(directorio, f"reporte_{filas}.{EXTENSIONES[formato]}")
+        if formato == 'pdf':
+            funcion = lambda: exportar_pdf(ruta, "Reporte de Inscritos", 'inscritos', encabezados, inscritos, range(filas), tarea)
+        else:
+            funcion = lambda: exportar_registros(ruta, formato, "Reporte de Inscritos", 'inscritos', encabezados, inscritos, range(filas), tarea)
+        _, etapas[f"exportacion_{formato}"] = cronometrar(funcion)
+        os.remove(ruta)
+    return resultado
+
+
+def version_codigo():
+    """Commit actual del repositorio (con '-modificado' si hay cambios sin guardar), o None fuera de git."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=raiz, capture_output=True, text=True, check=True).stdout.strip()
+        cambios = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=raiz, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ('-modificado' if cambios.strip() else '')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filas', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--formatos', nargs='*', choices=list(EXTENSIONES), default=list(EXTENSIONES))
+    parser.add_argument('--salida', default='resultados_benchmark.json')
+    argumentos_generador(parser)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([]) # Necesaria para los objetos de Qt del modelo y la búsqueda
+    informe = {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'version': version_codigo(),
+        'python': platform.python_version(),
+        'sistema': platform.platform(),
+        'procesadores': os.cpu_count(),
+        'parametros': {clave: valor for clave, valor in vars(args).items() if clave != 'salida'},
+        'resultados': [],
+    }
+    with tempfile.TemporaryDirectory() as directorio:
+        for filas in args.filas:
+            resultado = medir_tamano(directorio, filas, args)
+            informe['resultados'].append(resultado)
+            print(f"{filas} inscritos:")
+            for etapa, segundos in resultado['etapas'].items():
+                print(f"  {etapa:<30} {segundos:>9.3f} s")
+            for clave, busqueda in resultado['busqueda'].items():
+                if clave != 'consulta':
+                    print(f"  {'busqueda (' + clave + ')':<30} {busqueda['media_ms']:>9.2f} ms por tecla (máx. {busqueda['maximo_ms']:.2f})")
+            sys.stdout.flush()
+            with open(args.salida, 'w', encoding='utf-8') as f:
+                json.dump(informe, f, ensure_ascii=False, indent=2)
+    app.quit()
+    print(f"Resultados guardados en '{args.salida}'.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2130 @@
+"""Ventana de Zon Becados. Se abre desde main.py (ver ejecutar_interfaz); la lógica que no depende de Qt
+está en nucleo.py."""
+import sys
+import time
+INICIO_ARRANQUE = time.perf_counter()  # Antes de las demás importaciones, para medirlas también.
+import re
+import sqlite3
+import json
+import os
+import threading
+import webbrowser
+import cProfile
+import functools
+import tracemalloc
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# --- Tiempos de Arranque ---
+ARCHIVO_TIEMPOS_ARRANQUE = 'tiempos_arranque.log'
+
+class CronometroArranque:
+    """Registra cuánto tarda cada etapa del arranque. Se activa con la opción --tiempos-arranque o con
+    la variable de entorno ZON_BECADOS_TIEMPOS=1; el informe se escribe en la consola (si la hay) y en
+    ARCHIVO_TIEMPOS_ARRANQUE, ya que el ejecutable empaquetado no tiene consola."""
+
+    def __init__(self, activo, inicio):
+        self.activo = activo
+        self.etapas = []
+        self.informado = False
+        self._inicio = self._ultima_marca = inicio
+
+    def marcar(self, etapa):
+        """Registra como duración de `etapa` el tiempo transcurrido desde la marca anterior."""
+        ahora = time.perf_counter()
+        self.etapas.append((etapa, ahora - self._ultima_marca))
+        self._ultima_marca = ahora
+
+    def registrar(self, etapa, segundos):
+        """Registra una etapa medida aparte (p. ej. una importación diferida). Si el informe de arranque
+        ya se escribió, la agrega al final."""
+        self.etapas.append((etapa, segundos))
+        if self.informado:
+            self._escribir(f"{etapa}: {segundos * 1000:.0f} ms (después del arranque)")
+
+    def informar(self):
+        """Escribe el informe con la duración de cada etapa y el total hasta el primer pintado."""
+        if not self.activo or self.informado:
+            return
+        ancho = max(len(etapa) for etapa, _ in self.etapas)
+        lineas = [f"Tiempos de arranque ({time.strftime('%Y-%m-%d %H:%M:%S')}):"]
+        lineas += [f"  {etapa:<{ancho}} {segundos * 1000:8.0f} ms" for etapa, segundos in self.etapas]
+        lineas.append(f"  {'Total':<{ancho}} {(self._ultima_marca - self._inicio) * 1000:8.0f} ms")
+        self._escribir("\n".join(lineas))
+        self.informado = True
+
+    def _escribir(self, texto):
+        if not self.activo:
+            return
+        if sys.stderr is not None:
+            print(texto, file=sys.stderr)
+        try:
+            with open(ARCHIVO_TIEMPOS_ARRANQUE, 'a', encoding='utf-8') as archivo:
+                archivo.write(texto + "\n")
+        except OSError:
+            pass
+
+CRONOMETRO_ARRANQUE = CronometroArranque('--tiempos-arranque' in sys.argv or os.environ.get('ZON_BECADOS_TIEMPOS', '') not in ('', '0'),
+                                         INICIO_ARRANQUE)
+
+# --- Diagnóstico de Rendimiento ---
+class MedicionDiagnostico:
+    """Lo acumulado de una operación: llamadas, segundos (total, última y máxima), filas de la última
+    llamada y el mayor pico de memoria en bytes (None si tracemalloc no estaba activo)."""
+
+    def __init__(self):
+        self.llamadas = 0
+        self.total = self.ultima = self.maxima = 0.0
+        self.filas = None
+        self.pico_memoria = None
+
+class RegistroDiagnostico:
+    """Mide las operaciones más pesadas de la ventana con medir() o el decorador medido(). Además del tiempo
+    guarda las filas procesadas y, si tracemalloc está activo, cuánta memoria de más llegó a usar cada
+    operación. Se puede usar desde las tareas en segundo plano. Las operaciones nombradas en `perfilar`
+    (la variable de entorno ZON_BECADOS_PERFIL, separadas por comas) se perfilan con cProfile y cada
+    llamada se guarda en un archivo .prof."""
+
+    def __init__(self, perfilar=()):
+        self.mediciones = {}
+        self.perfilar = set(perfilar)
+        self.ultimo_perfil = None
+        self._bloqueo = threading.Lock()
+        self._abiertas = []
+        self._pico_anterior = 0
+        self._perfil_activo = False
+
+    @contextmanager
+    def medir(self, nombre):
+        """Mide el bloque como una llamada a la operación `nombre`. El bloque puede anotar las filas que
+        procesó en medicion['filas']. Si el bloque termina con una excepción, la llamada no se registra."""
+        medicion = {'filas': None, 'base': 0, 'pico': 0}
+        memoria = tracemalloc.is_tracing()
+        with self._bloqueo:
+            if memoria:
+                medicion['base'] = medicion['pico'] = self._muestrear_memoria()
+                self._abiertas.append(medicion)
+            perfil = cProfile.Profile() if nombre in self.perfilar and not self._perfil_activo else None
+            self._perfil_activo |= perfil is not None
+        inicio = time.perf_counter()
+        if perfil:
+            perfil.enable()
+        try:
+            yield medicion
+        finally:
+            if perfil:
+                perfil.disable()
+            segundos = time.perf_counter() - inicio
+            with self._bloqueo:
+                self._perfil_activo &= perfil is None
+                if memoria:
+                    if tracemalloc.is_tracing():
+                        self._muestrear_memoria()
+                    self._abiertas.remove(medicion)
+        self._registrar(nombre, segundos, medicion['filas'], medicion['pico'] - medicion['base'] if memoria else None)
+        if perfil:
+            self._guardar_perfil(nombre, perfil)
+
+    def medido(self, nombre, filas=None):
+        """Decorador que mide cada llamada con medir(nombre). `filas`, si se indica, recibe los mismos
+        argumentos que la función y devuelve las filas procesadas; se evalúa al terminar la llamada."""
+        def decorador(funcion):
+            @functools.wraps(funcion)
+            def envoltura(*args, **kwargs):
+                with self.medir(nombre) as medicion:
+                    resultado = funcion(*args, **kwargs)
+                    if filas is not None:
+                        medicion['filas'] = filas(*args, **kwargs)
+                return resultado
+            return envoltura
+        return decorador
+
+    def _muestrear_memoria(self):
+        """Lleva a las mediciones en curso el pico de memoria desde la muestra anterior y devuelve la memoria
+        actual. El pico de tracemalloc es global, así que se reinicia en cada muestra con reset_peak(). Sin
+        él (Python 3.8), el pico solo se toma si creció desde la muestra anterior; si no, la medición se
+        queda con la memoria actual, que es una cota inferior de su pico."""
+        actual, pico = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        elif pico <= self._pico_anterior:
+            pico = actual
+        else:
+            self._pico_anterior = pico
+        for medicion in self._abiertas:
+            medicion['pico'] = max(medicion['pico'], pico)
+        return actual
+
+    def _registrar(self, nombre, segundos, filas, pico_memoria):
+        with self._bloqueo:
+            medicion = self.mediciones.setdefault(nombre, MedicionDiagnostico())
+            medicion.llamadas += 1
+            medicion.total += segundos
+            medicion.ultima = segundos
+            medicion.maxima = max(medicion.maxima, segundos)
+            if filas is not None:
+                medicion.filas = filas
+            if pico_memoria is not None:
+                medicion.pico_memoria = max(medicion.pico_memoria or 0, pico_memoria)
+
+    def _guardar_perfil(self, nombre, perfil):
+        ruta = f"perfil_{nombre.strip('_')}_{time.strftime('%Y%m%d_%H%M%S')}_{self.mediciones[nombre].llamadas}.prof"
+        try:
+            perfil.dump_stats(ruta)
+            self.ultimo_perfil = os.path.abspath(ruta)
+        except OSError:
+            pass
+
+    def reiniciar(self):
+        with self._bloqueo:
+            self.mediciones.clear()
+
+    def filas_informe(self):
+        """Una fila de texto por operación (en el orden de ENCABEZADOS_DIAGNOSTICO), de la más lenta a la más rápida."""
+        with self._bloqueo:
+            mediciones = sorted(self.mediciones.items(), key=lambda par: par[1].maxima, reverse=True)
+            return [[nombre, str(m.llamadas), f"{m.ultima * 1000:.1f}", f"{m.total / m.llamadas * 1000:.1f}", f"{m.maxima * 1000:.1f}",
+                     "" if m.filas is None else str(m.filas), "" if m.pico_memoria is None else f"{m.pico_memoria / 2**20:.1f}"]
+                    for nombre, m in mediciones]
+
+ENCABEZADOS_DIAGNOSTICO = ["Operación", "Llamadas", "Última (ms)", "Promedio (ms)", "Máxima (ms)", "Filas", "Pico de memoria (MB)"]
+DIAGNOSTICO = RegistroDiagnostico(nombre.strip() for nombre in os.environ.get('ZON_BECADOS_PERFIL', '').split(',') if nombre.strip())
+
+CRONOMETRO_ARRANQUE.marcar("Importaciones (biblioteca estándar)")
+
+import numpy as np
+CRONOMETRO_ARRANQUE.marcar("Importaciones (numpy)")
+
+from nucleo import (
+    ARCHIVO_BD, BITS_CAMPOS_COMPARACION, CAMPOS_BECADOS, CARRERAS, COLUMNAS_CODIFICADAS, COLUMNAS_ERRORES_VALIDACION,
+    DIRECTORIO_CACHE_IMPORTACION, DIRECTORIO_INSTANTANEA, ENCABEZADOS_VISUALIZACION, ESTADO_AMARILLO, ESTADO_ROJO,
+    ESTADO_VERDE, LIMITE_BECADOS, MUESTRA_ANCHO_COLUMNAS, PDF_DISPONIBLE, SEMESTRES, SEMESTRES_POR_NUMERO,
+    TIPOS_CEDULA, TITULOS_COLOR,
+    CacheImportaciones, ErrorCedulaRepetida, ErrorExportacion, ErrorImportacion, ErrorValidacion, IndiceTrigramas,
+    InstantaneaSesion, MotorComparacion, TareaCancelada,
+    borrar_inscritos, columnas_tabla, exportar_paquete_auditoria, exportar_pdf, exportar_registros, filas_de_muestra,
+    importar_registros, leer_inscritos, leer_marca_cambios, migrar_esquema, nombre_de_reporte, normalizar_texto, pd,
+    preparar_filas, respaldar_bd, restaurar_bd, texto_para_codigo, titulo_de_reporte, verificar_respaldo,
+)
+pd.al_importar = lambda nombre, segundos: CRONOMETRO_ARRANQUE.registrar(f"Importación diferida de {nombre}", segundos)
+CRONOMETRO_ARRANQUE.marcar("Importaciones (núcleo)")
+
+# --- Importación dinámica de PySide ---
+# Intenta importar PySide6, si falla, usa PySide2. Esto hace el código compatible.
+try:
+    from PySide6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+        QPushButton, QGroupBox, QFileDialog, QMessageBox, QTableView,
+        QAbstractItemView, QHeaderView, QDialog, QLineEdit, QComboBox,
+        QFormLayout, QDialogButtonBox, QLabel, QMenu, QCheckBox, QTextEdit,
+        QButtonGroup, QProgressDialog
+    )
+    from PySide6.QtGui import QIcon, QColor, QBrush, QFont, QAction
+    from PySide6.QtCore import Qt, Signal, QObject, QTimer, QEvent, QAbstractTableModel, QModelIndex, QRunnable, QThreadPool
+except ImportError:
+    from PySide2.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+        QPushButton, QGroupBox, QFileDialog, QMessageBox, QTableView,
+        QAbstractItemView, QHeaderView, QDialog, QLineEdit, QComboBox,
+        QFormLayout, QDialogButtonBox, QLabel, QMenu, QCheckBox, QTextEdit,
+        QButtonGroup, QAction, QProgressDialog
+    )
+    from PySide2.QtGui import QIcon, QColor, QBrush, QFont
+    from PySide2.QtCore import Qt, Signal, QObject, QTimer, QEvent, QAbstractTableModel, QModelIndex, QRunnable, QThreadPool
+CRONOMETRO_ARRANQUE.marcar("Importaciones (PySide)")
+
+
+# --- Constantes ---
+COLUMNAS_CENTRADAS = {"T. Cédula", "Semestre"}
+COLUMNAS_ESTIRADAS = {"Nombres", "Apellidos", "Carrera"}
+RETARDO_BUSQUEDA_MS = 150
+CAPACIDAD_CACHE_BUSQUEDA = 64
+FILTRO_RESPALDO = "Archivos de Base de Datos (*.db)"
+FILTRO_RESPALDO_COMPRIMIDO = "Copia comprimida (*.db.gz)"
+
+COLOR_VERDE_PASTEL = QColor(204, 255, 204)
+COLOR_AMARILLO_PASTEL = QColor(255, 255, 204)
+COLOR_ROJO_PASTEL = QColor(255, 204, 204)
+
+# --- Contenido del README para la ventana "Acerca de" ---
+README_CONTENT = """
+# Gestor de Estudiantes y Becas (Zon-Becados)
+
+Este es un programa de escritorio diseñado para facilitar la gestión y auditoría de listas de estudiantes, comparando un registro general de "Estudiantes Inscritos" con una lista oficial de "Estudiantes Becados".
+
+La aplicación permite identificar visualmente qué estudiantes están en ambas listas, cuáles solo en una, y si existen discrepancias en sus datos, optimizando el proceso de validación de becas.
+
+---
+
+### **Información del Creador**
+
+* **Autor**: Ricardo Pacheco
+* **Sección**: 05S-2614-D1
+* **Carrera**: Ingeniería de Sistemas
+* **Universidad**: Universidad Nacional Experimental Politécnica de la Fuerza Armada (UNEFA)
+* **Asignatura**: Lenguaje de Programación II
+
+---
+
+## ✨ Características Principales
+
+* **Gestión Dual de Listas:** Administra y visualiza dos tablas de estudiantes por separado.
+* **Comparación Inteligente:** Con un solo clic, colorea los registros para identificar concordancias, diferencias y errores en los datos.
+* **Filtros Avanzados:** Busca por cualquier dato (nombre, cédula, etc.) y filtra por carrera, semestre o tipo de cédula. Los filtros de color permiten aislar problemas específicos.
+* **Títulos Dinámicos:** Los títulos de las tablas se actualizan en tiempo real para reflejar el filtro activo y el número de registros visibles.
+* **Exportación de Reportes:** Genera archivos en formato **Excel, CSV y PDF**. Si hay un filtro activo, el reporte solo incluirá los datos visibles.
+* **Interfaz Adaptable:** La ventana se ajusta automáticamente al tamaño de la pantalla para una mejor experiencia de usuario.
+* **Validación de Datos:** Sistema robusto que valida los datos al momento de cargar archivos, evitando errores de formato.
+
+---
+
+## 🚀 Manual de Usuario
+
+### Instalación y Ejecución
+
+Tienes dos maneras de utilizar este programa.
+
+**Opción 1: Uso del Ejecutable (Recomendado)**
+
+Esta es la forma más fácil y directa de usar la aplicación.
+
+1.  Ve a la sección de **"Releases"** en el repositorio de GitHub del proyecto.
+2.  Encontrarás dos archivos ZIP:
+    * `ZonBecados_x64.zip`: Para sistemas operativos Windows de **64 bits** (la mayoría de las computadoras modernas).
+    * `ZonBecados_x32.zip`: Para sistemas operativos Windows de **32 bits** (computadoras más antiguas).
+3.  Descarga la versión que corresponda a tu computadora.
+4.  Guarda el archivo en una carpeta de tu elección.
+5.  **¡Listo!** Descomprime el ZIP, haz doble clic en el archivo `.exe` para iniciar el programa. La base de datos (`estudiantes.db`) se creará automáticamente en la misma carpeta.
+
+**Opción 2: Ejecución desde el Código Fuente (Para Desarrolladores)**
+
+Si deseas modificar el código o ejecutarlo en un entorno de desarrollo:
+
+1.  Asegúrate de tener **Python** instalado.
+2.  Clona o descarga este repositorio.
+3.  Abre una terminal en la carpeta del proyecto e instala las dependencias usando el archivo `requirements` correspondiente a tu sistema.
+4.  Una vez instaladas, ejecuta el programa con:
+    ```bash
+    python main.py
+    ```
+
+---
+
+### Guía de Uso de la Interfaz
+
+La ventana principal se divide en **Estudiantes Inscritos** (izquierda) y **Estudiantes Becados** (derecha).
+
+#### **Carga de Archivos: Formato Requerido**
+
+Para evitar errores, tus archivos de Excel (`.xlsx`) o CSV (`.csv`) **deben contener obligatoriamente** las siguientes columnas con estos nombres exactos:
+
+| Columna            | Descripción y Reglas de Validación                                      | Ejemplo      |
+| ------------------ | ------------------------------------------------------------------------- | ------------ |
+| **T. Cédula** | Tipo de cédula. Solo acepta `V`, `E` o `P`.                             | `V`          |
+| **Cédula** | Número de cédula. Debe ser un **número** de 6 a 9 dígitos.                | `29850926`   |
+| **Nombres** | Nombres del estudiante. Texto de 3 a 30 caracteres, solo letras y espacios. | `Ana Barbara`|
+| **Apellidos** | Apellidos del estudiante. Texto de 3 a 30 caracteres, solo letras y espacios. | `Borges Verenzuela`  |
+| **Carrera** | Debe coincidir **exactamente** con una de las opciones del programa.      | `Contaduría` |
+| **Semestre** | Acepta el número (`0` a `9`) o el nombre (`CINU`, `1`, `2`, etc.).           | `7`          |
+
+> **Importante:**
+> * Para archivos Excel, los datos **deben estar en la primera hoja** del libro.
+> * El programa buscará esta cabecera en el archivo. Los datos de los estudiantes deben comenzar en la fila inmediatamente inferior. Cualquier fila o columna vacía antes de los datos puede causar problemas.
+> * Si el archivo tiene datos inválidos o cédulas repetidas, se muestran **todos los errores a la vez** en una tabla (fila, columna, regla incumplida y valor) que puedes exportar a CSV para corregirlos de una sola vez.
+
+#### **Funcionalidades Principales**
+
+1.  **Cargar y Limpiar Registros**: Usa los botones correspondientes en cada tabla para poblar o vaciar los datos desde tus archivos. La carga se hace en segundo plano: una barra de progreso muestra cada etapa (lectura, validación, guardado e indexación) y puedes cancelarla en cualquier momento sin que se modifiquen tus datos. Los CSV de inscritos de más de 32 MB se leen, validan y guardan por bloques, sin cargar el archivo completo en memoria. Si vuelves a cargar un archivo que no cambió, se toma de la caché local (carpeta `cache_importacion`) sin leerlo ni validarlo otra vez.
+
+2.  **Filtros de Búsqueda**:
+    * **Barra de búsqueda**: Escribe una o más palabras para buscar en todos los campos (ej: `ana contaduría`).
+    * **Listas desplegables**: Selecciona una carrera, semestre o tipo de cédula para acotar los resultados.
+    * **Ir a cédula**: Escribe una cédula en el recuadro junto a los filtros de color y presiona Enter para seleccionarla y llevarla al centro de ambas tablas. Si los filtros activos la ocultan, el programa te avisa.
+
+3.  **Botón "Colorear Registros"**:
+    * Activa el modo de comparación. Los colores tienen el siguiente significado:
+        * **Verde**: El estudiante existe en **ambas** listas.
+        * **Rojo**: El estudiante solo existe en **una** de las listas.
+        * **Amarillo**: El estudiante está en ambas listas (verde), pero uno o más de sus datos (nombre, carrera, etc.) **no coinciden**. Las celdas específicas con la discrepancia se pintarán de amarillo.
+
+4.  **Filtrar por Color**: Una vez coloreados los registros, usa los checkboxes "Verde", "Amarillo" o "Rojo" para aislar y analizar los casos que te interesen. Son excluyentes, solo puedes activar uno a la vez.
+
+5.  **Títulos con Contadores**: El título de cada tabla siempre te mostrará cuántos registros son visibles en ese momento, actualizándose con cada filtro que apliques. `Ej: Estudiantes Becados (no inscritos) (4)`.
+
+6.  **Exportar Reportes**: El botón "Exportar" de cada tabla (becados o inscritos) te permite guardar los datos **actualmente visibles** en Excel, CSV o PDF, en el mismo orden en que se muestran. Si tienes un filtro de color activo, el título del reporte reflejará ese filtro. Los reportes se escriben en segundo plano, sin cargar toda la tabla en memoria, con una barra de progreso que permite cancelarlos; el archivo solo aparece cuando la exportación termina. El PDF se arma en un proceso aparte, página por página, repitiendo los encabezados de la tabla en cada una (y en horizontal si las columnas no caben a lo ancho). Si aun así no caben, se angostan las columnas más anchas, y el texto que no entra en su celda se corta con "…".
+
+7.  **Menú Superior**:
+    * **Base de Datos**: Te permite guardar una copia de seguridad de tus datos (opcionalmente comprimida como `.db.gz`), cargar una copia previa o limpiar toda la base de datos para empezar de cero. Las copias se hacen en segundo plano, con una barra de progreso y la opción de cancelar sin perder nada.
+    * **Reportes**: "Exportar paquete de auditoría" guarda de una sola vez, en una carpeta nueva (`paquete_auditoria_<fecha>`) dentro de la que elijas, el reporte de cada color (verde, amarillo y rojo) de ambas tablas, sin importar los filtros activos: un CSV y un PDF por reporte y un libro `auditoria.xlsx` con una hoja por reporte. Todos salen de la misma comparación, y el libro y los PDF se arman en paralelo en varios procesos.
+    * **Ayuda**: Contiene este manual, un enlace al repositorio y "Diagnóstico", que muestra cuánto tardaron en esta sesión las operaciones más pesadas (cargar archivos, filtrar, colorear, exportar...), cuántas filas procesaron y, si se activa la casilla de memoria, cuánta memoria de más usaron. El botón "Copiar" copia la tabla para pegarla en un reporte.
+
+---
+
+## 🛠️ Para Desarrolladores
+
+### Librerías Utilizadas
+
+* **PySide6 / PySide2**: Para la creación de la interfaz gráfica de usuario.
+* **Pandas**: Para la manipulación, lectura y validación de datos.
+* **openpyxl / xlrd**: Para leer archivos de Excel fila por fila (`.xlsx` en modo de solo lectura y `.xls`).
+* **xlsxwriter**: Para escribir los reportes en Excel (y requerido por Pandas para escribir archivos Excel con formato).
+* **ReportLab**: Para la generación de reportes en formato PDF.
+
+### Pruebas
+
+La carpeta `tests` contiene pruebas de regresión del núcleo (`nucleo.py`), que no necesitan Qt. Se ejecutan con `pytest`:
+```bash
+python -m pytest tests
+```
+
+### Pruebas de Rendimiento
+
+La carpeta `benchmarks` contiene scripts para medir las partes más pesadas del programa. Por ejemplo, para comparar la lectura de archivos de Excel con la de `pd.read_excel`:
+
+```bash
+python benchmarks/lectura_excel.py --filas 10000 100000 500000
+```
+
+Para medir el programa completo a distintas escalas, `benchmarks/suite.py` genera con `benchmarks/generador.py` archivos ficticios de inscritos y becados que pasan la validación (cédulas únicas, nombres con acentos, carreras y semestres válidos) y cronometra cada etapa: lectura, validación, guardado en SQLite, preparación y poblado de la tabla, cada tecla de la búsqueda, la comparación y la exportación a Excel, CSV y PDF. Los resultados se guardan en un JSON, con el commit y los datos de la máquina, para comparar versiones:
+
+```bash
+python benchmarks/suite.py --filas 1000 10000 100000 1000000 --salida resultados.json
+```
+
+Con `--coincidencia` se elige qué fracción de los becados está inscrita y con `--discrepancia` cuántos de ellos tienen algún dato distinto. `--formato xlsx` genera los inscritos en Excel en vez de CSV, `--formatos` elige qué exportaciones medir y `--semilla` cambia los datos generados (la misma semilla genera siempre los mismos archivos). Para obtener solo los archivos, usa `python benchmarks/generador.py --filas 100000 --carpeta datos`.
+
+### Modo por Línea de Comandos
+
+Para comparar archivos sin abrir la ventana (por ejemplo, en una tarea programada), usa el subcomando `compare`:
+
+```bash
+python main.py compare --inscritos inscritos.xlsx --becados becados.csv --out reportes/
+```
+
+Importa y valida ambos archivos en una base de datos temporal (sin tocar `estudiantes.db`), los compara y escribe en la carpeta `--out` el mismo paquete que "Exportar paquete de auditoría", más un `resumen.json` con los recuentos de cada reporte. La carpeta no debe existir o debe estar vacía. Con `--sin-pdf` se omiten los PDF. Si algún archivo tiene errores de validación, se listan en la consola y el comando termina con código 1, igual que ante cualquier otro error; si todo sale bien, termina con código 0.
+
+Este modo no carga Qt, ni tampoco los procesos que arman los PDF y el libro: toda la lógica que no es de la interfaz (base de datos, importación, validación, comparación y exportación) está en `nucleo.py`, la ventana está en `interfaz.py` y `main.py` solo decide cuál de los dos usar.
+
+### Compilación a `.exe`
+
+Si has modificado el código y quieres generar un nuevo archivo ejecutable, asegúrate de tener `pyinstaller` instalado (`pip install pyinstaller`) y ejecuta el siguiente comando en la terminal desde la carpeta del proyecto:
+
+```bash
+pyinstaller --onefile --windowed --icon=icon.ico main.py
+```
+
+* `--onefile`: Empaqueta todo en un único archivo ejecutable.
+* `--windowed`: Evita que se abra una consola de comandos al ejecutar la aplicación.
+* `--icon=icon.ico`: Asigna el ícono de la aplicación.
+
+El `.exe` final se encontrará en la carpeta `dist` que se creará automáticamente.
+
+### Tiempo de Arranque
+
+Pandas y ReportLab solo se cargan la primera vez que se importa o exporta un archivo, así que no retrasan la apertura del programa. Para ver cuánto tarda cada etapa del arranque (importaciones, `inicializar_bd`, `AppGestorBecas.__init__` y el primer pintado de la ventana), ejecuta el programa con la opción `--tiempos-arranque` o con la variable de entorno `ZON_BECADOS_TIEMPOS=1`:
+
+```bash
+python main.py --tiempos-arranque
+```
+
+El informe se muestra en la consola y se agrega al archivo `tiempos_arranque.log`, junto a la base de datos. Con el `.exe`, que no tiene consola, se puede usar la misma opción desde un acceso directo o desde la terminal y consultar el archivo. Las cargas diferidas que ocurran después (por ejemplo, la de Pandas al importar el primer archivo) se agregan al mismo informe.
+
+Al cerrar, el programa guarda en la carpeta `instantanea` los inscritos tal como los usa la ventana (columnas, texto de búsqueda normalizado, índice de trigramas) y el resultado de la comparación. En el siguiente arranque esos archivos se abren mapeados en memoria, sin leer ni preparar de nuevo los inscritos, siempre que la base de datos no haya cambiado desde entonces. Para saberlo, la tabla `metadatos` guarda un identificador de la base de datos y un contador de cambios que suben los disparadores de `becados` e `inscritos_encabezados`. Si no coinciden, los inscritos se cargan desde la base de datos como antes. Al cargar una copia de la base de datos, esta recibe un identificador nuevo y la instantánea se borra, porque el contador de cambios de la copia es anterior. La carpeta se puede borrar en cualquier momento sin perder datos.
+
+### Diagnóstico de Rendimiento
+
+Las operaciones más pesadas de la ventana (`cargar_registros_a_tabla`, `_aplicar_filtros`, `ControladorBusqueda.aplicar`, `pintar_comparacion`, `actualizar_recuentos`, `poblar_tabla_*`, `exportar_datos` y `exportar_paquete`) se miden siempre con el decorador `DIAGNOSTICO.medido()` o con `DIAGNOSTICO.medir()`, y los resultados se ven en **Ayuda → Diagnóstico**. Las cargas y exportaciones se miden en la tarea en segundo plano, sin contar el tiempo de los diálogos. Para medir también el pico de memoria desde el arranque, ejecuta el programa con `ZON_BECADOS_MEMORIA=1` (activa `tracemalloc`, que hace todo más lento).
+
+Para perfilar una operación con `cProfile`, nómbrala en la variable de entorno `ZON_BECADOS_PERFIL` (varias separadas por comas). Cada llamada se guarda en un archivo `perfil_<operación>_<fecha>_<n>.prof` junto a la base de datos:
+
+```bash
+ZON_BECADOS_PERFIL=pintar_comparacion,cargar_registros_a_tabla python main.py
+python -m pstats perfil_pintar_comparacion_20250101_120000_1.prof
+```
+
+---
+
+## 📄 Licencia y Contribuciones
+
+Este proyecto es de código abierto. Siéntete libre de usarlo y modificarlo.
+
+Si deseas contribuir, reportar un error o tienes alguna sugerencia, puedes hacerlo a través de la sección de **"Issues"** del repositorio en GitHub.
+"""
+
+# --- Lógica de la Base de Datos ---
+def inicializar_bd():
+    """Inicializa la base de datos y crea las tablas si no existen."""
+    try:
+        conexion = sqlite3.connect(ARCHIVO_BD)
+        descartadas = migrar_esquema(conexion)
+        conexion.close()
+    except (sqlite3.Error, ValueError, KeyError) as e:
+        mostrar_error_critico("Error de Base de Datos", f"No se pudo inicializar la base de datos: {e}")
+        sys.exit(1)
+    avisar_cedulas_descartadas(descartadas)
+
+def avisar_cedulas_descartadas(descartadas, maximo=20):
+    """Avisa de los inscritos que migrar_esquema() descartó por tener una cédula repetida."""
+    if not descartadas:
+        return
+    lista = ", ".join(descartadas[:maximo]) + (f" y {len(descartadas) - maximo} más" if len(descartadas) > maximo else "")
+    mostrar_mensaje_advertencia("Cédulas Repetidas",
+                                f"Los inscritos guardados tenían cédulas que solo se distinguían por ceros a la izquierda. Se conservó "
+                                f"la primera fila de cada cédula. Filas descartadas ({len(descartadas)}): {lista}.\n\n"
+                                "Si necesitas revisarlas, vuelve a importar el archivo de inscritos.")
+
+# --- Modelo de Tabla Columnar ---
+class ModeloTablaColumnar(QAbstractTableModel):
+    """Modelo de solo lectura respaldado por listas de columnas. Los datos de cada celda se
+    generan bajo demanda en data(), sin crear un objeto por celda.
+
+    El modelo expone solo las filas de la vista filtrada; los métodos que reciben `fila`
+    (texto, cedula...) trabajan con el índice de la fila original, que se obtiene de
+    una fila visible con fila_fuente().
+
+    Los colores de comparación no se guardan por celda: salen de un arreglo de estados por fila y
+    de la máscara de campos distintos del motor de comparación."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._encabezados = []
+        self._columnas = []
+        self._cedulas = []
+        self._busqueda = []
+        self._indice = IndiceTrigramas()
+        self._codigos = {}
+        self._filas_por_cedula = None
+        self._vista = None
+        self._columnas_centradas = set()
+        self._estados = None
+        self._mascaras = None
+        self._bits_columna = []
+        self._pinceles = {ESTADO_VERDE: QBrush(COLOR_VERDE_PASTEL), ESTADO_AMARILLO: QBrush(COLOR_VERDE_PASTEL), ESTADO_ROJO: QBrush(COLOR_ROJO_PASTEL)}
+        self._pincel_campo_distinto = QBrush(COLOR_AMARILLO_PASTEL)
+        self.version = 0
+
+    def cargar(self, encabezados, columnas, cedulas):
+        """Reemplaza todo el contenido del modelo. `columnas` es una lista de listas de texto, una por encabezado.
+        También precalcula el texto normalizado de búsqueda y los códigos enteros de los filtros."""
+        busqueda, codigos = preparar_filas(encabezados, columnas, len(cedulas))
+        self.cargar_preparadas(encabezados, columnas, cedulas, busqueda, codigos, IndiceTrigramas(busqueda))
+
+    def cargar_preparadas(self, encabezados, columnas, cedulas, busqueda, codigos, indice):
+        """Como cargar(), con el texto de búsqueda, los códigos de los filtros y el índice ya calculados.
+        `columnas` y `cedulas` pueden ser cualquier secuencia de texto (p. ej. ColumnaTexto)."""
+        self.beginResetModel()
+        self._encabezados = list(encabezados)
+        self._columnas = columnas
+        self._cedulas = cedulas
+        self._busqueda, self._codigos = busqueda, codigos
+        self._indice = indice
+        self._filas_por_cedula = None
+        self._vista = None
+        self._columnas_centradas = {i for i, enc in enumerate(self._encabezados) if enc in COLUMNAS_CENTRADAS}
+        self._bits_columna = [BITS_CAMPOS_COMPARACION.get(enc, 0) for enc in self._encabezados]
+        self._estados = self._mascaras = None
+        self.version += 1
+        self.endResetModel()
+
+    def limpiar(self):
+        self.cargar([], [], [])
+
+    def datos_preparados(self):
+        """(columnas, cédulas, texto de búsqueda, códigos, índice), en el orden de cargar_preparadas()."""
+        return self._columnas, self._cedulas, self._busqueda, self._codigos, self._indice
+
+    def iniciar_carga(self, encabezados):
+        """Vacía el modelo para recibir las filas por lotes con agregar_lote(). Hasta que llegue el
+        índice con establecer_indice(), la búsqueda recorre todas las filas."""
+        self.cargar(encabezados, [[] for _ in encabezados], [])
+        self._indice = None
+
+    def agregar_lote(self, columnas, cedulas, busqueda, codigos):
+        """Agrega al final un lote de filas ya preparadas con preparar_filas()."""
+        if not cedulas:
+            return
+        inicio = len(self._cedulas)
+        # Con un filtro activo las filas nuevas no son visibles hasta que se vuelva a filtrar.
+        if self._vista is None:
+            self.beginInsertRows(QModelIndex(), inicio, inicio + len(cedulas) - 1)
+        for columna, valores in zip(self._columnas, columnas):
+            columna.extend(valores)
+        self._cedulas.extend(cedulas)
+        self._busqueda.extend(busqueda)
+        if self._filas_por_cedula is not None:
+            for fila, cedula in enumerate(cedulas, inicio):
+                self._filas_por_cedula.setdefault(str(cedula), fila)
+        for enc in self._codigos:
+            self._codigos[enc] = np.concatenate((self._codigos[enc], codigos[enc]))
+        self.version += 1
+        if self._vista is None:
+            self.endInsertRows()
+
+    def establecer_indice(self, indice):
+        self._indice = indice
+        self.version += 1
+
+    def _codificar_fila(self, fila):
+        for enc, codigos in COLUMNAS_CODIFICADAS.items():
+            col = self.indice_columna(enc)
+            self._codigos[enc][fila] = codigos.get(texto_para_codigo(enc, self._columnas[col][fila]), -1) if col != -1 else -1
+
+    def _cambio_de_filas(self):
+        if self._indice.requiere_reconstruccion():
+            self._indice.construir(self._busqueda)
+        self.version += 1
+
+    def agregar_fila(self, valores, cedula):
+        """Agrega una fila al final. `valores` son los textos en el orden de los encabezados. Con un filtro
+        activo la fila no es visible hasta que se vuelva a filtrar; mientras no llegan los colores de la
+        comparación, se pinta como no encontrada."""
+        fila = len(self._cedulas)
+        if self._vista is None:
+            self.beginInsertRows(QModelIndex(), fila, fila)
+        for col, valor in enumerate(valores):
+            self._columnas[col].append(valor)
+        self._cedulas.append(cedula)
+        if self._filas_por_cedula is not None:
+            self._filas_por_cedula.setdefault(str(cedula), len(self._cedulas) - 1)
+        self._busqueda.append(normalizar_texto(" ".join(valores)))
+        self._indice.agregar(self._busqueda[-1])
+        for enc in self._codigos:
+            self._codigos[enc] = np.append(self._codigos[enc], np.int8(-1))
+        self._codificar_fila(fila)
+        if self._estados is not None:
+            self._estados = np.append(self._estados, np.int8(ESTADO_ROJO))
+            self._mascaras = np.append(self._mascaras, np.uint8(0))
+        self._cambio_de_filas()
+        if self._vista is None:
+            self.endInsertRows()
+
+    def actualizar_fila(self, fila, valores, cedula):
+        """Reemplaza los valores de una fila. Como no cambia el número de filas, conserva la vista y
+        los colores y solo avisa del cambio de esa fila."""
+        for col, valor in enumerate(valores):
+            self._columnas[col][fila] = valor
+        if self._filas_por_cedula is not None:
+            if self._filas_por_cedula.get(str(self._cedulas[fila])) == fila:
+                del self._filas_por_cedula[str(self._cedulas[fila])]
+            self._filas_por_cedula.setdefault(str(cedula), fila)
+        self._cedulas[fila] = cedula
+        self._busqueda[fila] = normalizar_texto(" ".join(valores))
+        self._indice.actualizar(fila, self._busqueda[fila])
+        if self._indice.requiere_reconstruccion():
+            self._indice.construir(self._busqueda)
+        self._codificar_fila(fila)
+        self.version += 1
+        for fila_vista in ([fila] if self._vista is None else np.flatnonzero(self._vista == fila).tolist()):
+            self.dataChanged.emit(self.index(fila_vista, 0), self.index(fila_vista, len(self._encabezados) - 1))
+
+    def eliminar_fila(self, fila):
+        """Quita una fila; si estaba visible, solo se avisa de esa fila en vez de reiniciar el modelo."""
+        fila_vista = self.fila_en_vista(fila)
+        if fila_vista is not None:
+            self.beginRemoveRows(QModelIndex(), fila_vista, fila_vista)
+        if self._vista is not None:
+            vista = self._vista[self._vista != fila]
+            self._vista = vista - (vista > fila)
+        for columna in self._columnas:
+            del columna[fila]
+        if self._filas_por_cedula is not None:
+            self._filas_por_cedula = {c: f - (f > fila) for c, f in self._filas_por_cedula.items() if f != fila}
+        del self._cedulas[fila]
+        del self._busqueda[fila]
+        self._indice.eliminar(fila)
+        for enc in self._codigos:
+            self._codigos[enc] = np.delete(self._codigos[enc], fila)
+        if self._estados is not None:
+            self._estados, self._mascaras = np.delete(self._estados, fila), np.delete(self._mascaras, fila)
+        self._cambio_de_filas()
+        if fila_vista is not None:
+            self.endRemoveRows()
+
+    def total_filas(self):
+        return len(self._cedulas)
+
+    def fila_fuente(self, fila_vista):
+        return fila_vista if self._vista is None else int(self._vista[fila_vista])
+
+    def filas_visibles(self):
+        return range(len(self._cedulas)) if self._vista is None else self._vista
+
+    def fila_de_cedula(self, cedula):
+        """Fila original con esa cédula (comparada como texto), o None. El índice cédula → fila se arma la
+        primera vez que se pide después de cargar y luego se mantiene al agregar, editar y eliminar filas."""
+        if self._filas_por_cedula is None:
+            self._filas_por_cedula = {}
+            for fila, c in enumerate(self._cedulas):
+                self._filas_por_cedula.setdefault(str(c), fila)
+        return self._filas_por_cedula.get(str(cedula))
+
+    def fila_en_vista(self, fila):
+        """Fila visible que muestra la fila original `fila`, o None si el filtro la oculta."""
+        if self._vista is None:
+            return fila if 0 <= fila < len(self._cedulas) else None
+        posiciones = np.flatnonzero(self._vista == fila)
+        return int(posiciones[0]) if len(posiciones) else None
+
+    def filtrar(self, palabras, codigos, seleccion=None, candidatos=None):
+        """Calcula las filas que contienen todas las `palabras` (ya normalizadas), cuyos códigos
+        coinciden con `codigos` ({encabezado: código}) y que están marcadas en la máscara booleana
+        `seleccion` si se indica. Si se pasan `candidatos`, solo se revisan esas filas. Devuelve la
+        lista de filas originales que pasan el filtro."""
+        mascara = seleccion
+        for enc, codigo in codigos.items():
+            coincide = self._codigos[enc] == codigo
+            mascara = coincide if mascara is None else mascara & coincide
+        if candidatos is None:
+            indexados = self._indice.candidatos(palabras) if palabras and self._indice is not None else None
+            if indexados is not None:
+                candidatos = (indexados if mascara is None else indexados[mascara[indexados]]).tolist()
+            else:
+                candidatos = range(len(self._cedulas)) if mascara is None else np.flatnonzero(mascara).tolist()
+        elif mascara is not None:
+            candidatos = [i for i in candidatos if mascara[i]]
+        textos = self._busqueda
+        for palabra in palabras:
+            candidatos = [i for i in candidatos if palabra in textos[i]]
+        return candidatos
+
+    def establecer_vista(self, filas):
+        """Muestra solo las `filas` indicadas (None para mostrarlas todas). Si la vista no cambia, no avisa nada."""
+        vista = None if filas is None or len(filas) == len(self._cedulas) else np.asarray(filas, dtype=np.int64)
+        if vista is None and self._vista is None or vista is not None and self._vista is not None and np.array_equal(vista, self._vista):
+            return
+        self.beginResetModel()
+        self._vista = vista
+        self.endResetModel()
+
+    def actualizar_vista(self, filas, visibles):
+        """Agrega a la vista o quita de ella solo las filas originales `filas`, según estén o no en `visibles`,
+        con una inserción o eliminación por fila en vez de reiniciar el modelo. La vista sigue ordenada."""
+        visibles = set(visibles)
+        for fila in sorted(set(filas)):
+            fila_vista = self.fila_en_vista(fila)
+            if fila in visibles and fila_vista is None:
+                destino = int(np.searchsorted(self._vista, fila))
+                self.beginInsertRows(QModelIndex(), destino, destino)
+                self._vista = np.insert(self._vista, destino, fila)
+                self.endInsertRows()
+            elif fila not in visibles and fila_vista is not None:
+                self.beginRemoveRows(QModelIndex(), fila_vista, fila_vista)
+                vista = np.arange(len(self._cedulas), dtype=np.int64) if self._vista is None else self._vista
+                self._vista = np.delete(vista, fila_vista)
+                self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._cedulas) if self._vista is None else len(self._vista)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._encabezados)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        fila, col = self.fila_fuente(index.row()), index.column()
+        if role == Qt.DisplayRole:
+            return self._columnas[col][fila]
+        if role == Qt.UserRole:
+            return self._cedulas[fila]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter) if col in self._columnas_centradas else None
+        if role == Qt.BackgroundRole and self._estados is not None:
+            if self._mascaras[fila] & self._bits_columna[col]:
+                return self._pincel_campo_distinto
+            return self._pinceles.get(int(self._estados[fila]))
+        return None
+
+    def headerData(self, seccion, orientacion, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientacion == Qt.Horizontal and seccion < len(self._encabezados):
+            return self._encabezados[seccion]
+        return super().headerData(seccion, orientacion, role)
+
+    def encabezados(self):
+        return self._encabezados
+
+    def indice_columna(self, encabezado):
+        """Devuelve el índice de la columna con ese encabezado, o -1 si no existe."""
+        return self._encabezados.index(encabezado) if encabezado in self._encabezados else -1
+
+    def texto(self, fila, col):
+        return self._columnas[col][fila]
+
+    def cedula(self, fila):
+        return self._cedulas[fila]
+
+    def fila_como_dict(self, fila):
+        return {enc: self._columnas[col][fila] for col, enc in enumerate(self._encabezados)}
+
+    def estado(self, fila):
+        return None if self._estados is None else int(self._estados[fila])
+
+    def establecer_estados(self, estados, mascaras, filas=None):
+        """Activa los colores de comparación con los arreglos del motor (None para quitarlos). Solo
+        reemplaza referencias y pide un repintado: de todo el modelo, o solo de las filas originales
+        `filas` si se indican (las únicas cuyo color cambió)."""
+        self._estados, self._mascaras = estados, mascaras
+        if filas is None:
+            self.notificar_fondos()
+            return
+        for fila in filas:
+            fila_vista = self.fila_en_vista(int(fila))
+            if fila_vista is not None:
+                self.dataChanged.emit(self.index(fila_vista, 0), self.index(fila_vista, len(self._encabezados) - 1), [Qt.BackgroundRole])
+
+    def notificar_fondos(self):
+        """Avisa a las vistas que los colores de fondo cambiaron, con una sola señal para todo el modelo."""
+        filas = self.rowCount()
+        if filas and self._encabezados:
+            self.dataChanged.emit(self.index(0, 0), self.index(filas - 1, len(self._encabezados) - 1), [Qt.BackgroundRole])
+
+def ajustar_columnas_muestreadas(tabla, muestra=MUESTRA_ANCHO_COLUMNAS):
+    """Ajusta el ancho de las columnas midiendo solo una muestra de filas en lugar de usar
+    ResizeToContents, que recorre todas las filas en cada cálculo de diseño."""
+    modelo = tabla.model()
+    encabezado = tabla.horizontalHeader()
+    total_filas = modelo.total_filas()
+    if total_filas == 0:
+        encabezado.setSectionResizeMode(QHeaderView.Stretch)
+        return
+    filas = filas_de_muestra(total_filas, muestra)
+    metricas = tabla.fontMetrics()
+    metricas_encabezado = encabezado.fontMetrics()
+    margen = 16
+    encabezado.setSectionResizeMode(QHeaderView.Interactive)
+    for col, enc in enumerate(modelo.encabezados()):
+        if enc in COLUMNAS_ESTIRADAS:
+            encabezado.setSectionResizeMode(col, QHeaderView.Stretch)
+            continue
+        ancho = metricas_encabezado.horizontalAdvance(enc)
+        for fila in filas:
+            ancho = max(ancho, metricas.horizontalAdvance(modelo.texto(fila, col)))
+        encabezado.resizeSection(col, ancho + margen)
+
+# --- Búsqueda ---
+class CacheLRU:
+    """Caché de tamaño fijo que descarta primero las entradas usadas hace más tiempo."""
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+
+    def obtener(self, clave):
+        if clave not in self._entradas:
+            return None
+        self._entradas.move_to_end(clave)
+        return self._entradas[clave]
+
+    def guardar(self, clave, valor):
+        self._entradas[clave] = valor
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+
+    def limpiar(self):
+        self._entradas.clear()
+
+class ControladorBusqueda(QObject):
+    """Aplica los filtros de una tabla. La escritura en la barra de búsqueda se agrupa con un
+    temporizador; si la consulta nueva extiende la anterior (mismos filtros, más texto) solo se
+    revisan las filas que ya coincidían, y los resultados se guardan en una caché LRU compartida."""
+    filtrado = Signal()
+
+    def __init__(self, tipo_tabla, modelo, obtener_filtros, cache, parent=None):
+        super().__init__(parent)
+        self.tipo_tabla = tipo_tabla
+        self.modelo = modelo
+        self._obtener_filtros = obtener_filtros
+        self._cache = cache
+        self._ultima_base = None
+        self._ultima_consulta = None
+        self._ultimo_resultado = None
+        self._temporizador = QTimer(self)
+        self._temporizador.setSingleShot(True)
+        self._temporizador.setInterval(RETARDO_BUSQUEDA_MS)
+        self._temporizador.timeout.connect(self.aplicar)
+
+    def programar(self):
+        """Reinicia el temporizador; el filtro se aplica cuando el usuario deja de escribir."""
+        self._temporizador.start()
+
+    @DIAGNOSTICO.medido('ControladorBusqueda.aplicar', filas=lambda self: self.modelo.total_filas())
+    def aplicar(self):
+        self._temporizador.stop()
+        palabras, codigos, clave_color, seleccion = self._obtener_filtros(self.tipo_tabla)
+        consulta = " ".join(palabras)
+        base = (self.tipo_tabla, self.modelo.version, tuple(sorted(codigos.items())), clave_color)
+        resultado = self._cache.obtener(base + (consulta,))
+        if resultado is None:
+            if base == self._ultima_base and consulta.startswith(self._ultima_consulta):
+                filas = self.modelo.filtrar(palabras, {}, candidatos=self._ultimo_resultado.tolist())
+            else:
+                filas = self.modelo.filtrar(palabras, codigos, seleccion)
+            resultado = np.asarray(filas, dtype=np.int32)
+            self._cache.guardar(base + (consulta,), resultado)
+        self._ultima_base, self._ultima_consulta, self._ultimo_resultado = base, consulta, resultado
+        self.modelo.establecer_vista(resultado)
+        self.filtrado.emit()
+
+    def actualizar_filas(self, filas):
+        """Tras un cambio de color de las filas originales `filas`, revisa solo esas filas contra los filtros
+        activos y las agrega o quita de la vista, sin volver a filtrar toda la tabla. Sin filtro de color
+        no hace nada, porque el color no decide qué filas se ven."""
+        palabras, codigos, clave_color, seleccion = self._obtener_filtros(self.tipo_tabla)
+        if clave_color is None or len(filas) == 0:
+            return
+        self._temporizador.stop()
+        visibles = self.modelo.filtrar(palabras, codigos, seleccion, candidatos=filas.tolist())
+        self.modelo.actualizar_vista(filas.tolist(), visibles)
+        self._ultima_base = (self.tipo_tabla, self.modelo.version, tuple(sorted(codigos.items())), clave_color)
+        self._ultima_consulta = " ".join(palabras)
+        self._ultimo_resultado = np.asarray(self.modelo.filas_visibles(), dtype=np.int32)
+        self.filtrado.emit()
+
+# --- Tareas en Segundo Plano ---
+class SenalesTarea(QObject):
+    progreso = Signal(int, str)
+    lote = Signal(object)
+    terminada = Signal(object)
+    fallida = Signal(object)
+    cancelada = Signal()
+
+class TareaSegundoPlano(QRunnable):
+    """Ejecuta `funcion(tarea)` en el QThreadPool global. La función informa su avance con reportar() y
+    llama a verificar_cancelacion() entre pasos; el resultado, el error o la cancelación llegan al hilo
+    de la interfaz por las señales de `senales`."""
+
+    def __init__(self, funcion):
+        super().__init__()
+        self.setAutoDelete(False)
+        self._funcion = funcion
+        self._cancelar = threading.Event()
+        self._etapa = ""
+        self.senales = SenalesTarea()
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def verificar_cancelacion(self):
+        if self._cancelar.is_set():
+            raise TareaCancelada()
+
+    def reportar(self, porcentaje, etapa=None):
+        if etapa is not None:
+            self._etapa = etapa
+        self.senales.progreso.emit(int(porcentaje), self._etapa)
+
+    def entregar(self, lote):
+        """Envía un resultado parcial al hilo de la interfaz."""
+        self.senales.lote.emit(lote)
+
+    def run(self):
+        try:
+            resultado = self._funcion(self)
+        except TareaCancelada:
+            self.senales.cancelada.emit()
+        except Exception as e:
+            self.senales.fallida.emit(e)
+        else:
+            self.senales.terminada.emit(resultado)
+
+# --- Diálogo para Ver Información del Estudiante ---
+class DialogoVerEstudiante(QDialog):
+    """Diálogo para mostrar la información completa de un estudiante y permitir acciones."""
+    agregar_a_becados = Signal()
+    quitar_de_becados = Signal()
+    editar_becado = Signal()
+
+    def __init__(self, parent=None, datos_estudiante=None, tipo_tabla=None, ya_es_becado=False):
+        super().__init__(parent)
+        self.setWindowTitle("Información del Estudiante")
+        self.setMinimumWidth(250)
+        main_layout = QVBoxLayout(self)
+        form_layout = QFormLayout()
+        mapa_etiquetas = {
+            'T. Cédula': 'T. Cédula:', 'Cédula': 'Cédula:',
+            'Nombres': 'Nombres:', 'Apellidos': 'Apellidos:',
+            'Carrera': 'Carrera:', 'Semestre': 'Semestre:'
+        }
+        campos_conocidos = list(mapa_etiquetas.keys())
+        campos_disponibles = list(datos_estudiante.keys())
+        for campo in campos_conocidos:
+            if campo in datos_estudiante:
+                form_layout.addRow(QLabel(f"<b>{mapa_etiquetas[campo]}</b>"), QLabel(str(datos_estudiante[campo])))
+        for campo in campos_disponibles:
+            if campo not in campos_conocidos:
+                form_layout.addRow(QLabel(f"<b>{campo}:</b>"), QLabel(str(datos_estudiante[campo])))
+        main_layout.addLayout(form_layout)
+        main_layout.addStretch(1)
+        boton_accion_superior = None
+        if tipo_tabla == 'inscritos':
+            boton_accion_superior = QPushButton("Agregar a Becados")
+            if ya_es_becado:
+                boton_accion_superior.setText("Ya es Becado")
+                boton_accion_superior.setEnabled(False)
+                boton_accion_superior.setToolTip("Este estudiante ya se encuentra en la lista de becados.")
+            else:
+                boton_accion_superior.clicked.connect(self.agregar_a_becados.emit)
+        elif tipo_tabla == 'becados':
+            boton_accion_superior = QPushButton("Quitar de Becados")
+            boton_accion_superior.clicked.connect(self.quitar_de_becados.emit)
+        if boton_accion_superior:
+            main_layout.addWidget(boton_accion_superior)
+        layout_botones_inferior = QHBoxLayout()
+        if tipo_tabla == 'becados':
+            boton_editar = QPushButton("Editar")
+            boton_editar.clicked.connect(self.editar_becado.emit)
+            layout_botones_inferior.addWidget(boton_editar)
+        boton_ok = QPushButton("OK")
+        boton_ok.clicked.connect(self.accept)
+        layout_botones_inferior.addWidget(boton_ok)
+        main_layout.addLayout(layout_botones_inferior)
+
+# --- Diálogo para Agregar/Editar Estudiante ---
+class DialogoEstudiante(QDialog):
+    """Diálogo para crear o editar la información de un estudiante."""
+    datos_estudiante_listos = Signal(dict)
+    def __init__(self, parent=None, datos_estudiante=None):
+        super().__init__(parent)
+        self.es_modo_edicion = datos_estudiante is not None
+        titulo = "Editar Estudiante Becado" if self.es_modo_edicion else "Agregar Estudiante Becado"
+        self.setWindowTitle(titulo)
+        self.diseno_formulario = QFormLayout()
+        self.cedula_input = QLineEdit()
+        self.tipo_cedula_combo = QComboBox()
+        self.tipo_cedula_combo.addItems(['V', 'E', 'P'])
+        self.nombres_input = QLineEdit()
+        self.apellidos_input = QLineEdit()
+        self.carrera_combo = QComboBox()
+        self.carrera_combo.addItems(CARRERAS)
+        self.semestre_combo = QComboBox()
+        self.semestre_combo.addItems(SEMESTRES.keys())
+        self.etiqueta_estado = QLabel("")
+        self.etiqueta_estado.setStyleSheet("color: green")
+        self.diseno_formulario.addRow("T. Cédula:", self.tipo_cedula_combo)
+        self.diseno_formulario.addRow("Cédula:", self.cedula_input)
+        self.diseno_formulario.addRow("Nombres:", self.nombres_input)
+        self.diseno_formulario.addRow("Apellidos:", self.apellidos_input)
+        self.diseno_formulario.addRow("Carrera:", self.carrera_combo)
+        self.diseno_formulario.addRow("Semestre:", self.semestre_combo)
+        self.boton_guardar = QPushButton("Guardar")
+        self.boton_cancelar = QPushButton("Cancelar")
+        diseno_botones = QHBoxLayout()
+        diseno_botones.addStretch(1)
+        diseno_botones.addWidget(self.boton_guardar)
+        diseno_botones.addWidget(self.boton_cancelar)
+        diseno_botones.addStretch(1)
+        self.boton_guardar.clicked.connect(self._accion_guardar)
+        self.boton_cancelar.clicked.connect(self.reject)
+        diseno_principal = QVBoxLayout(self)
+        diseno_principal.addLayout(self.diseno_formulario)
+        diseno_principal.addWidget(self.etiqueta_estado)
+        diseno_principal.addLayout(diseno_botones)
+        if self.es_modo_edicion: self.llenar_datos(datos_estudiante)
+
+    def _accion_guardar(self):
+        self.etiqueta_estado.clear()
+        datos = self.obtener_datos()
+        if datos:
+            self.datos_estudiante_listos.emit(datos)
+
+    def registrar_exito_y_limpiar(self, datos):
+        """Muestra el mensaje de éxito y limpia el formulario."""
+        self.etiqueta_estado.setText(f"¡Estudiante con CI {datos['tipo_cedula']}-{datos['cedula']} guardado!")
+        self._limpiar_formulario()
+
+    def _limpiar_formulario(self):
+        self.cedula_input.clear()
+        self.nombres_input.clear()
+        self.apellidos_input.clear()
+        self.tipo_cedula_combo.setCurrentIndex(0)
+        self.carrera_combo.setCurrentIndex(0)
+        self.semestre_combo.setCurrentIndex(0)
+        self.tipo_cedula_combo.setFocus()
+
+    def llenar_datos(self, datos):
+        self.tipo_cedula_combo.setCurrentText(datos['tipo_cedula'])
+        self.cedula_input.setText(str(datos['cedula']))
+        self.nombres_input.setText(datos['nombres'])
+        self.apellidos_input.setText(datos['apellidos'])
+        self.carrera_combo.setCurrentText(datos['carrera'])
+        self.semestre_combo.setCurrentText(next((k for k, v in SEMESTRES.items() if v == datos['semestre']), "CINU"))
+
+    def obtener_datos(self):
+        cedula_texto = self.cedula_input.text().strip()
+        if not cedula_texto.isdigit() or not (6 <= len(cedula_texto) <= 9):
+            mostrar_mensaje_advertencia("Dato Inválido", "La cédula debe contener solo números y tener entre 6 y 9 dígitos.")
+            return None
+        nombre = ' '.join(self.nombres_input.text().strip().split()).title()
+        apellido = ' '.join(self.apellidos_input.text().strip().split()).title()
+        regex_nombre_valido = re.compile(r"^[A-Za-zÀ-ÿ\s]+$")
+        if not (3 <= len(nombre) <= 30 and regex_nombre_valido.match(nombre)):
+            mostrar_mensaje_advertencia("Dato Inválido", "El nombre debe tener entre 3 y 30 caracteres, contener solo letras y espacios simples.")
+            return None
+        if not (3 <= len(apellido) <= 30 and regex_nombre_valido.match(apellido)):
+            mostrar_mensaje_advertencia("Dato Inválido", "El apellido debe tener entre 3 y 30 caracteres, contener solo letras y espacios simples.")
+            return None
+        return {'tipo_cedula': self.tipo_cedula_combo.currentText(), 'cedula': int(cedula_texto),
+                'nombres': nombre, 'apellidos': apellido, 'carrera': self.carrera_combo.currentText(),
+                'semestre': SEMESTRES[self.semestre_combo.currentText()]}
+
+# --- Diálogo de Errores de Validación ---
+class DialogoErroresValidacion(QDialog):
+    """Muestra todos los errores encontrados al validar un archivo y permite exportarlos a CSV."""
+
+    def __init__(self, parent, errores):
+        super().__init__(parent)
+        self.errores = errores
+        self.setWindowTitle("Datos Inválidos")
+        self.resize(760, 420)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Se encontraron <b>{len(errores)}</b> errores en <b>{errores['Fila'].nunique()}</b> filas del archivo. "
+                                "Corrígelos y vuelve a cargarlo."))
+        tabla = QTableView()
+        tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        tabla.verticalHeader().setVisible(False)
+        modelo = ModeloTablaColumnar(tabla)
+        modelo.cargar(COLUMNAS_ERRORES_VALIDACION, [errores[c].astype(str).tolist() for c in COLUMNAS_ERRORES_VALIDACION], errores["Fila"].tolist())
+        tabla.setModel(modelo)
+        ajustar_columnas_muestreadas(tabla)
+        tabla.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(tabla)
+        botones = QDialogButtonBox(QDialogButtonBox.Close)
+        boton_exportar = botones.addButton("Exportar CSV", QDialogButtonBox.ActionRole)
+        boton_exportar.clicked.connect(self.exportar)
+        botones.rejected.connect(self.reject)
+        layout.addWidget(botones)
+
+    def exportar(self):
+        ruta_guardado, _ = QFileDialog.getSaveFileName(self, "Exportar Errores", "errores_validacion.csv", "Archivos CSV (*.csv)")
+        if not ruta_guardado:
+            return
+        try:
+            self.errores.to_csv(ruta_guardado, index=False, encoding='utf-8-sig')
+            mostrar_mensaje_info("Éxito", f"Errores exportados a:\n{ruta_guardado}")
+        except OSError as e:
+            mostrar_error_critico("Error al Exportar", f"No se pudo guardar el archivo: {e}")
+
+# --- Diálogo de Diagnóstico ---
+class DialogoDiagnostico(QDialog):
+    """Muestra lo que midió DIAGNOSTICO en esta sesión y permite activar la medición de memoria."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setWindowTitle("Diagnóstico de Rendimiento")
+        self.resize(820, 380)
+        layout = QVBoxLayout(self)
+        perfiles = ", ".join(sorted(DIAGNOSTICO.perfilar)) or "ninguna (variable de entorno ZON_BECADOS_PERFIL)"
+        texto = f"Operaciones perfiladas con cProfile: {perfiles}."
+        if DIAGNOSTICO.ultimo_perfil:
+            texto += f"<br>Último perfil guardado: {DIAGNOSTICO.ultimo_perfil}"
+        layout.addWidget(QLabel(texto))
+        self.check_memoria = QCheckBox("Medir el pico de memoria con tracemalloc (hace más lentas las operaciones)")
+        self.check_memoria.setChecked(tracemalloc.is_tracing())
+        self.check_memoria.toggled.connect(lambda activo: tracemalloc.start() if activo else tracemalloc.stop())
+        layout.addWidget(self.check_memoria)
+        self.tabla = QTableView()
+        self.tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla.verticalHeader().setVisible(False)
+        self.modelo = ModeloTablaColumnar(self.tabla)
+        self.tabla.setModel(self.modelo)
+        layout.addWidget(self.tabla)
+        botones = QDialogButtonBox(QDialogButtonBox.Close)
+        botones.addButton("Actualizar", QDialogButtonBox.ActionRole).clicked.connect(self.actualizar)
+        botones.addButton("Reiniciar", QDialogButtonBox.ActionRole).clicked.connect(self.reiniciar)
+        botones.addButton("Copiar", QDialogButtonBox.ActionRole).clicked.connect(self.copiar)
+        botones.rejected.connect(self.reject)
+        layout.addWidget(botones)
+        self.actualizar()
+
+    def actualizar(self):
+        filas = DIAGNOSTICO.filas_informe()
+        self.modelo.cargar(ENCABEZADOS_DIAGNOSTICO, [list(columna) for columna in zip(*filas)] or [[] for _ in ENCABEZADOS_DIAGNOSTICO],
+                           [fila[0] for fila in filas])
+        ajustar_columnas_muestreadas(self.tabla)
+
+    def reiniciar(self):
+        DIAGNOSTICO.reiniciar()
+        self.actualizar()
+
+    def copiar(self):
+        """Copia la tabla como texto separado por tabulaciones, para pegarla en un reporte o una hoja de cálculo."""
+        filas = [ENCABEZADOS_DIAGNOSTICO] + DIAGNOSTICO.filas_informe()
+        QApplication.clipboard().setText("\n".join("\t".join(fila) for fila in filas))
+
+def _filas_en_tablas(ventana):
+    return ventana.modelo_becados.total_filas() + ventana.modelo_inscritos.total_filas()
+
+# --- Ventana Principal ---
+class AppGestorBecas(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Gestor de Estudiantes y Becas")
+        screen = QApplication.primaryScreen()
+        if screen:
+            available_geometry = screen.availableGeometry()
+            width = int(available_geometry.width() * 0.85)
+            height = int(available_geometry.height() * 0.85)
+            self.resize(width, height)
+            self.move(available_geometry.center() - self.rect().center())
+        else:
+            self.resize(1200, 700)
+        self.setMinimumSize(1024, 600)
+        if os.path.exists('icon.ico'):
+            self.setWindowIcon(QIcon('icon.ico'))
+        self.boton_agregar_becado = None
+        self.modo_comparacion = False
+        self.boton_comparar = None
+        self.conexion_bd = sqlite3.connect(ARCHIVO_BD)
+        self.conexion_bd.row_factory = sqlite3.Row
+        self.todos_los_becados = []
+        self.todos_los_inscritos = []
+        self.encabezados_inscritos = []
+        self.motor_comparacion = MotorComparacion()
+        self._tareas = set()
+        self.cache_importaciones = CacheImportaciones(DIRECTORIO_CACHE_IMPORTACION)
+        self.instantanea = InstantaneaSesion(DIRECTORIO_INSTANTANEA)
+        self.version_becados = 0
+        self.version_inscritos = 0
+        self._crear_barra_menu()
+        self._configurar_ui()
+        self.cargar_estudiantes_becados()
+        if not self.cargar_instantanea():
+            self.cargar_estudiantes_inscritos_desde_bd()
+
+    def _crear_barra_menu(self):
+        menu_bar = self.menuBar()
+        menu_db = menu_bar.addMenu("Base de Datos")
+        accion_guardar = QAction("Guardar", self)
+        accion_guardar.triggered.connect(self.guardar_bd)
+        menu_db.addAction(accion_guardar)
+        accion_cargar = QAction("Cargar", self)
+        accion_cargar.triggered.connect(self.cargar_bd)
+        menu_db.addAction(accion_cargar)
+        menu_db.addSeparator()
+        accion_limpiar = QAction("Limpiar", self)
+        accion_limpiar.triggered.connect(self.limpiar_bd)
+        menu_db.addAction(accion_limpiar)
+        menu_reportes = menu_bar.addMenu("Reportes")
+        accion_paquete = QAction("Exportar paquete de auditoría", self)
+        accion_paquete.triggered.connect(self.exportar_paquete)
+        menu_reportes.addAction(accion_paquete)
+        menu_ayuda = menu_bar.addMenu("Ayuda")
+        accion_acerca_de = QAction("Acerca de", self)
+        accion_acerca_de.triggered.connect(self.mostrar_acerca_de)
+        menu_ayuda.addAction(accion_acerca_de)
+        accion_github = QAction("GitHub", self)
+        accion_github.triggered.connect(self.abrir_github)
+        menu_ayuda.addAction(accion_github)
+        accion_diagnostico = QAction("Diagnóstico", self)
+        accion_diagnostico.triggered.connect(lambda: DialogoDiagnostico(self).exec())
+        menu_ayuda.addAction(accion_diagnostico)
+
+    def _ejecutar_tarea(self, titulo, funcion, al_terminar, error, al_recibir_lote=None, al_interrumpir=None):
+        """Ejecuta `funcion(tarea)` en segundo plano con un diálogo de progreso modal que permite cancelarla.
+        En el hilo de la interfaz se llama a `al_terminar(resultado)` si la tarea termina bien, a
+        `al_recibir_lote(lote)` por cada resultado parcial y a `al_interrumpir()` si se cancela o falla.
+        `error` es el (título, mensaje) del aviso para errores inesperados."""
+        tarea = TareaSegundoPlano(funcion)
+        dialogo = QProgressDialog(titulo, "Cancelar", 0, 100, self)
+        dialogo.setWindowTitle(titulo)
+        dialogo.setWindowModality(Qt.WindowModal)
+        dialogo.setMinimumDuration(0)
+        dialogo.setAutoClose(False); dialogo.setAutoReset(False)
+        dialogo.canceled.connect(tarea.cancelar)
+        dialogo.canceled.connect(lambda: dialogo.setLabelText("Cancelando..."))
+
+        def mostrar_progreso(porcentaje, etapa):
+            if not dialogo.wasCanceled():
+                dialogo.setValue(porcentaje); dialogo.setLabelText(etapa)
+
+        def finalizar(al_cerrar, *args):
+            self._tareas.discard(tarea)
+            dialogo.close()
+            al_cerrar(*args)
+
+        def avisar_fallo(excepcion):
+            if al_interrumpir:
+                al_interrumpir()
+            if isinstance(excepcion, ErrorValidacion):
+                DialogoErroresValidacion(self, excepcion.errores).exec()
+            elif isinstance(excepcion, (ErrorImportacion, ErrorCedulaRepetida, ErrorExportacion)):
+                mostrar_mensaje_advertencia(excepcion.titulo, str(excepcion))
+            else:
+                mostrar_error_critico(error[0], f"{error[1]}: {excepcion}")
+
+        def avisar_cancelacion():
+            if al_interrumpir:
+                al_interrumpir()
+            mostrar_mensaje_info("Cancelado", "La operación fue cancelada. No se hicieron cambios.")
+
+        tarea.senales.progreso.connect(mostrar_progreso)
+        if al_recibir_lote:
+            tarea.senales.lote.connect(al_recibir_lote)
+        tarea.senales.terminada.connect(lambda resultado: finalizar(al_terminar, resultado))
+        tarea.senales.fallida.connect(lambda excepcion: finalizar(avisar_fallo, excepcion))
+        tarea.senales.cancelada.connect(lambda: finalizar(avisar_cancelacion))
+        self._tareas.add(tarea)
+        dialogo.show()
+        QThreadPool.globalInstance().start(tarea)
+        return tarea
+
+    def guardar_bd(self):
+        ruta_guardado, filtro = QFileDialog.getSaveFileName(self, "Guardar Base de Datos", "copia_estudiantes.db",
+                                                            f"{FILTRO_RESPALDO};;{FILTRO_RESPALDO_COMPRIMIDO}")
+        if not ruta_guardado:
+            return
+        if filtro == FILTRO_RESPALDO_COMPRIMIDO and not ruta_guardado.endswith(".gz"):
+            ruta_guardado += ".gz" if ruta_guardado.endswith(".db") else ".db.gz"
+        self._ejecutar_tarea("Guardando Base de Datos", lambda tarea: respaldar_bd(ARCHIVO_BD, ruta_guardado, tarea),
+                             lambda _: mostrar_mensaje_info("Éxito", f"Base de datos guardada en:\n{ruta_guardado}"),
+                             ("Error al Guardar", "No se pudo guardar la base de datos"))
+
+    def cargar_bd(self):
+        ruta_archivo, _ = QFileDialog.getOpenFileName(self, "Cargar Base de Datos", "", "Archivos de Base de Datos (*.db *.db.gz)")
+        if not ruta_archivo:
+            return
+        if not ruta_archivo.endswith(".gz"):
+            # Las copias comprimidas se verifican en segundo plano, después de descomprimirlas.
+            try:
+                verificar_respaldo(ruta_archivo)
+            except Exception as e:
+                mostrar_error_critico("Archivo Inválido", f"El archivo seleccionado no es una base de datos válida para esta aplicación.\n\nError: {e}")
+                return
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Warning)
+        msg_box.setWindowTitle("Confirmar Carga")
+        msg_box.setText("Cargar una nueva base de datos reemplazará todos los datos actuales de forma permanente.\n\n¿Deseas continuar?")
+        boton_si = msg_box.addButton("Sí, cargar", QMessageBox.YesRole)
+        msg_box.addButton("No", QMessageBox.NoRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == boton_si:
+            self._ejecutar_tarea("Cargando Base de Datos", lambda tarea: restaurar_bd(ruta_archivo, ARCHIVO_BD, tarea),
+                                 self._bd_restaurada, ("Error al Cargar", "No se pudo cargar la base de datos"))
+
+    def _bd_restaurada(self, descartadas):
+        self.cargar_estudiantes_becados()
+        self.cargar_estudiantes_inscritos_desde_bd()
+        self.instantanea.borrar() # Es de la base de datos anterior
+        mostrar_mensaje_info("Éxito", "Base de datos cargada correctamente.")
+        avisar_cedulas_descartadas(descartadas)
+
+    def limpiar_bd(self):
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Warning)
+        msg_box.setWindowTitle("Confirmar Limpieza Total")
+        msg_box.setText("¿Estás seguro de que quieres borrar TODOS los registros (becados e inscritos) de la base de datos?\n\n¡Esta acción no se puede deshacer! Asegúrate de haber guardado una copia de seguridad si la necesitas.")
+        boton_si = msg_box.addButton("Sí, borrar todo", QMessageBox.YesRole)
+        msg_box.addButton("No", QMessageBox.NoRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == boton_si:
+            try:
+                cursor = self.conexion_bd.cursor()
+                cursor.execute("DELETE FROM becados")
+                borrar_inscritos(cursor)
+                self.conexion_bd.commit()
+                self.cargar_estudiantes_becados()
+                self.cargar_estudiantes_inscritos_desde_bd()
+                mostrar_mensaje_info("Éxito", "Todos los registros han sido borrados de la base de datos.")
+            except sqlite3.Error as e:
+                mostrar_error_critico("Error de Base de Datos", f"No se pudieron borrar los registros: {e}")
+
+    def mostrar_acerca_de(self):
+        dialogo = QDialog(self)
+        dialogo.setWindowTitle("Acerca de Gestor de Becas")
+        dialogo.setMinimumSize(600, 400)
+        layout = QVBoxLayout(dialogo)
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        text_edit.setMarkdown(README_CONTENT)
+        layout.addWidget(text_edit)
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok)
+        button_box.accepted.connect(dialogo.accept)
+        layout.addWidget(button_box)
+        dialogo.exec()
+
+    def abrir_github(self):
+        webbrowser.open("https://github.com/zontriger/zon-becados")
+
+    def _configurar_ui(self):
+        widget_principal = QWidget(self)
+        self.setCentralWidget(widget_principal)
+        diseno_principal = QVBoxLayout(widget_principal)
+        layout_tablas = QHBoxLayout()
+        self.grupo_inscritos = self.crear_grupo_tabla("Estudiantes Inscritos", "inscritos")
+        self.tabla_inscritos, self.modelo_inscritos = self._crear_vista_tabla()
+        self.tabla_inscritos.doubleClicked.connect(lambda index: self.ver_registro_doble_clic(index, 'inscritos'))
+        self.grupo_inscritos.layout().addWidget(self.tabla_inscritos)
+        self.grupo_becados = self.crear_grupo_tabla("Estudiantes Becados", "becados")
+        self.tabla_becados, self.modelo_becados = self._crear_vista_tabla()
+        self.tabla_becados.doubleClicked.connect(lambda index: self.ver_registro_doble_clic(index, 'becados'))
+        self.grupo_becados.layout().addWidget(self.tabla_becados)
+        cache_busqueda = CacheLRU(CAPACIDAD_CACHE_BUSQUEDA)
+        self.busqueda_inscritos = ControladorBusqueda('inscritos', self.modelo_inscritos, self._obtener_filtros, cache_busqueda, self)
+        self.busqueda_becados = ControladorBusqueda('becados', self.modelo_becados, self._obtener_filtros, cache_busqueda, self)
+        self.busqueda_inscritos.filtrado.connect(self._actualizar_titulos_grupos)
+        self.busqueda_becados.filtrado.connect(self._actualizar_titulos_grupos)
+        layout_tablas.addWidget(self.grupo_inscritos, 1)
+        layout_tablas.addWidget(self.grupo_becados, 1)
+        diseno_principal.addLayout(layout_tablas)
+        layout_controles_comp = QHBoxLayout()
+        self.boton_comparar = QPushButton("Colorear Registros")
+        font = QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        self.boton_comparar.setFont(font)
+        self.boton_comparar.setMinimumHeight(40)
+        self.boton_comparar.clicked.connect(self.alternar_modo_comparacion)
+        layout_controles_comp.addWidget(self.boton_comparar, 2)
+        grupo_filtros_color = QGroupBox("Filtrar por Color")
+        layout_filtros_color = QHBoxLayout()
+        self.check_verde = QCheckBox("Verde")
+        self.check_amarillo = QCheckBox("Amarillo")
+        self.check_rojo = QCheckBox("Rojo")
+        self.grupo_botones_color = QButtonGroup(self)
+        self.grupo_botones_color.setExclusive(False)
+        self.grupo_botones_color.addButton(self.check_verde)
+        self.grupo_botones_color.addButton(self.check_amarillo)
+        self.grupo_botones_color.addButton(self.check_rojo)
+        self.grupo_botones_color.buttonClicked.connect(self._on_color_filter_clicked)
+        layout_filtros_color.addStretch()
+        layout_filtros_color.addWidget(self.check_verde)
+        layout_filtros_color.addWidget(self.check_amarillo)
+        layout_filtros_color.addWidget(self.check_rojo)
+        layout_filtros_color.addStretch()
+        grupo_filtros_color.setLayout(layout_filtros_color)
+        layout_controles_comp.addWidget(grupo_filtros_color, 1)
+        self.ir_a_cedula = QLineEdit()
+        self.ir_a_cedula.setPlaceholderText("Ir a cédula...")
+        self.ir_a_cedula.setToolTip("Escribe una cédula y presiona Enter para seleccionarla en ambas tablas.")
+        self.ir_a_cedula.returnPressed.connect(self.ir_a_cedula_ingresada)
+        layout_controles_comp.addWidget(self.ir_a_cedula, 1)
+        diseno_principal.addLayout(layout_controles_comp)
+        layout_recuentos = QHBoxLayout()
+        self.lbl_inscritos = QLabel("Estudiantes inscritos: --")
+        self.lbl_becados = QLabel("Estudiantes becados: --")
+        self.lbl_becados_no_inscritos = QLabel("Estudiantes becados no inscritos: --")
+        self.lbl_incongruentes = QLabel("Estudiantes con datos incongruentes: --")
+        self.lbl_cupos = QLabel("Cupos disponibles: --")
+        for lbl in [self.lbl_inscritos, self.lbl_becados, self.lbl_becados_no_inscritos, self.lbl_incongruentes, self.lbl_cupos]:
+            lbl.setAlignment(Qt.AlignCenter)
+            layout_recuentos.addWidget(lbl)
+        diseno_principal.addLayout(layout_recuentos)
+
+    def ir_a_cedula_ingresada(self):
+        """Selecciona y centra la fila con la cédula escrita en cada tabla donde esté."""
+        cedula = re.sub(r"\D", "", self.ir_a_cedula.text()).lstrip("0")
+        if not cedula:
+            return
+        encontrada, ocultas = False, []
+        for nombre, tabla, modelo in (("inscritos", self.tabla_inscritos, self.modelo_inscritos),
+                                      ("becados", self.tabla_becados, self.modelo_becados)):
+            fila = modelo.fila_de_cedula(cedula)
+            if fila is None:
+                tabla.clearSelection()
+                continue
+            encontrada = True
+            fila_vista = modelo.fila_en_vista(fila)
+            if fila_vista is None:
+                tabla.clearSelection()
+                ocultas.append(nombre)
+                continue
+            tabla.selectRow(fila_vista)
+            tabla.scrollTo(modelo.index(fila_vista, 0), QAbstractItemView.PositionAtCenter)
+        if not encontrada:
+            mostrar_mensaje_advertencia("Cédula no Encontrada", f"La cédula {cedula} no está en ninguna de las tablas.")
+        elif ocultas:
+            mostrar_mensaje_info("Cédula Oculta", f"La cédula {cedula} está en la tabla de {' y de '.join(ocultas)}, pero los filtros activos la ocultan.")
+
+    def _on_color_filter_clicked(self, clicked_button):
+        """Maneja la selección exclusiva de los filtros de color."""
+        if clicked_button.isChecked():
+            for button in self.grupo_botones_color.buttons():
+                if button is not clicked_button:
+                    button.setChecked(False)
+        self._aplicar_filtros()
+
+    def _crear_vista_tabla(self):
+        tabla = QTableView()
+        tabla.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        tabla.setSelectionMode(QAbstractItemView.SingleSelection)
+        modelo = ModeloTablaColumnar(tabla)
+        tabla.setModel(modelo)
+        return tabla, modelo
+
+    def crear_grupo_tabla(self, titulo, tipo_tabla):
+        grupo = QGroupBox(titulo)
+        layout = QVBoxLayout(grupo)
+        controles_superiores = QHBoxLayout()
+        boton_cargar = QPushButton("Cargar Registros")
+        boton_cargar.clicked.connect(lambda: self.cargar_registros_a_tabla(tipo_tabla))
+        controles_superiores.addWidget(boton_cargar)
+        boton_limpiar = QPushButton("Limpiar Registros")
+        boton_limpiar.clicked.connect(lambda: self.limpiar_registros_tabla(tipo_tabla))
+        controles_superiores.addWidget(boton_limpiar)
+        if tipo_tabla == "becados":
+            self.boton_agregar_becado = QPushButton("Agregar")
+            self.boton_agregar_becado.clicked.connect(self.agregar_estudiante_becado)
+            controles_superiores.addWidget(self.boton_agregar_becado)
+            boton_editar = QPushButton("Editar")
+            boton_editar.clicked.connect(self.editar_estudiante_becado)
+            controles_superiores.addWidget(boton_editar)
+            boton_eliminar = QPushButton("Eliminar")
+            boton_eliminar.clicked.connect(self.eliminar_estudiante_becado)
+            controles_superiores.addWidget(boton_eliminar)
+        boton_exportar = QPushButton("Exportar")
+        menu_exportar = QMenu(self)
+        accion_excel = QAction("Exportar a Excel (.xlsx)", self)
+        accion_excel.triggered.connect(lambda: self.exportar_datos('excel', tipo_tabla))
+        menu_exportar.addAction(accion_excel)
+        accion_csv = QAction("Exportar a CSV (.csv)", self)
+        accion_csv.triggered.connect(lambda: self.exportar_datos('csv', tipo_tabla))
+        menu_exportar.addAction(accion_csv)
+        if PDF_DISPONIBLE:
+            accion_pdf = QAction("Exportar a PDF (.pdf)", self)
+            accion_pdf.triggered.connect(lambda: self.exportar_datos('pdf', tipo_tabla))
+            menu_exportar.addAction(accion_pdf)
+        boton_exportar.setMenu(menu_exportar)
+        controles_superiores.addWidget(boton_exportar)
+        layout.addLayout(controles_superiores)
+        filtros_layout = QHBoxLayout()
+        setattr(self, f"filtro_busqueda_{tipo_tabla}", QLineEdit())
+        setattr(self, f"filtro_carrera_{tipo_tabla}", QComboBox())
+        setattr(self, f"filtro_semestre_{tipo_tabla}", QComboBox())
+        setattr(self, f"filtro_tipocedula_{tipo_tabla}", QComboBox())
+        filtro_busqueda = getattr(self, f"filtro_busqueda_{tipo_tabla}")
+        filtro_carrera = getattr(self, f"filtro_carrera_{tipo_tabla}")
+        filtro_semestre = getattr(self, f"filtro_semestre_{tipo_tabla}")
+        filtro_tipocedula = getattr(self, f"filtro_tipocedula_{tipo_tabla}")
+        filtro_busqueda.setPlaceholderText("Buscar...")
+        filtro_carrera.addItems(["Todas las Carreras"] + CARRERAS)
+        filtro_semestre.addItems(["Todos los Semestres"] + list(SEMESTRES.keys()))
+        filtro_tipocedula.addItems(["Todos los Tipos"] + TIPOS_CEDULA)
+        filtros_layout.addWidget(filtro_busqueda)
+        filtros_layout.addWidget(filtro_carrera)
+        filtros_layout.addWidget(filtro_semestre)
+        filtros_layout.addWidget(filtro_tipocedula)
+        filtro_busqueda.textChanged.connect(lambda: getattr(self, f"busqueda_{tipo_tabla}").programar())
+        filtro_carrera.currentTextChanged.connect(lambda: getattr(self, f"busqueda_{tipo_tabla}").aplicar())
+        filtro_semestre.currentTextChanged.connect(lambda: getattr(self, f"busqueda_{tipo_tabla}").aplicar())
+        filtro_tipocedula.currentTextChanged.connect(lambda: getattr(self, f"busqueda_{tipo_tabla}").aplicar())
+        layout.addLayout(filtros_layout)
+        return grupo
+    
+    def _actualizar_estado_botones(self):
+        """Habilita o deshabilita botones según el estado de la aplicación."""
+        count_becados = len(self.todos_los_becados)
+        limite_alcanzado = count_becados >= LIMITE_BECADOS
+        if self.boton_agregar_becado:
+            self.boton_agregar_becado.setEnabled(not limite_alcanzado)
+            if limite_alcanzado:
+                self.boton_agregar_becado.setToolTip(f"Se ha alcanzado el límite de {LIMITE_BECADOS} estudiantes becados.")
+            else:
+                self.boton_agregar_becado.setToolTip("")
+
+    def _actualizar_titulos_grupos(self):
+        """Actualiza los títulos de los QGroupBox según el filtro de color activo y el conteo de filas visibles."""
+        color = self._color_activo()
+        titulo_extra_becados = TITULOS_COLOR[color]['becados'] if color else ""
+        titulo_extra_inscritos = TITULOS_COLOR[color]['inscritos'] if color else ""
+        becados_visibles = self.modelo_becados.rowCount()
+        inscritos_visibles = self.modelo_inscritos.rowCount()
+        self.grupo_becados.setTitle(f"Estudiantes Becados{titulo_extra_becados} ({becados_visibles})")
+        self.grupo_inscritos.setTitle(f"Estudiantes Inscritos{titulo_extra_inscritos} ({inscritos_visibles})")
+
+    def _color_activo(self):
+        """ESTADO_* del filtro de color marcado, o None si no hay ninguno o no se está comparando."""
+        if not self.modo_comparacion:
+            return None
+        if self.check_verde.isChecked():
+            return ESTADO_VERDE
+        if self.check_amarillo.isChecked():
+            return ESTADO_AMARILLO
+        if self.check_rojo.isChecked():
+            return ESTADO_ROJO
+        return None
+
+    def _codigos_filtro(self, tipo_tabla):
+        """Traduce las listas desplegables de una tabla a {encabezado: código entero}, omitiendo las que no filtran."""
+        codigos = {}
+        for enc, nombre_filtro in (("Carrera", "carrera"), ("Semestre", "semestre"), ("T. Cédula", "tipocedula")):
+            combo = getattr(self, f"filtro_{nombre_filtro}_{tipo_tabla}")
+            if combo.currentIndex() > 0:
+                codigos[enc] = COLUMNAS_CODIFICADAS[enc][combo.currentText()]
+        return codigos
+
+    def _obtener_filtros(self, tipo_tabla):
+        """Devuelve (palabras, códigos, clave de color, máscara de filas del color) de los filtros activos de una tabla."""
+        modelo = getattr(self, f"modelo_{tipo_tabla}")
+        palabras_busqueda = normalizar_texto(getattr(self, f"filtro_busqueda_{tipo_tabla}").text()).split()
+        ver_verde = self.check_verde.isChecked()
+        ver_amarillo = self.check_amarillo.isChecked()
+        ver_rojo = self.check_rojo.isChecked()
+        clave_color, seleccion = None, None
+        if self.modo_comparacion and (ver_verde or ver_amarillo or ver_rojo) and modelo.columnCount():
+            estado = ESTADO_AMARILLO if ver_amarillo else ESTADO_VERDE if ver_verde else ESTADO_ROJO
+            clave_color = (estado, self.version_becados, self.version_inscritos)
+            seleccion = self._comparacion().estados(tipo_tabla) == estado
+        return palabras_busqueda, self._codigos_filtro(tipo_tabla), clave_color, seleccion
+
+    @DIAGNOSTICO.medido('_aplicar_filtros', filas=lambda self: _filas_en_tablas(self))
+    def _aplicar_filtros(self):
+        self.busqueda_becados.aplicar()
+        self.busqueda_inscritos.aplicar()
+
+    @DIAGNOSTICO.medido('poblar_tabla_becados', filas=lambda self, datos: len(datos))
+    def poblar_tabla_becados(self, datos):
+        self.modelo_becados.cargar(ENCABEZADOS_VISUALIZACION, *columnas_tabla('becados', ENCABEZADOS_VISUALIZACION, datos))
+        ajustar_columnas_muestreadas(self.tabla_becados)
+
+    @staticmethod
+    def _valores_fila_becado(datos):
+        return [SEMESTRES_POR_NUMERO.get(datos.get(CAMPOS_BECADOS[h]), "") if h == 'Semestre' else str(datos.get(CAMPOS_BECADOS[h], ''))
+                for h in ENCABEZADOS_VISUALIZACION]
+
+    def _sincronizar_becado(self, id_estudiante):
+        """Refleja en memoria y en la tabla el alta, edición o baja de un solo becado, sin recargar toda la lista."""
+        cursor = self.conexion_bd.cursor()
+        cursor.execute("SELECT id, tipo_cedula, cedula, nombres, apellidos, carrera, semestre FROM becados WHERE id = ?", (id_estudiante,))
+        fila_bd = cursor.fetchone()
+        posicion = next((i for i, b in enumerate(self.todos_los_becados) if b['id'] == id_estudiante), None)
+        cedula_anterior = self.todos_los_becados[posicion]['cedula'] if posicion is not None else None
+        if fila_bd is None:
+            if posicion is None:
+                return
+            del self.todos_los_becados[posicion]
+            self.modelo_becados.eliminar_fila(posicion)
+        else:
+            datos = dict(fila_bd)
+            if posicion is None:
+                posicion = len(self.todos_los_becados)
+                self.todos_los_becados.append(datos)
+                self.modelo_becados.agregar_fila(self._valores_fila_becado(datos), datos['cedula'])
+            else:
+                self.todos_los_becados[posicion] = datos
+                self.modelo_becados.actualizar_fila(posicion, self._valores_fila_becado(datos), datos['cedula'])
+        versiones_previas = (self.version_becados, self.version_inscritos)
+        self.version_becados += 1
+        filas_inscritos = self.motor_comparacion.aplicar_cambio_becado(self.todos_los_becados, self.todos_los_inscritos, posicion, cedula_anterior,
+                                                                       versiones_previas, (self.version_becados, self.version_inscritos))
+        if self.modelo_becados.total_filas() <= 1:
+            ajustar_columnas_muestreadas(self.tabla_becados)
+        self._actualizar_estado_botones()
+        if not self.modo_comparacion:
+            self.actualizar_recuentos()
+        elif filas_inscritos is None: # No había una comparación vigente: se calcula y se pinta todo
+            self.pintar_comparacion()
+            self.busqueda_inscritos.aplicar()
+        else:
+            # De los inscritos solo cambian de color las filas con la cédula anterior y la nueva del becado.
+            comparacion = self._comparacion()
+            self.modelo_becados.establecer_estados(comparacion.estado_becados, comparacion.mascara_becados)
+            if "Cédula" in self.encabezados_inscritos:
+                self.modelo_inscritos.establecer_estados(comparacion.estado_inscritos, comparacion.mascara_inscritos, filas_inscritos)
+                self.busqueda_inscritos.actualizar_filas(filas_inscritos)
+            self.actualizar_recuentos()
+        self.busqueda_becados.aplicar()
+
+    def cargar_registros_a_tabla(self, tipo_tabla):
+        modelo_a_chequear = self.modelo_becados if tipo_tabla == 'becados' else self.modelo_inscritos
+        if modelo_a_chequear.total_filas() > 0:
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Question); msg_box.setWindowTitle("Confirmar Sobrescritura")
+            msg_box.setText(f"Ya existen registros en la tabla de '{tipo_tabla}'. Si cargas un nuevo archivo, los datos actuales se borrarán de forma permanente.\n\n¿Deseas continuar?")
+            boton_si = msg_box.addButton("Sí", QMessageBox.YesRole); msg_box.addButton("No", QMessageBox.NoRole)
+            msg_box.exec()
+            if msg_box.clickedButton() != boton_si: return
+
+        ruta_archivo, _ = QFileDialog.getOpenFileName(self, "Cargar Registros", "", "Archivos Soportados (*.xlsx *.xls *.csv)")
+        if not ruta_archivo: return
+
+        modelo, tabla = modelo_a_chequear, getattr(self, f"tabla_{tipo_tabla}")
+        lotes_recibidos = []
+
+        def recibir_lote(lote):
+            encabezados, inicio, columnas, cedulas, busqueda, codigos = lote
+            if inicio == 0:
+                modelo.iniciar_carga(encabezados)
+            modelo.agregar_lote(columnas, cedulas, busqueda, codigos)
+            if inicio == 0:
+                ajustar_columnas_muestreadas(tabla)
+            lotes_recibidos.append(len(cedulas))
+
+        def terminar(resultado):
+            encabezados, filas, indice = resultado
+            if not lotes_recibidos:
+                modelo.iniciar_carga(encabezados)
+            modelo.establecer_indice(indice)
+            ajustar_columnas_muestreadas(tabla)
+            if tipo_tabla == 'inscritos':
+                self.encabezados_inscritos, self.todos_los_inscritos = encabezados, filas
+                mensaje = f"Archivo '{os.path.basename(ruta_archivo)}' cargado y validado."
+            else:
+                self.todos_los_becados = filas
+                self._actualizar_estado_botones()
+                mensaje = f"Estudiantes becados actualizados desde el archivo '{os.path.basename(ruta_archivo)}'."
+            self._datos_cambiados(tipo_tabla)
+            mostrar_mensaje_info("Éxito", mensaje)
+
+        def interrumpir():
+            # La base de datos quedó como estaba; la tabla se vuelve a llenar si ya había recibido filas nuevas.
+            if lotes_recibidos:
+                self.cargar_estudiantes_becados() if tipo_tabla == 'becados' else self.cargar_estudiantes_inscritos_desde_bd()
+
+        def importar(tarea):
+            with DIAGNOSTICO.medir('cargar_registros_a_tabla') as medicion:
+                resultado = importar_registros(ruta_archivo, tipo_tabla, ARCHIVO_BD, tarea, self.cache_importaciones)
+                medicion['filas'] = len(resultado[1])
+            return resultado
+
+        self._ejecutar_tarea("Cargando Registros", importar,
+                             terminar, ("Error de Carga", "No se pudo procesar el archivo"),
+                             al_recibir_lote=recibir_lote, al_interrumpir=interrumpir)
+
+    def cargar_estudiantes_inscritos_desde_bd(self):
+        try:
+            encabezados, filas = leer_inscritos(self.conexion_bd.cursor())
+            self.modelo_inscritos.limpiar()
+            self.todos_los_inscritos = filas
+            if encabezados:
+                self.encabezados_inscritos = encabezados
+                self.poblar_tabla_inscritos(self.encabezados_inscritos, self.todos_los_inscritos)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            mostrar_error_critico("Error de Base de Datos", f"No se pudieron cargar los estudiantes inscritos: {e}")
+        finally:
+            self._datos_cambiados('inscritos')
+
+    def cargar_instantanea(self):
+        """Toma los inscritos y la comparación de la instantánea guardada al cerrar la sesión anterior, si la
+        base de datos no cambió desde entonces. Devuelve False si no hay una instantánea vigente."""
+        try:
+            sesion = self.instantanea.cargar(leer_marca_cambios(self.conexion_bd.cursor()))
+        except sqlite3.Error:
+            return False
+        if sesion is None:
+            return False
+        encabezados, partes_modelo, filas, (resultado, indice_cedulas) = sesion
+        self.encabezados_inscritos, self.todos_los_inscritos = encabezados, filas
+        self.modelo_inscritos.cargar_preparadas(encabezados, *partes_modelo)
+        ajustar_columnas_muestreadas(self.tabla_inscritos)
+        self.version_inscritos += 1
+        self.motor_comparacion.restaurar(resultado, indice_cedulas, (self.version_becados, self.version_inscritos))
+        self.actualizar_recuentos()
+        self._aplicar_filtros()
+        return True
+
+    def guardar_instantanea(self):
+        """Guarda la instantánea de los inscritos y la comparación al cerrar, salvo que la del disco ya
+        corresponda a la base de datos o que haya una tarea en curso."""
+        if self._tareas:
+            return
+        try:
+            marca = leer_marca_cambios(self.conexion_bd.cursor())
+        except sqlite3.Error:
+            return
+        if marca is None or self.instantanea.vigente(marca):
+            return
+        if not self.todos_los_inscritos:
+            self.instantanea.borrar()
+            return
+        comparacion = self.motor_comparacion.comparar_con_indice(self.todos_los_becados, self.todos_los_inscritos,
+                                                                 (self.version_becados, self.version_inscritos))
+        self.instantanea.guardar(marca, self.encabezados_inscritos, self.modelo_inscritos.datos_preparados(),
+                                 self.todos_los_inscritos, comparacion)
+
+    @DIAGNOSTICO.medido('poblar_tabla_inscritos', filas=lambda self, encabezados, filas: len(filas))
+    def poblar_tabla_inscritos(self, encabezados, filas):
+        self.modelo_inscritos.cargar(encabezados, *columnas_tabla('inscritos', encabezados, filas))
+        ajustar_columnas_muestreadas(self.tabla_inscritos)
+
+
+    def limpiar_registros_tabla(self, tipo_tabla):
+        titulo = f"¿Estás seguro de limpiar el registro de los estudiantes de la tabla '{tipo_tabla}'?"
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Question); msg_box.setWindowTitle("Confirmar Limpieza"); msg_box.setText(titulo)
+        boton_si = msg_box.addButton("Sí", QMessageBox.YesRole); msg_box.addButton("No", QMessageBox.NoRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == boton_si:
+            try:
+                cursor = self.conexion_bd.cursor()
+                if tipo_tabla == 'inscritos':
+                    borrar_inscritos(cursor)
+                    self.conexion_bd.commit()
+                    self.cargar_estudiantes_inscritos_desde_bd()
+                else: # becados
+                    cursor.execute("DELETE FROM becados")
+                    self.conexion_bd.commit()
+                    self.cargar_estudiantes_becados()
+                mostrar_mensaje_info("Éxito", f"Se han borrado los registros de estudiantes {tipo_tabla}.")
+            except sqlite3.Error as e:
+                mostrar_error_critico("Error de DB", f"No se pudieron borrar los registros: {e}")
+
+    def cargar_estudiantes_becados(self):
+        try:
+            cursor = self.conexion_bd.cursor()
+            cursor.execute("SELECT id, tipo_cedula, cedula, nombres, apellidos, carrera, semestre FROM becados ORDER BY id")
+            self.todos_los_becados = [dict(fila) for fila in cursor.fetchall()]
+            self.poblar_tabla_becados(self.todos_los_becados)
+            self._actualizar_estado_botones()
+        except sqlite3.Error as e:
+            mostrar_error_critico("Error de Base de Datos", f"No se pudieron cargar los datos: {e}")
+        finally:
+            self._datos_cambiados('becados')
+
+    def _datos_cambiados(self, tipo_tabla):
+        """Después de reemplazar toda una lista: invalida la comparación y vuelve a contar, pintar y filtrar."""
+        if tipo_tabla == 'becados':
+            self.version_becados += 1
+        else:
+            self.version_inscritos += 1
+        self.actualizar_recuentos()
+        if self.modo_comparacion:
+            self.pintar_comparacion()
+        self._aplicar_filtros()
+
+    def agregar_estudiante_becado(self):
+        if len(self.todos_los_becados) >= LIMITE_BECADOS:
+            mostrar_mensaje_advertencia("Límite Alcanzado", f"No se pueden agregar más estudiantes becados. El límite es {LIMITE_BECADOS}.")
+            return
+        dialogo = DialogoEstudiante(self)
+        dialogo.datos_estudiante_listos.connect(
+            lambda datos: self._manejar_datos_agregar_estudiante(dialogo, datos)
+        )
+        dialogo.exec()
+
+    def _manejar_datos_agregar_estudiante(self, dialogo, datos):
+        try:
+            cursor = self.conexion_bd.cursor()
+            cursor.execute("INSERT INTO becados (tipo_cedula, cedula, nombres, apellidos, carrera, semestre) VALUES (?, ?, ?, ?, ?, ?)",
+                           (datos['tipo_cedula'], datos['cedula'], datos['nombres'], datos['apellidos'], datos['carrera'], datos['semestre']))
+            self.conexion_bd.commit()
+            self._sincronizar_becado(cursor.lastrowid)
+            dialogo.registrar_exito_y_limpiar(datos)
+        except sqlite3.IntegrityError:
+            mostrar_mensaje_advertencia("Error", f"La cédula {datos['cedula']} ya está registrada.")
+        except sqlite3.Error as e:
+            mostrar_error_critico("Error de DB", f"No se pudo agregar el estudiante: {e}")
+            
+    def ver_registro_doble_clic(self, index, tipo_tabla):
+        if tipo_tabla == 'becados':
+            datos_estudiante_db = self.todos_los_becados[self.modelo_becados.fila_fuente(index.row())]
+
+            datos_para_dialogo = {
+                'T. Cédula': datos_estudiante_db.get('tipo_cedula'),
+                'Cédula': datos_estudiante_db.get('cedula'),
+                'Nombres': datos_estudiante_db.get('nombres'),
+                'Apellidos': datos_estudiante_db.get('apellidos'),
+                'Carrera': datos_estudiante_db.get('carrera'),
+                'Semestre': next((k for k, v in SEMESTRES.items() if v == datos_estudiante_db.get('semestre')), "N/A")
+            }
+            dialogo = DialogoVerEstudiante(self, datos_estudiante=datos_para_dialogo, tipo_tabla='becados')
+            dialogo.quitar_de_becados.connect(lambda: self._accion_quitar_desde_dialogo(datos_estudiante_db, dialogo))
+            dialogo.editar_becado.connect(lambda: self._accion_editar_desde_dialogo(datos_estudiante_db, dialogo))
+            dialogo.exec()
+
+        elif tipo_tabla == 'inscritos':
+            datos_para_dialogo = self.modelo_inscritos.fila_como_dict(self.modelo_inscritos.fila_fuente(index.row()))
+            cedula_inscrito = datos_para_dialogo.get('Cédula')
+            es_becado_actualmente = self.modelo_becados.fila_de_cedula(cedula_inscrito) is not None if cedula_inscrito else False
+            dialogo = DialogoVerEstudiante(self, datos_estudiante=datos_para_dialogo, tipo_tabla='inscritos', ya_es_becado=es_becado_actualmente)
+            dialogo.agregar_a_becados.connect(lambda: self._accion_agregar_desde_dialogo(datos_para_dialogo, dialogo))
+            dialogo.exec()
+
+    def editar_estudiante_becado(self):
+        filas_seleccionadas = self.tabla_becados.selectionModel().selectedRows()
+        if not filas_seleccionadas:
+            mostrar_mensaje_advertencia("Atención", "Selecciona un estudiante para editar.")
+            return
+        self._editar_becado_con_datos(self.todos_los_becados[self.modelo_becados.fila_fuente(filas_seleccionadas[0].row())])
+
+    def _editar_becado_con_datos(self, datos_estudiante):
+        if not datos_estudiante: return
+        id_estudiante = datos_estudiante['id']
+        dialogo = DialogoEstudiante(self, datos_estudiante=datos_estudiante)
+        dialogo.datos_estudiante_listos.connect(
+            lambda datos: self._manejar_datos_editar_estudiante(dialogo, id_estudiante, datos)
+        )
+        dialogo.exec()
+
+    def _manejar_datos_editar_estudiante(self, dialogo, id_estudiante, datos):
+        try:
+            cursor = self.conexion_bd.cursor()
+            cursor.execute("UPDATE becados SET tipo_cedula=?, cedula=?, nombres=?, apellidos=?, carrera=?, semestre=? WHERE id=?",
+                           (datos['tipo_cedula'], datos['cedula'], datos['nombres'], datos['apellidos'], datos['carrera'], datos['semestre'], id_estudiante))
+            self.conexion_bd.commit()
+            self._sincronizar_becado(id_estudiante)
+            dialogo.accept()
+            mostrar_mensaje_info("Éxito", "Estudiante actualizado.")
+        except sqlite3.IntegrityError:
+            mostrar_mensaje_advertencia("Error", f"La cédula {datos['cedula']} ya existe para otro estudiante.")
+        except sqlite3.Error as e:
+            mostrar_error_critico("Error de DB", f"No se pudo actualizar: {e}")
+
+    def eliminar_estudiante_becado(self):
+        filas_seleccionadas = self.tabla_becados.selectionModel().selectedRows()
+        if not filas_seleccionadas:
+            mostrar_mensaje_advertencia("Atención", "Selecciona un estudiante para eliminar.")
+            return
+        datos_estudiante = self.todos_los_becados[self.modelo_becados.fila_fuente(filas_seleccionadas[0].row())]
+        self._eliminar_becado_por_id(datos_estudiante['id'], datos_estudiante['nombres'])
+
+    def _eliminar_becado_por_id(self, id_estudiante, nombre_estudiante):
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Question); msg_box.setWindowTitle("Confirmar Eliminación")
+        msg_box.setText(f"¿Seguro que quieres eliminar a {nombre_estudiante} de la lista de becados?")
+        boton_si = msg_box.addButton("Sí", QMessageBox.YesRole); msg_box.addButton("No", QMessageBox.NoRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == boton_si:
+            try:
+                cursor = self.conexion_bd.cursor()
+                cursor.execute("DELETE FROM becados WHERE id = ?", (id_estudiante,))
+                self.conexion_bd.commit()
+                self._sincronizar_becado(id_estudiante)
+                mostrar_mensaje_info("Éxito", "Estudiante eliminado.")
+                return True
+            except sqlite3.Error as e:
+                mostrar_error_critico("Error de DB", f"No se pudo eliminar: {e}")
+        return False
+
+    def _accion_agregar_desde_dialogo(self, datos_inscrito, dialogo):
+        dialogo.accept()
+        if len(self.todos_los_becados) >= LIMITE_BECADOS:
+            mostrar_mensaje_advertencia("Límite Alcanzado", f"No se pueden agregar más estudiantes becados. El límite es {LIMITE_BECADOS}.")
+            return
+        try:
+            cedula_texto = datos_inscrito.get('Cédula', '').strip()
+            if not cedula_texto.isdigit():
+                mostrar_mensaje_advertencia("Dato Inválido", "La cédula del estudiante inscrito no es un número válido.")
+                return
+            cedula_int = int(cedula_texto)
+            cursor = self.conexion_bd.cursor()
+            cursor.execute("SELECT id FROM becados WHERE cedula = ?", (cedula_int,))
+            if cursor.fetchone():
+                mostrar_mensaje_advertencia("Duplicado", f"El estudiante con cédula {cedula_int} ya es un becado.")
+                return
+            datos_para_db = {
+                'tipo_cedula': datos_inscrito.get('T. Cédula', 'V'), 'cedula': cedula_int,
+                'nombres': ' '.join(datos_inscrito.get('Nombres', '').strip().split()).title(),
+                'apellidos': ' '.join(datos_inscrito.get('Apellidos', '').strip().split()).title(),
+                'carrera': datos_inscrito.get('Carrera', ''),
+                'semestre': SEMESTRES.get(str(datos_inscrito.get('Semestre', '')).upper(), -1) # -1 para indicar error
+            }
+            errores = []
+            if not datos_para_db['nombres']: errores.append("Nombres")
+            if not datos_para_db['apellidos']: errores.append("Apellidos")
+            if datos_para_db['carrera'] not in CARRERAS: errores.append("Carrera (no es válida)")
+            if errores:
+                mensaje_error = "No se puede agregar al estudiante. Faltan o son inválidos los siguientes datos:\n\n- " + "\n- ".join(errores)
+                mostrar_mensaje_advertencia("Datos Faltantes o Inválidos", mensaje_error)
+                return
+        except (ValueError, KeyError) as e:
+            mostrar_error_critico("Error de Datos", f"No se pudo procesar la información del estudiante inscrito: {e}")
+            return
+        try:
+            cursor.execute("INSERT INTO becados (tipo_cedula, cedula, nombres, apellidos, carrera, semestre) VALUES (?, ?, ?, ?, ?, ?)",
+                           (datos_para_db['tipo_cedula'], datos_para_db['cedula'], datos_para_db['nombres'], datos_para_db['apellidos'], datos_para_db['carrera'], datos_para_db['semestre']))
+            self.conexion_bd.commit()
+            self._sincronizar_becado(cursor.lastrowid)
+            mostrar_mensaje_info("Éxito", f"Estudiante {datos_para_db['nombres']} {datos_para_db['apellidos']} ha sido agregado a los becados.")
+        except sqlite3.Error as e:
+            mostrar_error_critico("Error de DB", f"No se pudo agregar el estudiante: {e}")
+
+    def _accion_quitar_desde_dialogo(self, datos_becado, dialogo):
+        if self._eliminar_becado_por_id(datos_becado['id'], datos_becado['nombres']):
+            dialogo.accept()
+
+    def _accion_editar_desde_dialogo(self, datos_becado, dialogo):
+        dialogo.accept()
+        self._editar_becado_con_datos(datos_becado)
+
+    def exportar_datos(self, formato, tipo_tabla):
+        color = self._color_activo()
+        titulo_extra = TITULOS_COLOR[color][tipo_tabla] if color else ""
+        titulo_reporte = titulo_de_reporte(tipo_tabla, color)
+
+        if titulo_extra:
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Question)
+            msg_box.setWindowTitle("Confirmar Exportación con Filtro")
+            msg_box.setText(f"Se exportarán solo los registros actualmente visibles que coinciden con el filtro '{titulo_extra.strip()}'.\n\n¿Deseas continuar?")
+            boton_si = msg_box.addButton("Sí", QMessageBox.YesRole)
+            msg_box.addButton("No", QMessageBox.NoRole)
+            msg_box.exec()
+            if msg_box.clickedButton() != boton_si:
+                return
+
+        if tipo_tabla == 'becados':
+            modelo, encabezados, datos = self.modelo_becados, ENCABEZADOS_VISUALIZACION, self.todos_los_becados
+        else: # 'inscritos'
+            modelo, encabezados, datos = self.modelo_inscritos, self.encabezados_inscritos, self.todos_los_inscritos
+        filas = np.array(modelo.filas_visibles()) # Copia: la vista puede cambiar mientras se exporta
+
+        if not len(filas):
+            mostrar_mensaje_advertencia("Atención", f"No hay estudiantes visibles para exportar.")
+            return
+
+        default_filename = nombre_de_reporte(tipo_tabla, color, formato if formato != 'excel' else 'xlsx')
+        file_filter = f"Archivos {formato.upper()} (*.{formato if formato != 'excel' else 'xlsx'})"
+        
+        ruta_guardado, _ = QFileDialog.getSaveFileName(self, f"Guardar Reporte {formato.upper()}", default_filename, file_filter)
+        if not ruta_guardado: return
+
+        if formato == 'pdf':
+            funcion = lambda tarea: exportar_pdf(ruta_guardado, titulo_reporte, tipo_tabla, encabezados, datos, filas, tarea)
+        else:
+            funcion = lambda tarea: exportar_registros(ruta_guardado, formato, titulo_reporte, tipo_tabla, encabezados, datos, filas, tarea)
+        self._ejecutar_tarea(
+            "Exportando reporte...", DIAGNOSTICO.medido('exportar_datos', filas=lambda tarea: len(filas))(funcion),
+            lambda total: mostrar_mensaje_info("Éxito", f"Reporte guardado en '{ruta_guardado}'."),
+            (f"Error al Exportar {formato.upper()}", "No se pudo guardar el reporte"))
+
+    def exportar_paquete(self):
+        """Exporta en una carpeta nueva el reporte de cada filtro de color de ambas tablas (ver exportar_paquete_auditoria)."""
+        if not self.todos_los_becados or not len(self.todos_los_inscritos):
+            mostrar_mensaje_advertencia("Atención", "Carga los estudiantes becados y los inscritos para exportar el paquete de auditoría.")
+            return
+        carpeta = QFileDialog.getExistingDirectory(self, "Carpeta para el Paquete de Auditoría")
+        if not carpeta: return
+        destino = os.path.join(carpeta, f"paquete_auditoria_{time.strftime('%Y%m%d_%H%M%S')}")
+        comparacion = self._comparacion()
+        partes = [('becados', ENCABEZADOS_VISUALIZACION, self.todos_los_becados, comparacion.estado_becados),
+                  ('inscritos', self.encabezados_inscritos, self.todos_los_inscritos, comparacion.estado_inscritos)]
+        self._ejecutar_tarea(
+            "Exportando paquete de auditoría...",
+            DIAGNOSTICO.medido('exportar_paquete', filas=lambda tarea: sum(len(datos) for _, _, datos, _ in partes))(
+                lambda tarea: exportar_paquete_auditoria(destino, partes, PDF_DISPONIBLE, tarea)),
+            lambda ruta: mostrar_mensaje_info("Éxito", f"Paquete de auditoría guardado en '{ruta}'."),
+            ("Error al Exportar", "No se pudo guardar el paquete de auditoría"))
+
+    def alternar_modo_comparacion(self):
+        self.modo_comparacion = not self.modo_comparacion
+        if self.modo_comparacion:
+            self.pintar_comparacion()
+            self.boton_comparar.setText("Quitar Coloreado")
+        else:
+            self.despintar_tablas()
+            self.boton_comparar.setText("Colorear Registros")
+            for button in self.grupo_botones_color.buttons():
+                button.setChecked(False)
+        
+        self.actualizar_recuentos()
+        self._aplicar_filtros()
+
+    def despintar_tablas(self):
+        self.modelo_becados.establecer_estados(None, None)
+        self.modelo_inscritos.establecer_estados(None, None)
+
+    def _comparacion(self):
+        """Resultado del motor de comparación para los datos actuales (se recalcula solo si cambiaron)."""
+        return self.motor_comparacion.comparar(self.todos_los_becados, self.todos_los_inscritos, (self.version_becados, self.version_inscritos))
+
+    @DIAGNOSTICO.medido('pintar_comparacion', filas=lambda self: _filas_en_tablas(self))
+    def pintar_comparacion(self):
+        comparacion = self._comparacion()
+        self.modelo_becados.establecer_estados(comparacion.estado_becados, comparacion.mascara_becados)
+        if "Cédula" in self.encabezados_inscritos:
+            self.modelo_inscritos.establecer_estados(comparacion.estado_inscritos, comparacion.mascara_inscritos)
+        else:
+            self.modelo_inscritos.establecer_estados(None, None)
+        self.actualizar_recuentos()
+
+    @DIAGNOSTICO.medido('actualizar_recuentos', filas=lambda self: _filas_en_tablas(self))
+    def actualizar_recuentos(self):
+        comparacion = self._comparacion()
+        num_inscritos = comparacion.num_inscritos
+        num_becados = comparacion.num_becados
+
+        self.lbl_inscritos.setText(f"Estudiantes inscritos: {num_inscritos if num_inscritos > 0 else '--'}")
+        
+        self.lbl_becados.setText(f"Estudiantes becados: {num_becados if num_becados > 0 else '--'}")
+        self.lbl_becados.setStyleSheet("color: red;" if num_becados >= LIMITE_BECADOS else "")
+
+        cupos_disponibles = LIMITE_BECADOS - num_becados
+        if cupos_disponibles > 0:
+            self.lbl_cupos.setText(f"Cupos disponibles: <b>{cupos_disponibles}</b>")
+            self.lbl_cupos.setStyleSheet("color: green;")
+        else:
+            self.lbl_cupos.setText(f"Cupos disponibles: <b style='color: red;'>{cupos_disponibles}</b>")
+            self.lbl_cupos.setStyleSheet("")
+
+        if num_becados > 0 and num_inscritos > 0:
+            becados_no_inscritos_count = comparacion.becados_no_inscritos
+            if becados_no_inscritos_count > 0:
+                self.lbl_becados_no_inscritos.setText(f"Estudiantes becados no inscritos: <b>{becados_no_inscritos_count}</b>")
+                self.lbl_becados_no_inscritos.setStyleSheet("color: red;")
+            else:
+                self.lbl_becados_no_inscritos.setText("Estudiantes becados no inscritos: 0")
+                self.lbl_becados_no_inscritos.setStyleSheet("")
+            self.lbl_incongruentes.setText(f"Estudiantes con datos incongruentes: {comparacion.incongruentes if self.modo_comparacion else '--'}")
+        else:
+            self.lbl_becados_no_inscritos.setText("Estudiantes becados no inscritos: --")
+            self.lbl_becados_no_inscritos.setStyleSheet("")
+            self.lbl_incongruentes.setText("Estudiantes con datos incongruentes: --")
+
+    def closeEvent(self, evento):
+        self.guardar_instantanea()
+        self.conexion_bd.close()
+        evento.accept()
+
+def mostrar_cuadro_mensaje(icono, titulo, texto):
+    msg_box = QMessageBox()
+    if os.path.exists('icon.ico'):
+        msg_box.setWindowIcon(QIcon('icon.ico'))
+    msg_box.setIcon(icono); msg_box.setText(texto); msg_box.setWindowTitle(titulo)
+    msg_box.exec()
+
+def mostrar_mensaje_info(titulo, texto): mostrar_cuadro_mensaje(QMessageBox.Information, titulo, texto)
+def mostrar_mensaje_advertencia(titulo, texto): mostrar_cuadro_mensaje(QMessageBox.Warning, titulo, texto)
+def mostrar_error_critico(titulo, texto): mostrar_cuadro_mensaje(QMessageBox.Critical, titulo, texto)
+
+class FiltroPrimerPintado(QObject):
+    """Filtro de eventos de la aplicación que, al primer pintado, deja terminar esa pasada del bucle de
+    eventos y cierra el informe de tiempos de arranque."""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._app = app
+        self._visto = False
+
+    def eventFilter(self, objeto, evento):
+        if not self._visto and evento.type() == QEvent.Paint:
+            self._visto = True
+            self._app.removeEventFilter(self)
+            QTimer.singleShot(0, self._terminar)
+        return False
+
+    def _terminar(self):
+        CRONOMETRO_ARRANQUE.marcar("Mostrar ventana y primer pintado")
+        CRONOMETRO_ARRANQUE.informar()
+
+CRONOMETRO_ARRANQUE.marcar("Definiciones del módulo")
+
+def ejecutar_interfaz():
+    """Abre la ventana principal y corre el bucle de eventos. Devuelve el código de salida."""
+    if os.environ.get('ZON_BECADOS_MEMORIA', '') not in ('', '0'):
+        tracemalloc.start()
+    app = QApplication(sys.argv)
+    CRONOMETRO_ARRANQUE.marcar("QApplication")
+    
+    if not PDF_DISPONIBLE:
+        mostrar_mensaje_advertencia("Dependencia Faltante", "La librería 'reportlab' no está instalada.\nLa exportación a PDF no estará disponible.\n\nPara activarla, instala con: pip install reportlab")
+        CRONOMETRO_ARRANQUE.marcar("Aviso de dependencia faltante")
+    
+    inicializar_bd()
+    CRONOMETRO_ARRANQUE.marcar("inicializar_bd")
+    ventana = AppGestorBecas()
+    CRONOMETRO_ARRANQUE.marcar("AppGestorBecas.__init__")
+    if CRONOMETRO_ARRANQUE.activo:
+        app.installEventFilter(FiltroPrimerPintado(app))
+    ventana.show()
+    
+    # Inicia el bucle de eventos de la aplicación de forma compatible
+    # PySide6 usa exec(), PySide2 usa exec_()
+    if hasattr(app, 'exec'):
+        return app.exec()
+    return app.exec_()
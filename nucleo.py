@@ -0,0 +1,1970 @@
+"""Lógica de Zon Becados que no depende de la interfaz: base de datos, importación y validación de
+archivos, comparación, índice de búsqueda y reportes. No importa Qt, así que la usan tanto la ventana
+(main.py) como el modo por línea de comandos (`python main.py compare ...`)."""
+import sys
+import time
+import re
+import sqlite3
+import json
+import os
+import unicodedata
+import gzip
+import codecs
+import csv
+import hashlib
+import importlib.util
+import multiprocessing
+import shutil
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+class ModuloDiferido:
+    """Importa un módulo (llamando a `importar`) la primera vez que se usa uno de sus atributos. pandas
+    tarda casi medio segundo en importarse y solo hace falta al importar o exportar archivos, así que no
+    retrasa el arranque. `importar` debe contener un `import` normal para que PyInstaller lo empaquete."""
+
+    def __init__(self, importar):
+        self._importar = importar
+        self._modulo = None
+        self.al_importar = None # al_importar(nombre, segundos), si se asigna, se llama después de importarlo
+
+    def __getattr__(self, atributo):
+        if self._modulo is None:
+            inicio = time.perf_counter()
+            self._modulo = self._importar()
+            if self.al_importar:
+                self.al_importar(self._modulo.__name__, time.perf_counter() - inicio)
+        return getattr(self._modulo, atributo)
+
+def _importar_pandas():
+    import pandas
+    return pandas
+
+pd = ModuloDiferido(_importar_pandas)
+
+# --- Dependencia Adicional para PDF ---
+# reportlab solo se importa al exportar un PDF; al arrancar basta con saber si está instalado.
+PDF_DISPONIBLE = importlib.util.find_spec('reportlab') is not None
+
+# --- Constantes ---
+CARRERAS = [
+    "Ingeniería de Sistemas", "Ingeniería de Telecomunicaciones", "Ingeniería Mecánica", 
+    "Ingeniería Eléctrica", "Contaduría", "Administración de Desastres"
+]
+SEMESTRES = {
+    "CINU": 0, "1": 1, "2": 2, "3": 3, "4": 4,
+    "5": 5, "6": 6, "7": 7, "8": 8, "9": 9
+}
+SEMESTRES_POR_NUMERO = {v: k for k, v in SEMESTRES.items()}
+TIPOS_CEDULA = ['V', 'E', 'P']
+ARCHIVO_BD = 'estudiantes.db'
+ENCABEZADOS_VISUALIZACION = ["T. Cédula", "Cédula", "Nombres", "Apellidos", "Carrera", "Semestre"]
+ENCABEZADOS_REQUERIDOS = set(ENCABEZADOS_VISUALIZACION)
+LIMITE_BECADOS = 216
+CAMPOS_BECADOS = {"T. Cédula": "tipo_cedula", "Cédula": "cedula", "Nombres": "nombres", "Apellidos": "apellidos", "Carrera": "carrera", "Semestre": "semestre"}
+COLUMNAS_CODIFICADAS = {
+    "Carrera": {c: i for i, c in enumerate(CARRERAS)},
+    "Semestre": SEMESTRES,
+    "T. Cédula": {t: i for i, t in enumerate(TIPOS_CEDULA)},
+}
+MUESTRA_ANCHO_COLUMNAS = 200
+SEPARADOR_LOTE = "\x00"
+MINIMO_FILAS_RECONSTRUCCION_INDICE = 256
+TAMANO_BLOQUE_INDICE = 50000
+TABLAS_REQUERIDAS = {'becados', 'inscritos', 'inscritos_encabezados'}
+PAGINAS_POR_PASO_RESPALDO = 256
+TAMANO_BLOQUE_COMPRESION = 1 << 20
+TAMANO_LOTE_IMPORTACION = 5000
+FILAS_POR_PASO_EXPORTACION = 5000
+TAMANO_BUFFER_CSV = 1 << 20
+ALTO_FILA_PDF = 18 # Puntos: texto de 10 con interlineado de 12 más el relleno de la celda
+ALTO_ENCABEZADO_PDF = 27
+ARCHIVO_LIBRO_AUDITORIA = "auditoria.xlsx"
+TAMANO_MUESTRA_CSV = 64 * 1024
+SEPARADORES_CSV = [';', ',', '\t', '|']
+# Si un CSV cuya muestra era UTF-8 deja de serlo más adelante, se vuelve a leer como UTF-8 con los bytes inválidos como Latin-1.
+CODIFICACION_REINTENTO_CSV = 'utf-8 o latin-1'
+FILAS_BUSQUEDA_ENCABEZADOS = 1000
+UMBRAL_IMPORTACION_POR_BLOQUES = 32 * 1024 * 1024
+TAMANO_BLOQUE_CSV = 50000
+PATRON_CEDULA = re.compile(r"\d{6,9}")
+PATRON_NOMBRE = re.compile(r"[A-Za-zÀ-ÿ\s]{3,30}")
+PATRON_ESPACIOS = re.compile(r"\s+")
+COLUMNAS_ERRORES_VALIDACION = ["Fila", "Columna", "Regla", "Valor"]
+# Cambiarla cuando cambien las reglas de validar_registros() para no reutilizar importaciones guardadas en caché.
+VERSION_VALIDACION = 1
+DIRECTORIO_CACHE_IMPORTACION = 'cache_importacion'
+LIMITE_CACHE_IMPORTACION = 256 * 1024 * 1024
+# Subir este número cuando cambie lo que guarda la instantánea de sesión o cómo se calcula (normalización,
+# índice, comparación), para que la del arranque anterior no se use.
+VERSION_INSTANTANEA = 1
+DIRECTORIO_INSTANTANEA = 'instantanea'
+
+CAMPOS_COMPARACION = {"T. Cédula": "tipo_cedula", "Nombres": "nombres", "Apellidos": "apellidos", "Carrera": "carrera", "Semestre": "semestre"}
+BITS_CAMPOS_COMPARACION = {h: 1 << i for i, h in enumerate(CAMPOS_COMPARACION)}
+ESTADO_VERDE, ESTADO_AMARILLO, ESTADO_ROJO = 1, 2, 3
+TITULOS_COLOR = { # Lo que se agrega al título de cada tabla cuando se filtra por un color
+    ESTADO_VERDE: {'becados': " (inscritos)", 'inscritos': " (becados)"},
+    ESTADO_AMARILLO: {'becados': " (datos incongruentes)", 'inscritos': " (datos incongruentes)"},
+    ESTADO_ROJO: {'becados': " (no inscritos)", 'inscritos': " (no becados)"},
+}
+
+
+# --- Funciones de Ayuda ---
+def normalizar_texto(texto):
+    """Convierte a minúsculas y elimina tildes/diacríticos para búsqueda insensible."""
+    texto_normalizado = unicodedata.normalize('NFD', str(texto).lower())
+    return "".join(c for c in texto_normalizado if unicodedata.category(c) != 'Mn')
+
+def normalizar_textos(textos):
+    """Versión por lotes de normalizar_texto: une todos los textos y hace una sola pasada NFD,
+    quitando con una expresión regular solo los diacríticos que aparecen en el texto."""
+    if not textos:
+        return []
+    unido = unicodedata.normalize('NFD', SEPARADOR_LOTE.join(textos).lower())
+    marcas = "".join(c for c in set(unido) if unicodedata.category(c) == 'Mn')
+    if marcas:
+        unido = re.sub(f"[{re.escape(marcas)}]+", "", unido)
+    return unido.split(SEPARADOR_LOTE)
+
+def codificar_columna(valores, codigos, transformar=None):
+    """Convierte una columna de texto en un arreglo de códigos enteros (-1 si el valor no es reconocido).
+    `transformar` se aplica una sola vez por valor distinto antes de buscar el código."""
+    por_valor = {v: codigos.get(transformar(v) if transformar else v, -1) for v in set(valores)}
+    return np.fromiter(map(por_valor.__getitem__, valores), dtype=np.int8, count=len(valores))
+
+def texto_para_codigo(encabezado, valor):
+    return valor if encabezado == "Carrera" else valor.strip().upper()
+
+def preparar_filas(encabezados, columnas, total):
+    """Calcula el texto normalizado de búsqueda y los códigos enteros de los filtros de `total` filas,
+    como los usa ModeloTablaColumnar. No toca el modelo, así que se puede llamar desde otro hilo."""
+    busqueda = normalizar_textos([" ".join(valores) for valores in zip(*columnas)]) if total else []
+    codigos = {}
+    for enc, codigos_enc in COLUMNAS_CODIFICADAS.items():
+        if enc in encabezados:
+            valores = columnas[list(encabezados).index(enc)]
+            codigos[enc] = codificar_columna(valores, codigos_enc, lambda v, enc=enc: texto_para_codigo(enc, v))
+        else:
+            codigos[enc] = np.full(total, -1, dtype=np.int8)
+    return busqueda, codigos
+
+# --- Lógica de la Base de Datos ---
+class TareaCancelada(Exception):
+    """Se lanza dentro de una tarea en segundo plano cuando el usuario pide cancelarla."""
+
+def verificar_respaldo(ruta):
+    """Comprueba con un ATTACH de solo lectura, sin copiar el archivo, que `ruta` es una base de datos
+    de la aplicación. Devuelve True si todavía usa el esquema con inscritos en JSON y hay que migrarla."""
+    if not os.path.isfile(ruta):
+        raise sqlite3.DatabaseError("El archivo no existe.")
+    with closing(sqlite3.connect(":memory:", uri=True)) as conexion:
+        conexion.execute("ATTACH DATABASE ? AS respaldo", (Path(ruta).absolute().as_uri() + "?mode=ro",))
+        tablas = {nombre for (nombre,) in conexion.execute("SELECT name FROM respaldo.sqlite_master WHERE type='table'")}
+        if not TABLAS_REQUERIDAS <= tablas:
+            raise sqlite3.DatabaseError("El archivo no contiene las tablas necesarias.")
+        return any(fila[1] == 'datos_fila' for fila in conexion.execute("PRAGMA respaldo.table_info(inscritos)"))
+
+def _copiar_paginas(ruta_origen, ruta_destino, tarea, inicio, fin):
+    """Copia una base de datos sobre otra con la API de respaldo de SQLite, de a PAGINAS_POR_PASO_RESPALDO
+    páginas, informando el avance entre `inicio` y `fin`. El destino se reemplaza en una sola transacción:
+    si se cancela antes del último paso queda como estaba."""
+    def progreso(estado, restantes, total):
+        if restantes:
+            tarea.verificar_cancelacion()
+        tarea.reportar(inicio + (fin - inicio) * (total - restantes) // max(total, 1))
+    with closing(sqlite3.connect(ruta_origen)) as origen, closing(sqlite3.connect(ruta_destino)) as destino:
+        origen.backup(destino, pages=PAGINAS_POR_PASO_RESPALDO, progress=progreso)
+
+def _copiar_flujo(lector, escritor, posicion, total, tarea, inicio, fin):
+    """Copia por bloques de un archivo a otro (uno de ellos gzip), informando el avance con `posicion()`."""
+    while True:
+        bloque = lector.read(TAMANO_BLOQUE_COMPRESION)
+        if not bloque:
+            break
+        escritor.write(bloque)
+        tarea.verificar_cancelacion()
+        tarea.reportar(inicio + (fin - inicio) * posicion() // max(total, 1))
+
+def _eliminar_archivos(*rutas):
+    for ruta in rutas:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+
+def respaldar_bd(ruta_bd, ruta_destino, tarea):
+    """Guarda una copia de la base de datos sin cerrar la conexión en uso. Si `ruta_destino` termina en
+    .gz, la copia se comprime. El archivo final solo aparece cuando la copia está completa."""
+    comprimir = ruta_destino.endswith(".gz")
+    temporal, temporal_gz = ruta_destino + ".tmp", ruta_destino + ".tmp.gz"
+    try:
+        tarea.reportar(0, "Copiando la base de datos...")
+        _copiar_paginas(ruta_bd, temporal, tarea, 0, 70 if comprimir else 100)
+        if comprimir:
+            tarea.reportar(70, "Comprimiendo la copia...")
+            with open(temporal, 'rb') as lector, gzip.open(temporal_gz, 'wb', compresslevel=6) as escritor:
+                _copiar_flujo(lector, escritor, lector.tell, os.path.getsize(temporal), tarea, 70, 100)
+            os.replace(temporal_gz, ruta_destino)
+        else:
+            os.replace(temporal, ruta_destino)
+    finally:
+        _eliminar_archivos(temporal, temporal_gz)
+
+def restaurar_bd(ruta_respaldo, ruta_bd, tarea):
+    """Reemplaza el contenido de `ruta_bd` por el de una copia (.db o .db.gz). La copia se descomprime y
+    se migra al esquema actual en archivos temporales, y luego se vuelca sobre la base de datos en uso
+    con la API de respaldo, que la reemplaza de forma atómica sin cerrar otras conexiones. Al terminar, la
+    base de datos recibe un identificador nuevo (ver renovar_identificador). Devuelve las cédulas de los
+    inscritos descartados por repetidos al migrar la copia (ver migrar_esquema)."""
+    descomprimido, migrado = ruta_bd + ".restaurar.tmp", ruta_bd + ".migrar.tmp"
+    descartadas = []
+    try:
+        origen = ruta_respaldo
+        if ruta_respaldo.endswith(".gz"):
+            tarea.reportar(0, "Descomprimiendo la copia...")
+            with open(ruta_respaldo, 'rb') as crudo, gzip.GzipFile(fileobj=crudo) as lector, open(descomprimido, 'wb') as escritor:
+                _copiar_flujo(lector, escritor, crudo.tell, os.path.getsize(ruta_respaldo), tarea, 0, 30)
+            origen = descomprimido
+        tarea.reportar(30, "Verificando el esquema...")
+        if verificar_respaldo(origen):
+            tarea.reportar(30, "Actualizando el esquema de la copia...")
+            _copiar_paginas(origen, migrado, tarea, 30, 50)
+            with closing(sqlite3.connect(migrado)) as conexion:
+                descartadas = migrar_esquema(conexion)
+            origen = migrado
+        tarea.verificar_cancelacion()
+        tarea.reportar(50, "Restaurando la base de datos...")
+        _copiar_paginas(origen, ruta_bd, tarea, 50, 100)
+        with closing(sqlite3.connect(ruta_bd)) as conexion:
+            migrar_esquema(conexion)
+            renovar_identificador(conexion)
+    finally:
+        _eliminar_archivos(descomprimido, migrado)
+    return descartadas
+
+def migrar_esquema(conexion):
+    """Crea las tablas e índices que falten y, si la base de datos guarda los inscritos como JSON
+    (columna `datos_fila`), los pasa a columnas tipadas en una sola transacción. Se puede llamar
+    varias veces sin efecto. Devuelve las cédulas de los inscritos JSON descartados por repetidos (ver
+    _descartar_cedulas_repetidas), casi siempre una lista vacía."""
+    cursor = conexion.cursor()
+    columnas_inscritos = {fila[1] for fila in cursor.execute("PRAGMA table_info(inscritos)").fetchall()}
+    migrar_json = 'datos_fila' in columnas_inscritos
+    descartadas = []
+    try:
+        cursor.execute("BEGIN TRANSACTION")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS becados (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tipo_cedula TEXT NOT NULL CHECK(tipo_cedula IN ('V', 'E', 'P')),
+                cedula INTEGER NOT NULL UNIQUE,
+                nombres TEXT NOT NULL,
+                apellidos TEXT NOT NULL,
+                carrera TEXT NOT NULL,
+                semestre INTEGER NOT NULL CHECK(semestre BETWEEN 0 AND 9)
+            )
+        ''')
+        if migrar_json:
+            cursor.execute("ALTER TABLE inscritos RENAME TO inscritos_json")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS inscritos (
+                id INTEGER PRIMARY KEY,
+                tipo_cedula TEXT NOT NULL CHECK(tipo_cedula IN ('V', 'E', 'P')),
+                cedula INTEGER NOT NULL,
+                nombres TEXT NOT NULL,
+                apellidos TEXT NOT NULL,
+                carrera TEXT NOT NULL,
+                semestre INTEGER NOT NULL CHECK(semestre BETWEEN 0 AND 9)
+            )
+        ''')
+        # Columnas del archivo que no son obligatorias: una fila por columna y bloque de inscritos, con sus
+        # valores como una lista JSON en el orden de inscritos.id. Los inscritos siempre se reemplazan completos.
+        columnas_extras = {fila[1] for fila in cursor.execute("PRAGMA table_info(inscritos_extras)").fetchall()}
+        if columnas_extras and 'bloque' not in columnas_extras:
+            cursor.execute("ALTER TABLE inscritos_extras RENAME TO inscritos_extras_columnas")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS inscritos_extras (
+                encabezado TEXT NOT NULL,
+                bloque INTEGER NOT NULL,
+                valores TEXT NOT NULL,
+                PRIMARY KEY (encabezado, bloque)
+            )
+        ''')
+        if columnas_extras and 'bloque' not in columnas_extras:
+            cursor.execute("INSERT INTO inscritos_extras (encabezado, bloque, valores) SELECT encabezado, 0, valores FROM inscritos_extras_columnas")
+            cursor.execute("DROP TABLE inscritos_extras_columnas")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS inscritos_encabezados (
+                id INTEGER PRIMARY KEY,
+                encabezados TEXT NOT NULL
+            )
+        ''')
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_inscritos_cedula ON inscritos (cedula)")
+        # Marca de cambios con la que se valida la instantánea de la sesión: un identificador al azar de esta
+        # base de datos y un contador que suben los disparadores. Los inscritos siempre se reemplazan junto con
+        # su fila de encabezados, así que basta con vigilar esa tabla (un disparador por cada fila de inscritos
+        # haría las importaciones más del doble de lentas).
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS metadatos (
+                clave TEXT PRIMARY KEY,
+                valor INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute("INSERT OR IGNORE INTO metadatos (clave, valor) VALUES ('identificador', abs(random())), ('cambios', 0)")
+        for tabla in ('becados', 'inscritos_encabezados'):
+            for evento in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f"CREATE TRIGGER IF NOT EXISTS contar_{evento.lower()}_{tabla} AFTER {evento} ON {tabla} "
+                               "BEGIN UPDATE metadatos SET valor = valor + 1 WHERE clave = 'cambios'; END")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_inscritos_carrera_semestre ON inscritos (carrera, semestre)")
+        if migrar_json:
+            res_encabezados = cursor.execute("SELECT encabezados FROM inscritos_encabezados WHERE id = 1").fetchone()
+            filas = [json.loads(datos) for (datos,) in cursor.execute("SELECT datos_fila FROM inscritos_json ORDER BY id").fetchall()]
+            filas, descartadas = _descartar_cedulas_repetidas(filas)
+            if res_encabezados:
+                guardar_inscritos(cursor, json.loads(res_encabezados[0]), filas)
+            cursor.execute("DROP TABLE inscritos_json")
+        conexion.commit()
+    except Exception:
+        conexion.rollback()
+        raise
+    return descartadas
+
+def _descartar_cedulas_repetidas(filas):
+    """Antes las cédulas repetidas se buscaban comparando el texto, así que los inscritos JSON pueden tener
+    '0123456' y '123456', que ahora son la misma cédula y no caben en el índice único. Devuelve (filas con
+    solo la primera de cada cédula, cédulas de las filas descartadas tal como estaban guardadas)."""
+    vistas, conservadas, descartadas = set(), [], []
+    for fila in filas:
+        clave = _clave_cedula(str(fila.get("Cédula", "")))
+        if clave is not None and clave in vistas:
+            descartadas.append(str(fila.get("Cédula")))
+            continue
+        vistas.add(clave)
+        conservadas.append(fila)
+    return conservadas, descartadas
+
+def leer_marca_cambios(cursor):
+    """Devuelve [identificador, contador de cambios] de la base de datos, o None si todavía no tiene la tabla
+    metadatos (p. ej. una copia antigua recién restaurada, hasta el próximo arranque)."""
+    try:
+        valores = {clave: valor for clave, valor in cursor.execute("SELECT clave, valor FROM metadatos").fetchall()}
+    except sqlite3.OperationalError:
+        return None
+    if 'identificador' not in valores or 'cambios' not in valores:
+        return None
+    return [valores['identificador'], valores['cambios']]
+
+def renovar_identificador(conexion):
+    """Da a la base de datos un identificador nuevo al azar. Al restaurar una copia, el contador de cambios
+    vuelve a un valor anterior; con el mismo identificador, los cambios siguientes podrían llegar a la marca
+    de una instantánea guardada antes de restaurar y hacerla pasar por vigente."""
+    with conexion:
+        conexion.execute("UPDATE metadatos SET valor = abs(random()) WHERE clave = 'identificador'")
+
+def borrar_inscritos(cursor):
+    """Borra todos los inscritos, sus columnas adicionales y sus encabezados."""
+    cursor.execute("DELETE FROM inscritos")
+    cursor.execute("DELETE FROM inscritos_extras")
+    cursor.execute("DELETE FROM inscritos_encabezados")
+
+def guardar_inscritos(cursor, encabezados, filas):
+    """Reemplaza los inscritos guardados. `filas` son diccionarios {encabezado: valor} ya validados. No
+    confirma la transacción."""
+    borrar_inscritos(cursor)
+    guardar_encabezados_inscritos(cursor, encabezados)
+    if filas:
+        insertar_bloque_inscritos(cursor, pd.DataFrame(filas, columns=list(encabezados)), 1, 0)
+
+def guardar_encabezados_inscritos(cursor, encabezados):
+    cursor.execute("INSERT INTO inscritos_encabezados (id, encabezados) VALUES (1, ?)", (json.dumps(list(encabezados)),))
+
+def insertar_bloque_inscritos(cursor, df, primer_id, bloque):
+    """Agrega las filas validadas de `df` (columnas = encabezados del archivo) como inscritos con ids
+    consecutivos desde `primer_id`, y cada columna adicional como una sola lista en inscritos_extras con
+    el número de `bloque`. Devuelve las filas como las devolvería leer_inscritos()."""
+    columnas = insertar_columnas_inscritos(cursor, df, primer_id, bloque)
+    claves = list(columnas)
+    return [dict(zip(claves, valores)) for valores in zip(*columnas.values())]
+
+def insertar_columnas_inscritos(cursor, df, primer_id, bloque):
+    """Como insertar_bloque_inscritos(), pero devuelve las filas por columnas: {encabezado: valores}, con
+    los campos obligatorios primero."""
+    campos = columnas_estudiantes(df)
+    insertar_filas(cursor, 'inscritos', {'id': range(primer_id, primer_id + len(df)), **campos})
+    columnas = {"T. Cédula": campos['tipo_cedula'], "Cédula": [str(c) for c in campos['cedula']],
+                "Nombres": campos['nombres'], "Apellidos": campos['apellidos'], "Carrera": campos['carrera'],
+                "Semestre": [SEMESTRES_POR_NUMERO[s] for s in campos['semestre']]}
+    for enc in df.columns:
+        if enc not in ENCABEZADOS_REQUERIDOS:
+            columnas[enc] = df[enc].tolist()
+            cursor.execute("INSERT INTO inscritos_extras (encabezado, bloque, valores) VALUES (?, ?, ?)",
+                           (enc, bloque, json.dumps(columnas[enc])))
+    return columnas
+
+def columnas_estudiantes(df):
+    """Campos obligatorios de las filas validadas de `df` en su forma canónica para la base de datos:
+    {campo: lista}, con cédula y semestre como enteros y el tipo de cédula en mayúsculas."""
+    return {
+        'tipo_cedula': df["T. Cédula"].astype(str).str.strip().str.upper().tolist(),
+        'cedula': df["Cédula"].astype(str).str.strip().astype('int64').tolist(),
+        'nombres': df["Nombres"].tolist(),
+        'apellidos': df["Apellidos"].tolist(),
+        'carrera': df["Carrera"].tolist(),
+        'semestre': df["Semestre"].astype(str).str.strip().str.upper().map(SEMESTRES).tolist(),
+    }
+
+class ErrorCedulaRepetida(sqlite3.IntegrityError):
+    """Una cédula viola la restricción UNIQUE al guardar. `cedula` es la cédula en conflicto."""
+
+    titulo = "Cédula Repetida"
+
+    def __init__(self, cedula):
+        super().__init__(f"La cédula {cedula} ya está registrada.")
+        self.cedula = cedula
+
+def insertar_filas(cursor, tabla, columnas):
+    """Inserta en `tabla` las filas formadas por `columnas` ({campo: valores ya tipados}, todas del mismo
+    largo) con un solo executemany, dentro de la transacción abierta. Si una cédula viola la restricción
+    UNIQUE se deshace solo este lote y se lanza ErrorCedulaRepetida con la primera cédula en conflicto,
+    repetida dentro del lote o ya guardada en la tabla."""
+    campos = list(columnas)
+    cursor.execute("SAVEPOINT insertar_filas")
+    try:
+        cursor.executemany(f"INSERT INTO {tabla} ({', '.join(campos)}) VALUES ({', '.join('?' * len(campos))})",
+                           zip(*columnas.values()))
+    except sqlite3.IntegrityError:
+        cursor.execute("ROLLBACK TO insertar_filas")
+        cursor.execute("RELEASE insertar_filas")
+        cedula = _cedula_en_conflicto(cursor, tabla, columnas.get('cedula', []))
+        if cedula is None:
+            raise
+        raise ErrorCedulaRepetida(cedula) from None
+    cursor.execute("RELEASE insertar_filas")
+
+def _cedula_en_conflicto(cursor, tabla, cedulas, tamano_consulta=500):
+    """Primera de `cedulas` que ya está en `tabla` o en una posición anterior de la lista, o None."""
+    cedulas = pd.Series(list(cedulas), dtype=object)
+    guardadas = set()
+    for inicio in range(0, len(cedulas), tamano_consulta):
+        parte = cedulas.iloc[inicio:inicio + tamano_consulta].tolist()
+        consulta = f"SELECT cedula FROM {tabla} WHERE cedula IN ({', '.join('?' * len(parte))})"
+        guardadas.update(fila[0] for fila in cursor.execute(consulta, parte).fetchall())
+    en_conflicto = (cedulas.duplicated() | cedulas.isin(guardadas)).to_numpy()
+    return cedulas.iloc[int(np.argmax(en_conflicto))] if en_conflicto.any() else None
+
+def leer_inscritos(cursor):
+    """Devuelve (encabezados, filas) de los inscritos guardados, con cada fila como diccionario de texto
+    {encabezado: valor}, o (None, []) si no hay inscritos cargados."""
+    res_encabezados = cursor.execute("SELECT encabezados FROM inscritos_encabezados WHERE id = 1").fetchone()
+    if not res_encabezados:
+        return None, []
+    encabezados = json.loads(res_encabezados[0])
+    cursor.execute("SELECT tipo_cedula, cedula, nombres, apellidos, carrera, semestre FROM inscritos ORDER BY id")
+    filas = [{"T. Cédula": tipo_cedula, "Cédula": str(cedula), "Nombres": nombres, "Apellidos": apellidos,
+              "Carrera": carrera, "Semestre": SEMESTRES_POR_NUMERO[semestre]}
+             for tipo_cedula, cedula, nombres, apellidos, carrera, semestre in cursor.fetchall()]
+    posiciones = {}
+    for enc, valores in cursor.execute("SELECT encabezado, valores FROM inscritos_extras ORDER BY bloque").fetchall():
+        inicio = posiciones.get(enc, 0)
+        valores = json.loads(valores)
+        for fila, valor in zip(filas[inicio:inicio + len(valores)], valores):
+            fila[enc] = valor
+        posiciones[enc] = inicio + len(valores)
+    return encabezados, filas
+
+# --- Motor de Comparación ---
+def _cedula_numerica(valor):
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return np.nan
+
+def _cedulas_numericas(valores):
+    """Convierte cédulas (enteros o texto) en un arreglo float, con NaN para las que no son números."""
+    return np.fromiter(map(_cedula_numerica, valores), dtype=float, count=len(valores))
+
+class IndiceCedulas:
+    """Posición de cada cédula en un arreglo de cédulas numéricas sin repetir ni NaN, por búsqueda binaria."""
+
+    def __init__(self, cedulas):
+        self._orden = np.argsort(cedulas, kind='stable')
+        self._ordenadas = cedulas[self._orden]
+
+    @classmethod
+    def desde_arreglos(cls, orden, ordenadas):
+        """Reconstruye el índice a partir de arreglos(), sin volver a ordenar."""
+        indice = cls.__new__(cls)
+        indice._orden, indice._ordenadas = orden, ordenadas
+        return indice
+
+    def arreglos(self):
+        return self._orden, self._ordenadas
+
+    def posiciones(self, consultas):
+        """Posición en el arreglo original de cada una de `consultas`, o -1 si no está."""
+        consultas = np.asarray(consultas, dtype=float)
+        if len(self._ordenadas) == 0:
+            return np.full(len(consultas), -1, dtype=np.int64)
+        k = np.minimum(np.searchsorted(self._ordenadas, consultas), len(self._ordenadas) - 1)
+        return np.where(self._ordenadas[k] == consultas, self._orden[k], -1)
+
+class ResultadoComparacion:
+    """Resultado de cruzar becados e inscritos. Los arreglos `estado_*` tienen un código ESTADO_* por
+    fila (en el mismo orden de las listas comparadas) y `mascara_*` los bits de BITS_CAMPOS_COMPARACION
+    de los campos que no coinciden."""
+
+    def __init__(self, estado_becados, mascara_becados, estado_inscritos, mascara_inscritos, num_becados, num_inscritos,
+                 becados_no_inscritos=None, incongruentes=None):
+        self.estado_becados = estado_becados
+        self.mascara_becados = mascara_becados
+        self.estado_inscritos = estado_inscritos
+        self.mascara_inscritos = mascara_inscritos
+        self.num_becados = num_becados
+        self.num_inscritos = num_inscritos
+        if becados_no_inscritos is None:
+            becados_no_inscritos = int(np.count_nonzero(estado_becados == ESTADO_ROJO))
+        if incongruentes is None:
+            incongruentes = int(np.count_nonzero(estado_becados == ESTADO_AMARILLO))
+        self.becados_no_inscritos = becados_no_inscritos
+        self.incongruentes = incongruentes
+
+    def estados(self, tipo_tabla):
+        return self.estado_becados if tipo_tabla == 'becados' else self.estado_inscritos
+
+    def mascaras(self, tipo_tabla):
+        return self.mascara_becados if tipo_tabla == 'becados' else self.mascara_inscritos
+
+class MotorComparacion:
+    """Cruza las listas de becados e inscritos por cédula numérica con una sola unión vectorizada.
+    El resultado queda en caché hasta que cambia la versión de alguna de las dos listas; el índice
+    de cédulas de inscritos se conserva mientras no cambien los inscritos."""
+
+    def __init__(self):
+        self._versiones = None
+        self._resultado = None
+        self._version_indice = None
+        self._indice_inscritos = None
+
+    def comparar(self, becados, inscritos, versiones):
+        if versiones != self._versiones or self._resultado is None:
+            if versiones[1] != self._version_indice or self._indice_inscritos is None:
+                self._indice_inscritos = self._indexar_inscritos(inscritos)
+                self._version_indice = versiones[1]
+            self._resultado = self._calcular(becados, inscritos, self._indice_inscritos)
+            self._versiones = versiones
+        return self._resultado
+
+    def aplicar_cambio_becado(self, becados, inscritos, fila, cedula_anterior, versiones_previas, versiones):
+        """Actualiza el resultado en caché tras el alta, edición o baja del becado en la posición `fila`
+        (ya aplicada en `becados`), recalculando solo las filas con la cédula anterior y la nueva en
+        ambas listas y ajustando los contadores por diferencia. `cedula_anterior` es None en un alta;
+        una baja se reconoce porque `becados` tiene una fila menos que el resultado anterior. Devuelve las
+        filas de inscritos recalculadas. Si no hay un resultado vigente para `versiones_previas`, no hace
+        nada, devuelve None y el próximo comparar() calcula todo."""
+        resultado = self._resultado
+        if resultado is None or versiones_previas != self._versiones or versiones[1] != self._version_indice:
+            return None
+        cedulas_inscritos = self._indice_inscritos[0]
+        estado_becados, mascara_becados = resultado.estado_becados, resultado.mascara_becados
+        estado_inscritos, mascara_inscritos = resultado.estado_inscritos.copy(), resultado.mascara_inscritos.copy()
+        num_becados = resultado.num_becados
+        no_inscritos, incongruentes = resultado.becados_no_inscritos, resultado.incongruentes
+        filas_recalculadas = [np.empty(0, dtype=np.int64)]
+        if cedula_anterior is not None:
+            filas = np.flatnonzero(cedulas_inscritos == _cedulas_numericas([cedula_anterior])[0])
+            estado_inscritos[filas], mascara_inscritos[filas] = ESTADO_ROJO, 0
+            filas_recalculadas.append(filas)
+        if len(becados) < len(estado_becados):
+            estado_anterior = estado_becados[fila]
+            estado_becados, mascara_becados = np.delete(estado_becados, fila), np.delete(mascara_becados, fila)
+            num_becados -= 1
+        else:
+            if len(becados) > len(estado_becados):
+                estado_anterior = None
+                estado_becados = np.append(estado_becados, np.int8(ESTADO_ROJO))
+                mascara_becados = np.append(mascara_becados, np.uint8(0))
+                num_becados += 1
+            else:
+                estado_anterior = estado_becados[fila]
+                estado_becados, mascara_becados = estado_becados.copy(), mascara_becados.copy()
+            estado, mascara, filas = self._comparar_becado(becados[fila], inscritos, self._indice_inscritos)
+            estado_becados[fila], mascara_becados[fila] = estado, mascara
+            estado_inscritos[filas], mascara_inscritos[filas] = estado, mascara
+            filas_recalculadas.append(filas)
+            no_inscritos += estado == ESTADO_ROJO
+            incongruentes += estado == ESTADO_AMARILLO
+        no_inscritos -= estado_anterior == ESTADO_ROJO
+        incongruentes -= estado_anterior == ESTADO_AMARILLO
+        self._resultado = ResultadoComparacion(estado_becados, mascara_becados, estado_inscritos, mascara_inscritos,
+                                               num_becados, resultado.num_inscritos, int(no_inscritos), int(incongruentes))
+        self._versiones = versiones
+        return np.unique(np.concatenate(filas_recalculadas))
+
+    def comparar_con_indice(self, becados, inscritos, versiones):
+        """Como comparar(), pero devuelve también el índice de cédulas de inscritos
+        (cédulas numéricas por fila, filas válidas, IndiceCedulas), para guardarlo en la instantánea de sesión."""
+        return self.comparar(becados, inscritos, versiones), self._indice_inscritos
+
+    def restaurar(self, resultado, indice_inscritos, versiones):
+        """Toma como vigentes para `versiones` un resultado y un índice de cédulas de inscritos ya calculados
+        (los de la instantánea de la sesión anterior)."""
+        self._resultado, self._versiones = resultado, versiones
+        self._indice_inscritos, self._version_indice = indice_inscritos, versiones[1]
+
+    @staticmethod
+    def _comparar_becado(becado, inscritos, indice_inscritos):
+        """Estado, máscara de campos distintos y filas de inscritos con la cédula de un solo becado."""
+        cedulas_inscritos, filas_validas, indice = indice_inscritos
+        cedula = _cedulas_numericas([becado.get('cedula')])[0]
+        posicion = indice.posiciones([cedula])[0]
+        if posicion < 0:
+            return ESTADO_ROJO, 0, np.empty(0, dtype=np.int64)
+        inscrito = inscritos[filas_validas[posicion]]
+        mascara = 0
+        for h, clave in CAMPOS_COMPARACION.items():
+            if h == "Semestre":
+                distinto = becado.get(clave) != SEMESTRES.get(str(inscrito.get(h)).upper(), -1)
+            else:
+                distinto = str(becado.get(clave)) != str(inscrito.get(h))
+            if distinto:
+                mascara |= BITS_CAMPOS_COMPARACION[h]
+        estado = ESTADO_AMARILLO if mascara else ESTADO_VERDE
+        return estado, mascara, np.flatnonzero(cedulas_inscritos == cedula)
+
+    @staticmethod
+    def _indexar_inscritos(inscritos):
+        """Devuelve (cédulas numéricas por fila, filas válidas, índice de cédula a posición en filas válidas)."""
+        cedulas_inscritos = _cedulas_numericas([i.get('Cédula') or None for i in inscritos])
+        # Igual que un diccionario por cédula: si una cédula se repite, cuenta la última fila.
+        _, ultimas = np.unique(cedulas_inscritos[::-1], return_index=True)
+        validos = np.zeros(len(inscritos), dtype=bool)
+        validos[len(inscritos) - 1 - ultimas] = True
+        validos &= ~np.isnan(cedulas_inscritos)
+        return cedulas_inscritos, np.flatnonzero(validos), IndiceCedulas(cedulas_inscritos[validos])
+
+    @staticmethod
+    def _calcular(becados, inscritos, indice_inscritos):
+        cedulas_inscritos, filas_validas, indice = indice_inscritos
+        cedulas_becados = _cedulas_numericas([b.get('cedula') for b in becados])
+        posiciones = indice.posiciones(cedulas_becados)
+        en_ambas = posiciones >= 0
+        filas_becado = np.flatnonzero(en_ambas).tolist()
+        filas_inscrito = filas_validas[posiciones[en_ambas]].tolist()
+        mascara_pares = np.zeros(len(filas_becado), dtype=np.uint8)
+        for h, clave in CAMPOS_COMPARACION.items():
+            if h == "Semestre":
+                valores_becado = np.array([becados[k].get(clave) for k in filas_becado], dtype=object)
+                valores_inscrito = np.array([SEMESTRES.get(str(inscritos[k].get(h)).upper(), -1) for k in filas_inscrito], dtype=object)
+            else:
+                valores_becado = np.array([str(becados[k].get(clave)) for k in filas_becado], dtype=object)
+                valores_inscrito = np.array([str(inscritos[k].get(h)) for k in filas_inscrito], dtype=object)
+            distintos = (valores_becado != valores_inscrito).astype(bool)
+            mascara_pares |= distintos.astype(np.uint8) * np.uint8(BITS_CAMPOS_COMPARACION[h])
+        estado_becados = np.full(len(becados), ESTADO_ROJO, dtype=np.int8)
+        estado_becados[en_ambas] = np.where(mascara_pares != 0, ESTADO_AMARILLO, ESTADO_VERDE)
+        mascara_becados = np.zeros(len(becados), dtype=np.uint8)
+        mascara_becados[en_ambas] = mascara_pares
+        # Cada inscrito toma el estado del becado con su misma cédula.
+        por_cedula = IndiceCedulas(cedulas_becados[en_ambas]).posiciones(cedulas_inscritos)
+        emparejados = por_cedula >= 0
+        mascara_inscritos = np.zeros(len(inscritos), dtype=np.uint8)
+        mascara_inscritos[emparejados] = mascara_pares[por_cedula[emparejados]]
+        estado_inscritos = np.full(len(inscritos), ESTADO_ROJO, dtype=np.int8)
+        estado_inscritos[emparejados] = np.where(mascara_inscritos[emparejados] != 0, ESTADO_AMARILLO, ESTADO_VERDE)
+        return ResultadoComparacion(estado_becados, mascara_becados, estado_inscritos, mascara_inscritos,
+                                    num_becados=len(np.unique(cedulas_becados[~np.isnan(cedulas_becados)])), num_inscritos=len(filas_validas))
+
+# --- Índice de Búsqueda ---
+def _argsort_estable(claves):
+    """argsort estable de enteros no negativos menores a 2**32. NumPy usa radix sort para claves de
+    16 bits, así que las claves grandes se ordenan en dos pasadas (16 bits bajos y luego altos)."""
+    if len(claves) == 0 or claves.max() < 2 ** 16:
+        return np.argsort(claves.astype(np.uint16), kind='stable')
+    orden = np.argsort((claves & 0xFFFF).astype(np.uint16), kind='stable')
+    return orden[np.argsort((claves[orden] >> 16).astype(np.uint16), kind='stable')]
+
+class IndiceTrigramas:
+    """Índice invertido de trigramas sobre el texto normalizado de cada fila.
+
+    Las listas de filas por trigrama se guardan en formato compacto (un solo arreglo int32 de filas
+    y un arreglo de inicios por trigrama). Las filas agregadas o editadas después de construir el
+    índice van a una capa incremental en memoria, que se integra reconstruyendo el índice cuando
+    crece demasiado."""
+
+    def __init__(self, textos=()):
+        self.construir(textos)
+
+    def construir(self, textos):
+        self._total = len(textos)
+        self._alfabeto = {}
+        self._claves = np.empty(0, dtype=np.int64)
+        self._inicios = np.zeros(1, dtype=np.int64)
+        self._filas = np.empty(0, dtype=np.int32)
+        self._invalidas = set()
+        self._extra = {}
+        self._trigramas_extra = {}
+        if not textos:
+            return
+        # Se procesa por bloques de filas para que los arreglos temporales no crezcan con el total: una
+        # pasada reúne el alfabeto y otra obtiene, por bloque, los pares (trigrama, fila) únicos ordenados
+        # por trigrama, que luego se copian a su lugar en las listas finales sin volver a ordenar todo.
+        bloques = [textos[i:i + TAMANO_BLOQUE_INDICE] for i in range(0, len(textos), TAMANO_BLOQUE_INDICE)]
+        presentes = np.unique(np.concatenate([np.flatnonzero(np.bincount(self._puntos(bloque))) for bloque in bloques]))
+        tabla = np.zeros(int(presentes[-1]) + 1, dtype=np.uint32)
+        tabla[presentes] = np.arange(len(presentes))
+        self._alfabeto = {chr(p): i for i, p in enumerate(presentes.tolist())}
+        base = len(presentes)
+        tipo = np.uint32 if base ** 3 < 2 ** 32 else np.int64
+        grupos, filas_por_bloque, desde = [], [], 0
+        for bloque in bloques:
+            puntos = self._puntos(bloque)
+            simbolos = tabla[puntos].astype(tipo)
+            filas = np.repeat(np.arange(desde, desde + len(bloque), dtype=np.int32),
+                              np.fromiter(map(len, bloque), dtype=np.int64, count=len(bloque)) + 1)
+            validos = (puntos[:-2] != 0) & (puntos[1:-1] != 0) & (puntos[2:] != 0)
+            trigramas = ((simbolos[:-2] * base + simbolos[1:-1]) * base + simbolos[2:])[validos]
+            filas = filas[:-2][validos]
+            del puntos, simbolos, validos
+            orden = _argsort_estable(trigramas) if tipo is np.uint32 else np.lexsort((filas, trigramas))
+            trigramas, filas = trigramas[orden], filas[orden]
+            unicos = np.concatenate(([True], (trigramas[1:] != trigramas[:-1]) | (filas[1:] != filas[:-1])))
+            trigramas, filas = trigramas[unicos], filas[unicos]
+            inicios = np.flatnonzero(np.concatenate(([True], trigramas[1:] != trigramas[:-1])))
+            grupos.append((trigramas[inicios], np.diff(np.append(inicios, len(trigramas)))))
+            filas_por_bloque.append(filas)
+            desde += len(bloque)
+        self._claves = np.unique(np.concatenate([claves for claves, _ in grupos]))
+        posiciones = [np.searchsorted(self._claves, claves) for claves, _ in grupos]
+        conteos = np.zeros(len(self._claves), dtype=np.int64)
+        for posicion, (_, cuenta) in zip(posiciones, grupos):
+            conteos[posicion] += cuenta
+        self._inicios = np.concatenate(([0], np.cumsum(conteos)))
+        self._filas = np.empty(int(self._inicios[-1]), dtype=np.int32)
+        # Los bloques van en orden de fila, así que las filas de cada trigrama quedan ordenadas.
+        siguiente = self._inicios[:-1].copy()
+        for k, (posicion, (_, cuenta)) in enumerate(zip(posiciones, grupos)):
+            destino = np.repeat(siguiente[posicion] - (np.cumsum(cuenta) - cuenta), cuenta) + np.arange(int(cuenta.sum()))
+            self._filas[destino] = filas_por_bloque[k]
+            filas_por_bloque[k] = None
+            siguiente[posicion] += cuenta
+        self._base = base
+
+    @classmethod
+    def desde_arreglos(cls, total, puntos, claves, inicios, filas):
+        """Reconstruye un índice compacto a partir de arreglos(), sin recorrer los textos."""
+        indice = cls()
+        indice._total = total
+        indice._alfabeto = {chr(p): i for i, p in enumerate(puntos.tolist())}
+        indice._base = len(puntos)
+        indice._claves, indice._inicios, indice._filas = claves, inicios, filas
+        return indice
+
+    def arreglos(self):
+        """Arreglos del índice compacto (sin la capa incremental): códigos de los caracteres del alfabeto,
+        trigramas, inicio de cada lista y filas."""
+        puntos = np.array(sorted(ord(c) for c in self._alfabeto), dtype=np.uint32)
+        return {'puntos': puntos, 'claves': self._claves, 'inicios': self._inicios, 'filas': self._filas}
+
+    def es_compacto(self):
+        """True si no hay filas en la capa incremental, es decir, si arreglos() describe todo el índice."""
+        return not self._trigramas_extra and not self._invalidas
+
+    @staticmethod
+    def _puntos(textos):
+        """Códigos Unicode de las filas unidas, cada una seguida de SEPARADOR_LOTE."""
+        return np.frombuffer((SEPARADOR_LOTE.join(textos) + SEPARADOR_LOTE).encode('utf-32-le'), dtype=np.uint32)
+
+    @staticmethod
+    def trigramas(texto):
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+    def requiere_reconstruccion(self):
+        return len(self._trigramas_extra) > max(MINIMO_FILAS_RECONSTRUCCION_INDICE, self._total // 10)
+
+    def agregar(self, texto):
+        """Agrega una fila al final del índice."""
+        self._total += 1
+        self._agregar_extra(self._total - 1, texto)
+
+    def actualizar(self, fila, texto):
+        self._quitar_extra(fila)
+        self._invalidas.add(fila)
+        self._agregar_extra(fila, texto)
+
+    def eliminar(self, fila):
+        """Quita una fila y renumera las siguientes para que coincidan con las posiciones del modelo."""
+        self._quitar_extra(fila)
+        self._total -= 1
+        mantener = self._filas != fila
+        if not mantener.all():
+            quitadas_antes = np.concatenate(([0], np.cumsum(~mantener)))
+            self._inicios = self._inicios - quitadas_antes[self._inicios]
+            self._filas = self._filas[mantener]
+        self._filas = self._filas - (self._filas > fila)
+        self._invalidas = {f - (f > fila) for f in self._invalidas if f != fila}
+        self._trigramas_extra = {f - (f > fila): t for f, t in self._trigramas_extra.items()}
+        self._extra = {g: {f - (f > fila) for f in filas} for g, filas in self._extra.items()}
+
+    def _agregar_extra(self, fila, texto):
+        trigramas = self.trigramas(texto)
+        self._trigramas_extra[fila] = trigramas
+        for g in trigramas:
+            self._extra.setdefault(g, set()).add(fila)
+
+    def _quitar_extra(self, fila):
+        for g in self._trigramas_extra.pop(fila, ()):
+            filas = self._extra[g]
+            filas.discard(fila)
+            if not filas:
+                del self._extra[g]
+
+    def _filas_con(self, trigrama):
+        partes = []
+        simbolos = [self._alfabeto.get(c) for c in trigrama]
+        if len(self._claves) and None not in simbolos:
+            clave = (simbolos[0] * self._base + simbolos[1]) * self._base + simbolos[2]
+            k = int(np.searchsorted(self._claves, clave))
+            if k < len(self._claves) and self._claves[k] == clave:
+                filas = self._filas[self._inicios[k]:self._inicios[k + 1]]
+                if self._invalidas:
+                    filas = filas[~np.isin(filas, list(self._invalidas))]
+                partes.append(filas)
+        if trigrama in self._extra:
+            partes.append(np.fromiter(self._extra[trigrama], dtype=np.int32))
+        if not partes:
+            return np.empty(0, dtype=np.int32)
+        return partes[0] if len(partes) == 1 else np.concatenate(partes)
+
+    def candidatos(self, palabras):
+        """Devuelve las filas (ordenadas) que contienen todos los trigramas de las palabras, o None si
+        ninguna palabra tiene al menos tres caracteres. El resultado aún debe verificarse con una
+        búsqueda de subcadena, porque compartir trigramas no garantiza contener la palabra."""
+        trigramas = set()
+        for palabra in palabras:
+            trigramas |= self.trigramas(palabra)
+        if not trigramas:
+            return None
+        listas = sorted((self._filas_con(g) for g in trigramas), key=len)
+        resultado = np.sort(listas[0])
+        for filas in listas[1:]:
+            if len(resultado) == 0:
+                break
+            resultado = np.intersect1d(resultado, filas, assume_unique=True)
+        return resultado
+
+def filas_de_muestra(total_filas, muestra=MUESTRA_ANCHO_COLUMNAS):
+    """Hasta `muestra` posiciones repartidas entre 0 y total_filas - 1 (incluida la última)."""
+    if total_filas <= muestra:
+        return range(total_filas)
+    paso = total_filas / muestra
+    return sorted({int(i * paso) for i in range(muestra)} | {total_filas - 1})
+
+# --- Instantánea de Sesión ---
+class ColumnaTexto:
+    """Columna de texto de solo lectura guardada como un bloque UTF-8 y el desplazamiento donde empieza
+    cada valor. Cada celda se decodifica al pedirla, así que puede leerse directo de un archivo mapeado
+    en memoria sin crear un objeto por fila."""
+
+    def __init__(self, datos, inicios):
+        self._datos, self._inicios = datos, inicios
+        self._bytes = memoryview(np.asarray(datos))
+
+    @staticmethod
+    def codificar(valores):
+        """Devuelve los arreglos (datos, inicios) de una secuencia de textos."""
+        if isinstance(valores, ColumnaTexto):
+            return valores._datos, valores._inicios
+        partes = [v.encode('utf-8') for v in valores]
+        inicios = np.zeros(len(partes) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, partes), dtype=np.int64, count=len(partes)), out=inicios[1:])
+        return np.frombuffer(b"".join(partes), dtype=np.uint8), inicios
+
+    def __len__(self):
+        return len(self._inicios) - 1
+
+    def __getitem__(self, fila):
+        if isinstance(fila, slice):
+            return [self[i] for i in range(*fila.indices(len(self)))]
+        if fila < 0:
+            fila += len(self)
+        if not 0 <= fila < len(self):
+            raise IndexError(fila)
+        return str(self._bytes[self._inicios[fila]:self._inicios[fila + 1]], 'utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class FilasColumnares:
+    """Lista de solo lectura de filas de inscritos {encabezado: valor} que se arman al pedirlas a partir de
+    las columnas, con los campos obligatorios primero, como en leer_inscritos(). `vacias` indica, por
+    encabezado adicional, qué celdas estaban vacías en el archivo (NaN en lugar de texto)."""
+
+    def __init__(self, encabezados, columnas, vacias):
+        orden = [enc for enc in ENCABEZADOS_VISUALIZACION if enc in encabezados]
+        orden += [enc for enc in encabezados if enc not in ENCABEZADOS_REQUERIDOS]
+        self._campos = [(enc, columnas[encabezados.index(enc)], vacias.get(enc)) for enc in orden]
+        self._total = len(columnas[0]) if columnas else 0
+        self.vacias = vacias
+
+    def __len__(self):
+        return self._total
+
+    def __getitem__(self, fila):
+        if isinstance(fila, slice):
+            return [self[i] for i in range(*fila.indices(self._total))]
+        if fila < 0:
+            fila += self._total
+        if not 0 <= fila < self._total:
+            raise IndexError(fila)
+        return {enc: np.nan if vacias is not None and vacias[fila] else columna[fila] for enc, columna, vacias in self._campos}
+
+    def __iter__(self):
+        return (self[i] for i in range(self._total))
+
+class InstantaneaSesion:
+    """Copia en disco de los inscritos tal como los usa la ventana (columnas, texto de búsqueda, códigos de
+    los filtros e índice de trigramas) y de la última comparación, para abrir el programa sin volver a leer
+    ni preparar todos los inscritos. Se guarda al cerrar como archivos .npy que luego se abren mapeados en
+    memoria, y solo se usa si la marca de cambios de la base de datos es la misma que al guardarla. Cada
+    guardado usa nombres de archivo nuevos, porque los de la sesión en curso pueden seguir mapeados (y en
+    Windows no se pueden reemplazar ni borrar). Un fallo de la instantánea nunca impide arrancar."""
+
+    def __init__(self, directorio):
+        self.directorio = Path(directorio)
+
+    def _leer_manifiesto(self):
+        try:
+            with open(self.directorio / 'manifiesto.json', encoding='utf-8') as f:
+                manifiesto = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifiesto if isinstance(manifiesto, dict) and manifiesto.get('version') == VERSION_INSTANTANEA else None
+
+    def vigente(self, marca):
+        """True si la instantánea guardada corresponde a la marca de cambios `marca`."""
+        manifiesto = self._leer_manifiesto()
+        return marca is not None and manifiesto is not None and manifiesto['marca'] == marca
+
+    def cargar(self, marca):
+        """Devuelve (encabezados, partes del modelo para cargar_preparadas(), filas, (resultado de la
+        comparación, índice de cédulas de inscritos)) si la instantánea corresponde a `marca`, o None."""
+        manifiesto = self._leer_manifiesto()
+        if marca is None or manifiesto is None or manifiesto['marca'] != marca:
+            return None
+        generacion = manifiesto['generacion']
+        self._borrar_archivos(conservar=generacion)
+        try:
+            a = {nombre: np.load(self.directorio / f"{nombre}-{generacion}.npy", mmap_mode='r', allow_pickle=False)
+                 for nombre in manifiesto['arreglos']}
+            encabezados, total = manifiesto['encabezados'], manifiesto['total']
+            columnas = [ColumnaTexto(a[f'columna_{j}'], a[f'inicios_{j}']) for j in range(len(encabezados))]
+            cedulas = ColumnaTexto(a['cedulas'], a['inicios_cedulas'])
+            busqueda = str(memoryview(np.asarray(a['busqueda'])), 'utf-8').split(SEPARADOR_LOTE) if total else []
+            codigos = {enc: a[f'codigos_{k}'] for k, enc in enumerate(COLUMNAS_CODIFICADAS)}
+            indice = IndiceTrigramas.desde_arreglos(total, a['indice_puntos'], a['indice_claves'], a['indice_inicios'], a['indice_filas'])
+            vacias = {enc: a[f'vacias_{j}'] for j, enc in enumerate(encabezados) if f'vacias_{j}' in a}
+            resultado = ResultadoComparacion(a['estado_becados'], a['mascara_becados'], a['estado_inscritos'],
+                                             a['mascara_inscritos'], **manifiesto['comparacion'])
+            indice_cedulas = (a['cedulas_numericas'], a['filas_validas'],
+                              IndiceCedulas.desde_arreglos(a['cedulas_orden'], a['cedulas_ordenadas']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return (encabezados, (columnas, cedulas, busqueda, codigos, indice),
+                FilasColumnares(encabezados, columnas, vacias), (resultado, indice_cedulas))
+
+    def guardar(self, marca, encabezados, partes_modelo, filas, comparacion):
+        """Guarda la instantánea de los inscritos (`partes_modelo` como las da datos_preparados() y `filas`
+        como todos_los_inscritos) y de `comparacion` ((resultado, índice de cédulas de inscritos))."""
+        columnas, cedulas, busqueda, codigos, indice = partes_modelo
+        resultado, (cedulas_numericas, filas_validas, indice_cedulas) = comparacion
+        if not indice.es_compacto():
+            indice = IndiceTrigramas(busqueda)
+        arreglos = {}
+        for j, enc in enumerate(encabezados):
+            arreglos[f'columna_{j}'], arreglos[f'inicios_{j}'] = ColumnaTexto.codificar(columnas[j])
+            if enc in ENCABEZADOS_REQUERIDOS:
+                continue
+            if isinstance(filas, FilasColumnares):
+                arreglos[f'vacias_{j}'] = filas.vacias[enc]
+            else:
+                arreglos[f'vacias_{j}'] = np.fromiter((not isinstance(f.get(enc), str) for f in filas), dtype=bool, count=len(filas))
+        arreglos['cedulas'], arreglos['inicios_cedulas'] = ColumnaTexto.codificar(cedulas)
+        arreglos['busqueda'] = np.frombuffer(SEPARADOR_LOTE.join(busqueda).encode('utf-8'), dtype=np.uint8)
+        for k, enc in enumerate(COLUMNAS_CODIFICADAS):
+            arreglos[f'codigos_{k}'] = codigos[enc]
+        for nombre, arreglo in indice.arreglos().items():
+            arreglos[f'indice_{nombre}'] = arreglo
+        arreglos.update(estado_becados=resultado.estado_becados, mascara_becados=resultado.mascara_becados,
+                        estado_inscritos=resultado.estado_inscritos, mascara_inscritos=resultado.mascara_inscritos,
+                        cedulas_numericas=cedulas_numericas, filas_validas=filas_validas)
+        arreglos['cedulas_orden'], arreglos['cedulas_ordenadas'] = indice_cedulas.arreglos()
+        anterior = self._leer_manifiesto()
+        generacion = anterior['generacion'] + 1 if anterior else 1
+        manifiesto = {
+            'version': VERSION_INSTANTANEA, 'marca': marca, 'generacion': generacion,
+            'encabezados': list(encabezados), 'total': len(cedulas), 'arreglos': list(arreglos),
+            'comparacion': {'num_becados': int(resultado.num_becados), 'num_inscritos': int(resultado.num_inscritos),
+                            'becados_no_inscritos': int(resultado.becados_no_inscritos),
+                            'incongruentes': int(resultado.incongruentes)},
+        }
+        temporal = self.directorio / 'manifiesto.json.tmp'
+        try:
+            self.directorio.mkdir(exist_ok=True)
+            for nombre, arreglo in arreglos.items():
+                np.save(self.directorio / f"{nombre}-{generacion}.npy", arreglo, allow_pickle=False)
+            with open(temporal, 'w', encoding='utf-8') as f:
+                json.dump(manifiesto, f)
+            os.replace(temporal, self.directorio / 'manifiesto.json')
+        except OSError:
+            return
+        self._borrar_archivos(conservar=generacion)
+
+    def borrar(self):
+        """Descarta la instantánea (p. ej. al cerrar sin inscritos, que se leen de la base de datos al instante)."""
+        try:
+            _eliminar_archivos(self.directorio / 'manifiesto.json')
+        except OSError:
+            return
+        self._borrar_archivos()
+
+    def _borrar_archivos(self, conservar=None):
+        """Borra los .npy que no son de la generación `conservar`. Los que sigan mapeados en memoria (en
+        Windows no se pueden borrar) se quedan hasta el próximo arranque."""
+        for ruta in self.directorio.glob('*.npy'):
+            if conservar is None or ruta.stem.rsplit('-', 1)[-1] != str(conservar):
+                try:
+                    ruta.unlink()
+                except OSError:
+                    pass
+
+# --- Importación de Registros ---
+class ErrorImportacion(Exception):
+    """Problema en el contenido de un archivo importado. `titulo` es el título del aviso al usuario."""
+
+    def __init__(self, titulo, mensaje):
+        super().__init__(mensaje)
+        self.titulo = titulo
+
+def _mensaje_sin_encabezados(is_csv):
+    msg = ("No se encontraron los encabezados correctos en el archivo CSV.\n\n"
+           "Asegúrese de que su archivo use como separador ',' o ';' y contenga las siguientes columnas:\n\n"
+           if is_csv else "No se encontraron los encabezados correctos en el archivo.\n\n"
+           "Asegúrese de que la primera hoja contenga las siguientes columnas:\n\n")
+    return msg + f"{', '.join(ENCABEZADOS_VISUALIZACION)}"
+
+class FormatoCSV:
+    """Lo que detectar_formato_csv() averigua de un CSV: codificación, separador, número de línea (desde 0)
+    de los encabezados, columna donde empiezan, los nombres de las columnas a partir de ella y las
+    posiciones (en `encabezados`) de las que tienen nombre en el archivo."""
+
+    def __init__(self, codificacion, separador, fila_encabezados, columna_inicio, encabezados, con_nombre):
+        self.codificacion = codificacion
+        self.separador = separador
+        self.fila_encabezados = fila_encabezados
+        self.columna_inicio = columna_inicio
+        self.encabezados = encabezados
+        self.con_nombre = con_nombre
+
+def detectar_formato_csv(ruta_archivo, tamano_muestra=TAMANO_MUESTRA_CSV):
+    """Lee solo los primeros `tamano_muestra` bytes del archivo para detectar la codificación (BOM de
+    UTF-8/UTF-16, UTF-8 o Latin-1), el separador y la línea y columna donde están los encabezados
+    requeridos. Lanza ErrorImportacion si no los encuentra."""
+    with open(ruta_archivo, 'rb') as f:
+        muestra = f.read(tamano_muestra)
+    completa = len(muestra) < tamano_muestra
+    if muestra.startswith(codecs.BOM_UTF8):
+        codificacion = 'utf-8-sig'
+    elif muestra.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        codificacion = 'utf-16'
+    else:
+        try:
+            # Decodificador incremental: la muestra puede cortar un carácter de varios bytes al final.
+            codecs.getincrementaldecoder('utf-8')().decode(muestra, final=completa)
+            codificacion = 'utf-8'
+        except UnicodeDecodeError:
+            codificacion = 'latin-1'
+    lineas = muestra.decode(codificacion, errors='ignore').split('\n')
+    if not completa:
+        lineas = lineas[:-1]
+    for numero, linea in enumerate(lineas):
+        linea = linea.rstrip('\r')
+        for separador in SEPARADORES_CSV:
+            if separador not in linea:
+                continue
+            campos = [c.strip() for c in next(csv.reader([linea], delimiter=separador))]
+            inicio = _inicio_encabezados(campos)
+            if inicio is not None:
+                con_nombre = [j for j, campo in enumerate(campos[inicio:]) if campo]
+                return FormatoCSV(codificacion, separador, numero, inicio, _nombres_unicos(campos[inicio:]), con_nombre)
+    raise ErrorImportacion("Error de Formato", _mensaje_sin_encabezados(True))
+
+def _inicio_encabezados(campos):
+    """Si `campos` (textos ya sin espacios alrededor) contiene todos los encabezados requeridos, devuelve la
+    posición del primero de ellos; si no, None."""
+    if not ENCABEZADOS_REQUERIDOS.issubset(campos):
+        return None
+    return next(j for j, c in enumerate(campos) if c in ENCABEZADOS_REQUERIDOS)
+
+def _nombres_unicos(campos):
+    """Como hace pandas con encabezados repetidos: 'Correo', 'Correo.1', ..."""
+    nombres = []
+    for campo in campos:
+        nombre, k = campo, 1
+        while nombre in nombres:
+            nombre, k = f"{campo}.{k}", k + 1
+        nombres.append(nombre)
+    return nombres
+
+def _texto_celda(valor):
+    """Texto de una celda como lo da pd.read_excel(dtype=str): números enteros sin '.0' y NaN si está vacía."""
+    if valor is None:
+        return np.nan
+    if valor.__class__ is str:
+        return valor
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
+
+def _filas_xlsx(ruta_archivo):
+    """Genera los valores de cada fila de la primera hoja de un .xlsx con openpyxl en modo de solo lectura,
+    que recorre el XML de la hoja sin construir el modelo de celdas del libro."""
+    import openpyxl
+    libro = openpyxl.load_workbook(ruta_archivo, read_only=True, data_only=True)
+    try:
+        yield from libro.worksheets[0].iter_rows(values_only=True)
+    finally:
+        libro.close()
+
+def _filas_xls(ruta_archivo):
+    """Genera los valores de cada fila de la primera hoja de un .xls con xlrd, con las celdas vacías y con
+    error como None y las fechas como datetime."""
+    import xlrd
+    libro = xlrd.open_workbook(ruta_archivo, on_demand=True)
+    try:
+        hoja = libro.sheet_by_index(0)
+        for i in range(hoja.nrows):
+            valores = hoja.row_values(i)
+            for j, tipo in enumerate(hoja.row_types(i)):
+                if tipo in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+                    valores[j] = None
+                elif tipo == xlrd.XL_CELL_DATE:
+                    valores[j] = xlrd.xldate_as_datetime(valores[j], libro.datemode)
+                elif tipo == xlrd.XL_CELL_BOOLEAN:
+                    valores[j] = bool(valores[j])
+            yield valores
+    finally:
+        libro.release_resources()
+
+def leer_hoja_excel(ruta_archivo):
+    """Lee la primera hoja de un Excel fila por fila (xlrd para .xls, openpyxl de solo lectura para el resto).
+    Busca los encabezados en las primeras FILAS_BUSQUEDA_ENCABEZADOS filas y guarda solo la zona de datos:
+    las filas de debajo, desde la columna del primer encabezado requerido hasta el último encabezado con
+    nombre. Devuelve (df, filas) como leer_archivo_registros()."""
+    filas_hoja = _filas_xls(ruta_archivo) if ruta_archivo.lower().endswith('.xls') else _filas_xlsx(ruta_archivo)
+    try:
+        for numero, fila in enumerate(filas_hoja):
+            if numero == FILAS_BUSQUEDA_ENCABEZADOS:
+                break
+            campos = ['' if v is None else _texto_celda(v).strip() for v in fila]
+            inicio = _inicio_encabezados(campos)
+            if inicio is not None:
+                break
+        else:
+            inicio = None
+        if inicio is None:
+            raise ErrorImportacion("Error de Formato", _mensaje_sin_encabezados(False))
+        fin = max(j for j, campo in enumerate(campos) if campo) + 1
+        datos = [[_texto_celda(v) for v in fila[inicio:fin]] for fila in filas_hoja]
+    finally:
+        filas_hoja.close()
+    while datos and all(v is np.nan for v in datos[-1]):
+        datos.pop()
+    return pd.DataFrame(datos, columns=_nombres_unicos(campos[inicio:fin]), dtype=object), np.arange(len(datos)) + numero + 2
+
+def _utf8_o_latin1(error):
+    """Manejador de errores de decodificación para CODIFICACION_REINTENTO_CSV: lee como Latin-1 los bytes
+    que no son UTF-8 válido, así que las filas en UTF-8 y las que están en Latin-1 se leen bien las dos."""
+    return error.object[error.start:error.end].decode('latin-1'), error.end
+
+codecs.register_error('utf8_o_latin1', _utf8_o_latin1)
+
+def _opciones_codificacion(codificacion):
+    """Argumentos de pd.read_csv para leer con `codificacion` (o CODIFICACION_REINTENTO_CSV)."""
+    if codificacion == CODIFICACION_REINTENTO_CSV:
+        return dict(encoding='utf-8', encoding_errors='utf8_o_latin1')
+    return dict(encoding=codificacion)
+
+def _opciones_lectura_csv(formato, columnas):
+    """Argumentos de pd.read_csv para leer, como texto, solo las `columnas` (posiciones en
+    formato.encabezados) de las filas de datos."""
+    return dict(sep=formato.separador, header=None, names=[formato.encabezados[i] for i in columnas], dtype=str,
+                skiprows=formato.fila_encabezados + 1, skip_blank_lines=False,
+                usecols=[formato.columna_inicio + i for i in columnas])
+
+def leer_archivo_registros(ruta_archivo):
+    """Lee los datos de estudiantes de la primera hoja de un Excel o de un CSV. Devuelve (df, filas) donde
+    `df` tiene como columnas los encabezados del archivo y solo las filas de debajo, todo como texto, y
+    `filas` es el número de cada fila en el archivo (desde 1)."""
+    if ruta_archivo.endswith('.csv'):
+        formato = detectar_formato_csv(ruta_archivo)
+        opciones = _opciones_lectura_csv(formato, range(len(formato.encabezados)))
+        try:
+            df = pd.read_csv(ruta_archivo, **_opciones_codificacion(formato.codificacion), **opciones)
+        except UnicodeDecodeError:
+            # La muestra era UTF-8 válido, pero más adelante el archivo no lo es.
+            df = pd.read_csv(ruta_archivo, **_opciones_codificacion(CODIFICACION_REINTENTO_CSV), **opciones)
+        return df, np.arange(len(df)) + formato.fila_encabezados + 2
+    return leer_hoja_excel(ruta_archivo)
+
+def leer_csv_por_bloques(ruta_archivo, formato, codificacion, tamano_bloque=TAMANO_BLOQUE_CSV):
+    """Lee el CSV descrito por `formato` de a `tamano_bloque` filas, sin cargarlo completo. Genera
+    (df, filas, fracción del archivo leída), con `df` y `filas` como en leer_archivo_registros(). Las
+    columnas sin encabezado se omiten."""
+    columnas = formato.con_nombre
+    primera_fila = formato.fila_encabezados + 2
+    with open(ruta_archivo, 'rb') as f:
+        tamano = max(os.fstat(f.fileno()).st_size, 1)
+        with pd.read_csv(f, **_opciones_codificacion(codificacion), chunksize=tamano_bloque, **_opciones_lectura_csv(formato, columnas)) as lector:
+            for df in lector:
+                yield df, np.arange(len(df)) + primera_fila, f.tell() / tamano
+                primera_fila += len(df)
+
+class ErrorValidacion(ErrorImportacion):
+    """El archivo tiene filas que no cumplen las reglas. `errores` es la tabla completa de validar_registros()."""
+
+    def __init__(self, errores):
+        super().__init__("Datos Inválidos", f"Se encontraron {len(errores)} errores en {errores['Fila'].nunique()} filas del archivo.")
+        self.errores = errores
+
+def _por_valor(columna, funcion, tipo):
+    """Aplica `funcion` una sola vez por cada valor distinto de la columna (los vacíos cuentan como '') y
+    devuelve el resultado para cada fila. Las columnas de un archivo repiten mucho sus valores, así que es
+    mucho más rápido que recorrer las filas."""
+    codigos, unicos = pd.factorize(columna)
+    resultados = np.array([funcion(str(v)) for v in unicos] + [funcion('')], dtype=tipo)
+    return resultados[codigos]
+
+def _clave_cedula(valor):
+    """Cédula sin ceros a la izquierda, o None si no es válida."""
+    valor = valor.strip()
+    return valor.lstrip('0') if PATRON_CEDULA.fullmatch(valor) else None
+
+def _nombre_valido(valor):
+    return PATRON_NOMBRE.fullmatch(PATRON_ESPACIOS.sub(' ', valor.strip())) is not None
+
+def validar_registros(df, filas_reales, incluir_repetidas=True):
+    """Valida todas las filas de `df` columna por columna y devuelve un DataFrame con un renglón por error
+    (Fila, Columna, Regla, Valor), ordenado por fila. `filas_reales` es el número de cada fila en el
+    archivo. Incluye las cédulas repetidas salvo con `incluir_repetidas=False`."""
+    filas_reales = np.asarray(filas_reales)
+    # Las cédulas se guardan como enteros, así que '0123456' y '123456' cuentan como la misma.
+    cedulas = pd.Series(_por_valor(df["Cédula"], _clave_cedula, object))
+    cedula_valida = cedulas.notna().to_numpy()
+    repetidas = (cedulas.notna() & cedulas.duplicated(keep=False)).to_numpy() & incluir_repetidas
+    regla_repetidas = None
+    if repetidas.any():
+        filas_por_cedula = pd.Series(filas_reales[repetidas]).groupby(cedulas[repetidas].to_numpy()).agg(lambda f: ', '.join(map(str, f)))
+        regla_repetidas = ("Cédula repetida en las filas " + cedulas[repetidas].map(filas_por_cedula) + ".").to_numpy()
+    reglas = [
+        ("T. Cédula", ~_por_valor(df["T. Cédula"], lambda v: v.strip().upper() in TIPOS_CEDULA, bool), "Debe ser 'V', 'E' o 'P'."),
+        ("Cédula", ~cedula_valida, "Debe contener solo números y tener entre 6 y 9 dígitos."),
+        ("Cédula", repetidas, regla_repetidas),
+        ("Nombres", ~_por_valor(df["Nombres"], _nombre_valido, bool), "Debe tener entre 3 y 30 caracteres, solo letras y espacios."),
+        ("Apellidos", ~_por_valor(df["Apellidos"], _nombre_valido, bool), "Debe tener entre 3 y 30 caracteres, solo letras y espacios."),
+        ("Carrera", ~_por_valor(df["Carrera"], lambda v: v.strip() in CARRERAS, bool), "No es una de las carreras del programa."),
+        ("Semestre", ~_por_valor(df["Semestre"], lambda v: v.strip().upper() in SEMESTRES, bool), "Debe ser CINU o un número del 1 al 9."),
+    ]
+    partes = []
+    for columna, invalidas, regla in reglas:
+        if invalidas.any():
+            valores = pd.Series(df[columna].to_numpy()[invalidas], dtype=object).fillna('').astype(str).str.strip()
+            partes.append(pd.DataFrame({"Fila": filas_reales[invalidas], "Columna": columna, "Regla": regla, "Valor": valores}))
+    if not partes:
+        return pd.DataFrame(columns=COLUMNAS_ERRORES_VALIDACION)
+    return pd.concat(partes, ignore_index=True).sort_values("Fila", kind='stable', ignore_index=True)
+
+def validar_dataframe_importado(df, filas_reales):
+    """Quita las filas y columnas vacías de los datos leídos con leer_archivo_registros() y valida cada
+    fila. Devuelve el DataFrame limpio o lanza ErrorImportacion con el motivo para el usuario
+    (ErrorValidacion, con todos los errores, si hay filas inválidas)."""
+    presentes = df.notna().to_numpy()
+    filas_con_datos = presentes.any(axis=1)
+    df_limpio = df.loc[filas_con_datos, presentes.any(axis=0)]
+    if df_limpio.empty:
+        raise ErrorImportacion("Sin Datos", "No se encontraron registros de estudiantes debajo de los encabezados.")
+    errores = validar_registros(df_limpio, np.asarray(filas_reales)[filas_con_datos])
+    if len(errores):
+        raise ErrorValidacion(errores)
+    return df_limpio.reset_index(drop=True)
+
+def huella_archivo(ruta_archivo):
+    """Hash BLAKE2b del contenido del archivo, en hexadecimal."""
+    huella = hashlib.blake2b(digest_size=20)
+    with open(ruta_archivo, 'rb') as f:
+        for bloque in iter(lambda: f.read(TAMANO_BLOQUE_COMPRESION), b''):
+            huella.update(bloque)
+    return huella.hexdigest()
+
+class CacheImportaciones:
+    """Guarda en disco los registros ya leídos y validados de cada archivo importado, identificados por el
+    hash de su contenido y VERSION_VALIDACION, para que volver a cargar el mismo archivo no tenga que leerlo
+    ni validarlo de nuevo. Cada entrada es un .npz comprimido con, por columna, los valores distintos y el
+    código de cada fila. Cuando el directorio supera `limite_bytes` se borran primero las entradas usadas hace más
+    tiempo (la fecha de modificación se actualiza en cada uso). Un fallo de la caché nunca impide importar."""
+
+    def __init__(self, directorio, limite_bytes=LIMITE_CACHE_IMPORTACION):
+        self.directorio = Path(directorio)
+        self.limite_bytes = limite_bytes
+
+    def _ruta(self, huella):
+        return self.directorio / f"{huella}-v{VERSION_VALIDACION}.npz"
+
+    def obtener(self, huella):
+        """Devuelve el DataFrame validado guardado para `huella` o None."""
+        ruta = self._ruta(huella)
+        try:
+            with np.load(ruta, allow_pickle=False) as datos:
+                encabezados = datos['encabezados'].tolist()
+                columnas = {}
+                for i, enc in enumerate(encabezados):
+                    # El código -1 (celda vacía) toma el NaN agregado al final.
+                    valores = np.append(datos[f'unicos_{i}'].astype(object), np.nan)
+                    columnas[enc] = valores[datos[f'codigos_{i}']]
+            os.utime(ruta)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            _eliminar_archivos(ruta)
+            return None
+        return pd.DataFrame(columnas, columns=encabezados)
+
+    def guardar(self, huella, df):
+        ruta = self._ruta(huella)
+        temporal = ruta.with_suffix('.tmp')
+        arreglos = {'encabezados': np.array(df.columns.tolist(), dtype=str)}
+        for i, enc in enumerate(df.columns):
+            codigos, unicos = pd.factorize(df.iloc[:, i])
+            arreglos[f'codigos_{i}'] = codigos.astype(np.int32)
+            arreglos[f'unicos_{i}'] = np.array(unicos.tolist(), dtype=str)
+        try:
+            self.directorio.mkdir(exist_ok=True)
+            with open(temporal, 'wb') as f:
+                np.savez_compressed(f, **arreglos)
+            os.replace(temporal, ruta)
+            self._recortar()
+        except OSError:
+            _eliminar_archivos(temporal)
+
+    def _recortar(self):
+        entradas = sorted(((e.stat().st_mtime, e.stat().st_size, e) for e in self.directorio.glob('*.npz')), reverse=True)
+        total = 0
+        for _, tamano, entrada in entradas:
+            total += tamano
+            if total > self.limite_bytes:
+                _eliminar_archivos(entrada)
+
+def columnas_tabla(tipo_tabla, encabezados, filas):
+    """Devuelve (columnas de texto, cédulas) de una lista de becados o inscritos, como las recibe ModeloTablaColumnar."""
+    if tipo_tabla == 'becados':
+        columnas = []
+        for h in encabezados:
+            clave = CAMPOS_BECADOS[h]
+            if h == 'Semestre':
+                columnas.append([SEMESTRES_POR_NUMERO.get(d.get(clave), "") for d in filas])
+            else:
+                columnas.append([str(d.get(clave, '')) for d in filas])
+        return columnas, [d['cedula'] for d in filas]
+    return [[str(f.get(enc, '')) for f in filas] for enc in encabezados], [str(f.get('Cédula', '')) for f in filas]
+
+def importar_registros(ruta_archivo, tipo_tabla, ruta_bd, tarea, cache=None):
+    """Importa un archivo de becados o inscritos por etapas (leer, validar, guardar e indexar), pensado para
+    correr en una TareaSegundoPlano. Las filas ya preparadas para la tabla se entregan por lotes con
+    tarea.entregar(); los cambios en la base de datos se confirman al final, así que si se cancela o
+    falla en cualquier etapa se revierten. Con una CacheImportaciones, un archivo ya importado antes se
+    toma de ella sin leerlo ni validarlo (salvo los CSV de inscritos que se importan por bloques, que no
+    pasan por la caché). Devuelve (encabezados, filas, índice de búsqueda)."""
+    tarea.reportar(0, "Leyendo el archivo...")
+    if tipo_tabla == 'inscritos' and ruta_archivo.endswith('.csv') and os.path.getsize(ruta_archivo) > UMBRAL_IMPORTACION_POR_BLOQUES:
+        # Por bloques no se usa la caché, así que tampoco se calcula la huella (leería todo el archivo).
+        return importar_inscritos_por_bloques(ruta_archivo, ruta_bd, tarea)
+    huella = huella_archivo(ruta_archivo) if cache is not None else None
+    df_validado = cache.obtener(huella) if cache is not None else None
+    if df_validado is None:
+        df, filas_reales = leer_archivo_registros(ruta_archivo)
+        tarea.verificar_cancelacion()
+        tarea.reportar(25, "Validando los registros...")
+        df_validado = validar_dataframe_importado(df, filas_reales)
+        if cache is not None:
+            cache.guardar(huella, df_validado)
+    if tipo_tabla == 'becados' and len(df_validado) > LIMITE_BECADOS:
+        raise ErrorImportacion("Límite Excedido", f"El archivo contiene {len(df_validado)} estudiantes, lo que supera el límite de {LIMITE_BECADOS} becados.")
+    tarea.verificar_cancelacion()
+    tarea.reportar(40, "Guardando en la base de datos...")
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        conexion.row_factory = sqlite3.Row
+        cursor = conexion.cursor()
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            if tipo_tabla == 'inscritos':
+                encabezados = df_validado.columns.tolist()
+                borrar_inscritos(cursor)
+                guardar_encabezados_inscritos(cursor, encabezados)
+                filas = insertar_bloque_inscritos(cursor, df_validado, 1, 0)
+            else:
+                cursor.execute("DELETE FROM becados")
+                insertar_filas(cursor, 'becados', columnas_estudiantes(df_validado))
+                encabezados = ENCABEZADOS_VISUALIZACION
+                cursor.execute("SELECT id, tipo_cedula, cedula, nombres, apellidos, carrera, semestre FROM becados ORDER BY id")
+                filas = [dict(fila) for fila in cursor.fetchall()]
+            tarea.verificar_cancelacion()
+            tarea.reportar(65, "Preparando la tabla...")
+            columnas, cedulas = columnas_tabla(tipo_tabla, encabezados, filas)
+            busqueda = []
+            for inicio in range(0, len(cedulas), TAMANO_LOTE_IMPORTACION):
+                fin = min(inicio + TAMANO_LOTE_IMPORTACION, len(cedulas))
+                lote = [columna[inicio:fin] for columna in columnas]
+                busqueda_lote, codigos_lote = preparar_filas(encabezados, lote, fin - inicio)
+                busqueda.extend(busqueda_lote)
+                tarea.entregar((encabezados, inicio, lote, cedulas[inicio:fin], busqueda_lote, codigos_lote))
+                tarea.verificar_cancelacion()
+                tarea.reportar(65 + 25 * fin // len(cedulas))
+            tarea.reportar(90, "Indexando la búsqueda...")
+            indice = IndiceTrigramas(busqueda)
+            tarea.verificar_cancelacion()
+            conexion.commit()
+        except Exception:
+            conexion.rollback()
+            raise
+    tarea.reportar(100)
+    return encabezados, filas, indice
+
+def importar_inscritos_por_bloques(ruta_archivo, ruta_bd, tarea, tamano_bloque=TAMANO_BLOQUE_CSV):
+    """Importa un CSV de inscritos demasiado grande para leerlo de una vez: cada bloque de filas se lee, se
+    valida y se guarda con executemany antes de leer el siguiente, todo en una sola transacción, así que
+    solo la lectura con pandas y la validación están acotadas al tamaño del bloque. Lo que se devuelve sí
+    crece con el archivo: las filas como FilasColumnares (una lista de textos por columna, los mismos que
+    recibe la tabla, sin un diccionario por fila) y el texto de búsqueda de todas, que se guarda hasta
+    armar el índice. Las cédulas repetidas entre bloques se buscan al final en una tabla temporal. A
+    diferencia de importar_registros(), las columnas adicionales vacías se conservan. Devuelve lo mismo
+    que importar_registros()."""
+    formato = detectar_formato_csv(ruta_archivo)
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        cursor = conexion.cursor()
+        try:
+            try:
+                encabezados, filas, busqueda = _importar_bloques(cursor, ruta_archivo, formato, formato.codificacion, tarea, tamano_bloque)
+            except UnicodeDecodeError:
+                # La muestra era UTF-8 válido, pero más adelante el archivo no lo es.
+                conexion.rollback()
+                encabezados, filas, busqueda = _importar_bloques(cursor, ruta_archivo, formato, CODIFICACION_REINTENTO_CSV, tarea, tamano_bloque)
+            tarea.reportar(90, "Indexando la búsqueda...")
+            indice = IndiceTrigramas(busqueda)
+            tarea.verificar_cancelacion()
+            conexion.commit()
+        except Exception:
+            conexion.rollback()
+            raise
+    tarea.reportar(100)
+    return encabezados, filas, indice
+
+def _importar_bloques(cursor, ruta_archivo, formato, codificacion, tarea, tamano_bloque):
+    """Recorre el archivo para importar_inscritos_por_bloques() dentro de una transacción nueva. Si un bloque
+    tiene errores se dejan de guardar filas, pero se siguen validando las demás para informarlos todos."""
+    cursor.execute("BEGIN TRANSACTION")
+    borrar_inscritos(cursor)
+    cursor.execute("DROP TABLE IF EXISTS temp.cedulas_importadas")
+    cursor.execute("CREATE TEMP TABLE cedulas_importadas (cedula INTEGER NOT NULL, fila INTEGER NOT NULL, valor TEXT NOT NULL)")
+    encabezados = [formato.encabezados[i] for i in formato.con_nombre]
+    guardar_encabezados_inscritos(cursor, encabezados)
+    tarea.reportar(0, "Leyendo, validando y guardando por bloques...")
+    errores, busqueda, rechazo = [], [], None
+    columnas_texto = [[] for _ in encabezados]
+    vacias = {enc: [] for enc in encabezados if enc not in ENCABEZADOS_REQUERIDOS}
+    for bloque, (df, filas_reales, leido) in enumerate(leer_csv_por_bloques(ruta_archivo, formato, codificacion, tamano_bloque)):
+        con_datos = df.notna().to_numpy().any(axis=1)
+        df, filas_reales = df[con_datos], filas_reales[con_datos]
+        errores_bloque = validar_registros(df, filas_reales, incluir_repetidas=False)
+        validas = ~np.isin(filas_reales, errores_bloque.loc[errores_bloque["Columna"] == "Cédula", "Fila"].to_numpy())
+        cursor.executemany("INSERT INTO cedulas_importadas (cedula, fila, valor) VALUES (?, ?, ?)",
+                           ((int(v.strip()), fila, v.strip()) for v, fila in zip(df["Cédula"].to_numpy()[validas], filas_reales[validas].tolist())))
+        if len(errores_bloque):
+            errores.append(errores_bloque)
+        elif not errores and rechazo is None and len(df):
+            try:
+                valores = insertar_columnas_inscritos(cursor, df, len(busqueda) + 1, bloque)
+            except ErrorCedulaRepetida as e:
+                # Cédula ya guardada desde otro bloque: se informa al final junto con las demás repetidas.
+                rechazo = e
+            else:
+                columnas = [[str(v) for v in valores[enc]] for enc in encabezados] # Como columnas_tabla()
+                busqueda_lote, codigos_lote = preparar_filas(encabezados, columnas, len(df))
+                tarea.entregar((encabezados, len(busqueda), columnas, valores["Cédula"], busqueda_lote, codigos_lote))
+                for acumulada, columna in zip(columnas_texto, columnas):
+                    acumulada.extend(columna)
+                for enc, vacias_enc in vacias.items():
+                    vacias_enc.append(np.fromiter((not isinstance(v, str) for v in valores[enc]), dtype=bool, count=len(df)))
+                busqueda.extend(busqueda_lote)
+        tarea.verificar_cancelacion()
+        tarea.reportar(90 * leido)
+    repetidas = cursor.execute('''
+        SELECT cedula, fila, valor FROM cedulas_importadas
+        WHERE cedula IN (SELECT cedula FROM cedulas_importadas GROUP BY cedula HAVING count(*) > 1)
+        ORDER BY fila''').fetchall()
+    cursor.execute("DROP TABLE temp.cedulas_importadas")
+    if repetidas:
+        repetidas = pd.DataFrame(repetidas, columns=["Cédula", "Fila", "Valor"])
+        filas_por_cedula = repetidas.groupby("Cédula")["Fila"].agg(lambda f: ', '.join(map(str, f)))
+        errores.append(pd.DataFrame({"Fila": repetidas["Fila"], "Columna": "Cédula", "Valor": repetidas["Valor"],
+                                     "Regla": "Cédula repetida en las filas " + repetidas["Cédula"].map(filas_por_cedula) + "."}))
+    if errores:
+        errores = pd.concat(errores, ignore_index=True)[COLUMNAS_ERRORES_VALIDACION]
+        raise ErrorValidacion(errores.sort_values("Fila", kind='stable', ignore_index=True))
+    if rechazo is not None:
+        raise rechazo
+    if not busqueda:
+        raise ErrorImportacion("Sin Datos", "No se encontraron registros de estudiantes debajo de los encabezados.")
+    vacias = {enc: np.concatenate(partes) for enc, partes in vacias.items()}
+    return encabezados, FilasColumnares(encabezados, columnas_texto, vacias), busqueda
+
+# --- Exportación de Reportes ---
+class ErrorExportacion(Exception):
+    """No se pudo escribir el archivo de un reporte. `titulo` es el título del aviso al usuario."""
+
+    def __init__(self, titulo, mensaje):
+        super().__init__(mensaje)
+        self.titulo = titulo
+
+def titulo_de_reporte(tipo_tabla, color=None):
+    """Título del reporte de una tabla, con el filtro de color (ESTADO_*) si lo hay."""
+    return f"Reporte de Estudiantes {tipo_tabla.capitalize()}{TITULOS_COLOR[color][tipo_tabla] if color else ''}"
+
+def nombre_de_reporte(tipo_tabla, color, extension):
+    """Nombre de archivo sugerido para el reporte de una tabla, p. ej. reporte_becados_(no_inscritos).csv."""
+    extra = TITULOS_COLOR[color][tipo_tabla] if color else ""
+    return f"reporte_{tipo_tabla}{extra.replace(' ', '_').lower()}.{extension}"
+
+def columnas_exportacion(tipo_tabla, encabezados):
+    """Encabezados de un reporte y una función que arma, a partir de una fila de datos, sus valores en
+    ese orden. `encabezados` son los de la tabla (los de los inscritos, en el orden del archivo); en los
+    becados el semestre sale como texto y en los inscritos las celdas vacías del archivo salen como None."""
+    encabezados = list(encabezados)
+    if tipo_tabla == 'becados':
+        claves = [CAMPOS_BECADOS[h] for h in encabezados]
+        def valores(fila):
+            return [SEMESTRES_POR_NUMERO.get(fila.get(c), "") if c == 'semestre' else fila.get(c) for c in claves]
+        return encabezados, valores
+    def valores(fila):
+        return [None if isinstance(v, float) and v != v else v for v in map(fila.get, encabezados)]
+    return encabezados, valores
+
+def _bloques_exportacion(datos, filas, valores, tarea, inicio=0, fin=100):
+    """Recorre `filas` de a FILAS_POR_PASO_EXPORTACION, informando el avance entre `inicio` y `fin` y
+    atendiendo la cancelación."""
+    total = len(filas)
+    for desde in range(0, total, FILAS_POR_PASO_EXPORTACION):
+        tarea.verificar_cancelacion()
+        tarea.reportar(inicio + (fin - inicio) * desde // total)
+        yield [valores(datos[fila]) for fila in filas[desde:desde + FILAS_POR_PASO_EXPORTACION]]
+
+def _muestra_exportacion(datos, filas, valores):
+    """Valores como texto de una muestra de `filas` (ver filas_de_muestra), para medir el ancho de las columnas."""
+    return [['' if v is None else str(v) for v in valores(datos[filas[i]])] for i in filas_de_muestra(len(filas))]
+
+def _agregar_hoja(libro, titulo, encabezados, muestra, bloques):
+    """Agrega a `libro` (xlsxwriter en modo constant_memory, así que las filas van en orden) una hoja con los
+    encabezados y las filas de `bloques`, con el ancho de cada columna medido en `muestra`."""
+    hoja = libro.add_worksheet(titulo[:31]) # Límite de 31 caracteres para nombres de hoja
+    for col, enc in enumerate(encabezados):
+        hoja.set_column(col, col, max([len(enc)] + [len(fila[col]) for fila in muestra]) + 2)
+    hoja.write_row(0, 0, encabezados, libro.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}))
+    fila_hoja = 1
+    for bloque in bloques:
+        for fila in bloque:
+            hoja.write_row(fila_hoja, 0, fila)
+            fila_hoja += 1
+
+def _escribir_excel(ruta, titulo, encabezados, datos, filas, valores, tarea):
+    import xlsxwriter
+    libro = xlsxwriter.Workbook(ruta, {'constant_memory': True})
+    try:
+        _agregar_hoja(libro, titulo, encabezados, _muestra_exportacion(datos, filas, valores),
+                      _bloques_exportacion(datos, filas, valores, tarea))
+        tarea.reportar(100, "Cerrando el libro...")
+    finally:
+        libro.close()
+
+def _escribir_csv(ruta, encabezados, datos, filas, valores, tarea, inicio=0, fin=100):
+    with open(ruta, 'w', newline='', encoding='utf-8-sig', buffering=TAMANO_BUFFER_CSV) as f:
+        escritor = csv.writer(f, lineterminator=os.linesep)
+        escritor.writerow(encabezados)
+        for bloque in _bloques_exportacion(datos, filas, valores, tarea, inicio, fin):
+            escritor.writerows(bloque)
+
+def _error_permiso(formato):
+    return ErrorExportacion(f"Error al Exportar {formato.upper()}", "No se pudo guardar el archivo. Asegúrate de que el archivo no esté abierto en otro programa (como Excel) y vuelve a intentarlo.")
+
+def exportar_registros(ruta, formato, titulo, tipo_tabla, encabezados, datos, filas, tarea):
+    """Escribe en un .xlsx ('excel') o .csv las filas `filas` de `datos`, en ese orden, sin armar antes una
+    tabla con todas: cada bloque se convierte y se escribe enseguida (xlsxwriter en modo constant_memory o
+    un escritor CSV con búfer). El archivo final solo aparece cuando la exportación se completa."""
+    encabezados, valores = columnas_exportacion(tipo_tabla, encabezados)
+    temporal = ruta + ".tmp"
+    try:
+        tarea.reportar(0, f"Exportando {len(filas)} registros...")
+        if formato == 'excel':
+            _escribir_excel(temporal, titulo, encabezados, datos, filas, valores, tarea)
+        else:
+            _escribir_csv(temporal, encabezados, datos, filas, valores, tarea)
+        os.replace(temporal, ruta)
+    except PermissionError:
+        raise _error_permiso(formato)
+    finally:
+        _eliminar_archivos(temporal)
+    return len(filas)
+
+def generar_pdf(ruta_filas, ruta, titulo, total, muestra, avisar=None):
+    """Arma un PDF con `titulo` y una tabla con las filas del CSV `ruta_filas` (el primer renglón son los
+    encabezados). La tabla se arma de a una página: cada bloque es una LongTable que repite la fila de
+    encabezados y se crea recién cuando reportlab va a ubicarlo, así que hay un solo bloque en memoria a
+    la vez. El estilo, el alto de las filas y el ancho de las columnas (medido en `muestra`) se calculan
+    una sola vez para todos los bloques; como las filas tienen alto fijo, el texto que no cabe en el ancho
+    de su columna se corta con '…'. `avisar(porcentaje)`, si se da, recibe el avance."""
+    from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import inch
+    from reportlab.pdfbase.pdfmetrics import stringWidth, getFont
+
+    @lru_cache(maxsize=4096)
+    def recortar(texto, ancho, fuente):
+        # Carrera, semestre y tipo de cédula se repiten en casi todas las filas, así que se miden una vez.
+        medir = getFont(fuente).stringWidth
+        if medir(texto, 10) <= ancho:
+            return texto
+        cabe, no_cabe = 0, len(texto)
+        while no_cabe - cabe > 1:
+            medio = (cabe + no_cabe) // 2
+            if medir(texto[:medio] + "…", 10) <= ancho:
+                cabe = medio
+            else:
+                no_cabe = medio
+        return texto[:cabe].rstrip() + "…"
+
+    with open(ruta_filas, encoding='utf-8-sig', newline='') as f:
+        lector = csv.reader(f)
+        encabezados = next(lector)
+        anchos = [max([stringWidth(enc, 'Helvetica-Bold', 10)] + [stringWidth(fila[col], 'Helvetica', 10) for fila in muestra]) + 12
+                  for col, enc in enumerate(encabezados)]
+        doc = SimpleDocTemplate(ruta, pagesize=A4)
+        if sum(anchos) > doc.width:
+            doc = SimpleDocTemplate(ruta, pagesize=landscape(A4))
+            # Si aun así no caben, se angostan solo las columnas más anchas, hasta un mismo tope, para que las
+            # cortas (cédula, semestre) se sigan leyendo completas.
+            tope, disponible = max(anchos), doc.width
+            for i, ancho in enumerate(sorted(anchos)):
+                if ancho * (len(anchos) - i) > disponible:
+                    tope = disponible / (len(anchos) - i)
+                    break
+                disponible -= ancho
+            anchos = [min(ancho, tope) for ancho in anchos]
+        utiles = [ancho - 12 for ancho in anchos] # Sin el relleno de 6 puntos a cada lado de la celda
+        encabezados = [recortar(enc, util, 'Helvetica-Bold') for enc, util in zip(encabezados, utiles)]
+        estilo = TableStyle([('BACKGROUND', (0,0), (-1,0), colors.grey), ('TEXTCOLOR',(0,0),(-1,0),colors.whitesmoke),
+                             ('ALIGN', (0,0), (-1,-1), 'CENTER'), ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+                             ('BOTTOMPADDING', (0,0), (-1,0), 12), ('BACKGROUND', (0,1), (-1,-1), colors.beige),
+                             ('GRID', (0,0), (-1,-1), 1, colors.black)])
+        estilos = getSampleStyleSheet()
+        encabezado = Paragraph(titulo, estilos['h1'])
+        separador = Spacer(1, 0.2*inch)
+        alto_marco = doc.height - 12 # El marco de la página deja 6 puntos arriba y abajo
+        alto_titulo = encabezado.wrap(doc.width, doc.height)[1] + estilos['h1'].spaceAfter + separador.height
+        filas_por_pagina = int((alto_marco - ALTO_ENCABEZADO_PDF) // ALTO_FILA_PDF)
+        siguiente = [int((alto_marco - alto_titulo - ALTO_ENCABEZADO_PDF) // ALTO_FILA_PDF)]
+        marcador = Spacer(0, 0)
+        leidas = 0
+
+        def armar_bloque(flowables):
+            # reportlab llama a esto antes de ubicar cada elemento: el marcador se reemplaza por la tabla de la
+            # página siguiente (y vuelve a quedar detrás de ella) hasta que se acaban las filas.
+            nonlocal leidas
+            if flowables[0] is not marcador:
+                return
+            bloque = [[recortar(valor.replace('\n', ' '), util, 'Helvetica') for valor, util in zip(fila, utiles)]
+                      for fila in islice(lector, siguiente[0])]
+            if not bloque:
+                flowables[0] = None
+                return
+            siguiente[0] = filas_por_pagina
+            leidas += len(bloque)
+            flowables[0:0] = [LongTable([encabezados] + bloque, colWidths=anchos, rowHeights=[ALTO_ENCABEZADO_PDF] + [ALTO_FILA_PDF] * len(bloque),
+                                        style=estilo, repeatRows=1)]
+            if avisar:
+                avisar(100 * leidas // max(total, 1))
+
+        doc.filterFlowables = armar_bloque
+        doc.build([encabezado, separador, marcador])
+
+def _generar_pdf_en_proceso(ruta_filas, ruta, titulo, total, muestra, conexion):
+    """Punto de entrada del proceso de exportar_pdf(): envía ('avance', porcentaje), y al final ('listo', None)
+    o ('error', excepción)."""
+    try:
+        generar_pdf(ruta_filas, ruta, titulo, total, muestra, lambda porcentaje: conexion.send(('avance', porcentaje)))
+    except Exception as e:
+        try:
+            conexion.send(('error', e))
+        except Exception:
+            conexion.send(('error', RuntimeError(str(e))))
+    else:
+        conexion.send(('listo', None))
+    finally:
+        conexion.close()
+
+def exportar_pdf(ruta, titulo, tipo_tabla, encabezados, datos, filas, tarea):
+    """Exporta las filas `filas` de `datos` a un PDF armado por generar_pdf() en un proceso aparte, para que las
+    cientos de páginas de un reporte grande no compitan con la interfaz. Las filas se le pasan en un CSV
+    temporal que el proceso lee de a una página. Cancelar termina el proceso; el archivo final solo
+    aparece cuando el PDF está completo."""
+    encabezados, valores = columnas_exportacion(tipo_tabla, encabezados)
+    muestra = _muestra_exportacion(datos, filas, valores)
+    temporal, ruta_filas = ruta + ".tmp", ruta + ".filas.tmp"
+    contexto = multiprocessing.get_context('spawn')
+    proceso = None
+    try:
+        tarea.reportar(0, "Preparando las filas...")
+        _escribir_csv(ruta_filas, encabezados, datos, filas, valores, tarea, 0, 10)
+        tarea.reportar(10, f"Armando el PDF de {len(filas)} registros...")
+        recibir, enviar = contexto.Pipe(duplex=False)
+        proceso = contexto.Process(target=_generar_pdf_en_proceso, args=(ruta_filas, temporal, titulo, len(filas), muestra, enviar), daemon=True)
+        proceso.start()
+        enviar.close()
+        while True:
+            tarea.verificar_cancelacion()
+            if not recibir.poll(0.1):
+                continue
+            try:
+                tipo, valor = recibir.recv()
+            except EOFError:
+                raise RuntimeError("El proceso que arma el PDF terminó de forma inesperada.")
+            if tipo == 'avance':
+                tarea.reportar(10 + 90 * valor // 100)
+            elif tipo == 'error':
+                raise valor
+            else:
+                break
+        proceso.join()
+        os.replace(temporal, ruta)
+    except PermissionError:
+        raise _error_permiso('pdf')
+    finally:
+        if proceso is not None and proceso.is_alive():
+            proceso.terminate()
+            proceso.join()
+        _eliminar_archivos(temporal, ruta_filas)
+    return len(filas)
+
+_cancelacion_paquete = None
+
+def _iniciar_proceso_paquete(evento):
+    """Inicializador de los procesos de _ejecutar_en_procesos(): guarda el evento de cancelación compartido."""
+    global _cancelacion_paquete
+    _cancelacion_paquete = evento
+
+def _atender_cancelacion_paquete(*_):
+    """Dentro de un proceso de _ejecutar_en_procesos(), lanza TareaCancelada si se pidió detener el grupo."""
+    if _cancelacion_paquete is not None and _cancelacion_paquete.is_set():
+        raise TareaCancelada()
+
+def _bloques_csv(lector, numericas, verificar=None):
+    """Lee de a FILAS_POR_PASO_EXPORTACION filas de un csv.reader, con las columnas `numericas` convertidas a int."""
+    while True:
+        if verificar:
+            verificar()
+        bloque = list(islice(lector, FILAS_POR_PASO_EXPORTACION))
+        if not bloque:
+            return
+        for fila in bloque:
+            for col in numericas:
+                if fila[col].isdigit():
+                    fila[col] = int(fila[col])
+        yield bloque
+
+def generar_libro(ruta, hojas, verificar=None):
+    """Arma un .xlsx con una hoja por cada (título, CSV, muestra, columnas numéricas) de `hojas`, leyendo cada CSV
+    (el primer renglón son los encabezados) por bloques. Las columnas numéricas vuelven a escribirse como
+    números. `verificar()`, si se da, se llama entre bloques."""
+    import xlsxwriter
+    libro = xlsxwriter.Workbook(ruta, {'constant_memory': True})
+    try:
+        for titulo, ruta_filas, muestra, numericas in hojas:
+            with open(ruta_filas, encoding='utf-8-sig', newline='') as f:
+                lector = csv.reader(f)
+                _agregar_hoja(libro, titulo, next(lector), muestra, _bloques_csv(lector, numericas, verificar))
+    finally:
+        libro.close()
+
+def _ejecutar_en_procesos(trabajos, tarea, inicio, fin):
+    """Ejecuta cada (peso, función, *argumentos) de `trabajos` en un grupo de procesos y espera a que terminen,
+    informando el avance entre `inicio` y `fin` según el peso de los ya terminados. Si se cancela o uno falla,
+    los que siguen corriendo se detienen en su próxima llamada a _atender_cancelacion_paquete()."""
+    contexto = multiprocessing.get_context('spawn')
+    cancelar = contexto.Event()
+    total = sum(peso for peso, *_ in trabajos)
+    with ProcessPoolExecutor(max_workers=min(len(trabajos), os.cpu_count() or 1), mp_context=contexto,
+                             initializer=_iniciar_proceso_paquete, initargs=(cancelar,)) as grupo:
+        pendientes = {grupo.submit(funcion, *argumentos): peso for peso, funcion, *argumentos in trabajos}
+        terminado = 0
+        try:
+            while pendientes:
+                listos, _ = wait(pendientes, timeout=0.1, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    futuro.result()
+                    terminado += pendientes.pop(futuro)
+                tarea.reportar(inicio + (fin - inicio) * terminado // max(total, 1))
+                tarea.verificar_cancelacion()
+        except BaseException:
+            cancelar.set()
+            for futuro in pendientes:
+                futuro.cancel()
+            raise
+
+def exportar_paquete_auditoria(directorio, partes, incluir_pdf, tarea):
+    """Exporta de una vez el reporte de cada filtro de color de cada tabla a la carpeta `directorio`: un CSV y
+    un PDF por reporte y un libro (ARCHIVO_LIBRO_AUDITORIA) con una hoja por reporte. `partes` es una lista de
+    (tipo_tabla, encabezados, datos, estados), con los estados de una misma comparación. Los CSV se escriben acá, y el
+    libro y los PDF se arman a partir de ellos en paralelo, en un grupo de procesos. La carpeta solo aparece
+    cuando el paquete está completo."""
+    temporal = directorio + ".tmp"
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+    try:
+        reportes = [(tipo_tabla, encabezados, datos, color, np.flatnonzero(estados == color))
+                    for tipo_tabla, encabezados, datos, estados in partes for color in TITULOS_COLOR]
+        total = max(sum(len(filas) for *_, filas in reportes), 1)
+        hojas, trabajos, escritas = [], [], 0
+        tarea.reportar(0, "Separando los registros por color...")
+        for tipo_tabla, encabezados_tabla, datos, color, filas in reportes:
+            encabezados, valores = columnas_exportacion(tipo_tabla, encabezados_tabla)
+            ruta_csv = os.path.join(temporal, nombre_de_reporte(tipo_tabla, color, 'csv'))
+            _escribir_csv(ruta_csv, encabezados, datos, filas, valores, tarea, 20 * escritas // total, 20 * (escritas + len(filas)) // total)
+            escritas += len(filas)
+            muestra = _muestra_exportacion(datos, filas, valores)
+            numericas = [col for col, v in enumerate(valores(datos[filas[0]])) if isinstance(v, int)] if len(filas) else []
+            hojas.append((f"{tipo_tabla.capitalize()}{TITULOS_COLOR[color][tipo_tabla]}", ruta_csv, muestra, numericas))
+            if incluir_pdf:
+                trabajos.append((len(filas) + 1, generar_pdf, ruta_csv, os.path.join(temporal, nombre_de_reporte(tipo_tabla, color, 'pdf')),
+                                 titulo_de_reporte(tipo_tabla, color), len(filas), muestra, _atender_cancelacion_paquete))
+        trabajos.insert(0, (escritas + 1, generar_libro, os.path.join(temporal, ARCHIVO_LIBRO_AUDITORIA), hojas, _atender_cancelacion_paquete))
+        tarea.reportar(20, f"Armando el libro{' y los PDF' if incluir_pdf else ''}...")
+        _ejecutar_en_procesos(trabajos, tarea, 20, 100)
+        os.replace(temporal, directorio)
+    finally:
+        shutil.rmtree(temporal, ignore_errors=True)
+    return directorio
+
+# --- Línea de Comandos ---
+class TareaConsola:
+    """Hace las veces de TareaSegundoPlano en la línea de comandos: escribe cada etapa nueva en stderr. Para
+    cancelar se usa Ctrl+C (KeyboardInterrupt), así que verificar_cancelacion() no hace nada."""
+
+    def __init__(self):
+        self._etapa = None
+
+    def verificar_cancelacion(self):
+        pass
+
+    def reportar(self, porcentaje, etapa=None):
+        if etapa is not None and etapa != self._etapa:
+            self._etapa = etapa
+            print(etapa, file=sys.stderr, flush=True)
+
+    def entregar(self, lote):
+        pass
+
+def _imprimir_errores_validacion(ruta, errores, maximo=20):
+    print(f"El archivo '{ruta}' tiene {len(errores)} errores de validación:", file=sys.stderr)
+    for error in errores.head(maximo).itertuples(index=False):
+        print(f"  Fila {error.Fila}, {error.Columna}: {error.Regla} (valor: {error.Valor!r})", file=sys.stderr)
+    if len(errores) > maximo:
+        print(f"  ... y {len(errores) - maximo} más.", file=sys.stderr)
+
+def ejecutar_comando(argumentos):
+    """Punto de entrada de `python main.py compare --inscritos X --becados Y --out carpeta`: importa y valida
+    los dos archivos en una base de datos temporal, los compara y escribe en `carpeta` el paquete de
+    auditoría (ver exportar_paquete_auditoria) y un resumen.json con los recuentos. Devuelve el código de
+    salida: 0 si todo salió bien y 1 si algún archivo no se pudo importar o los reportes no se pudieron escribir."""
+    import argparse
+    import tempfile
+    parser = argparse.ArgumentParser(prog="main.py", description="Gestor de estudiantes becados e inscritos.")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    comparar = subcomandos.add_parser('compare', help="compara un archivo de inscritos con uno de becados sin abrir la ventana",
+                                      description="Importa y valida ambos archivos, los compara y exporta los reportes de cada color.")
+    comparar.add_argument('--inscritos', required=True, help="archivo de inscritos (.xlsx, .xls o .csv)")
+    comparar.add_argument('--becados', required=True, help="archivo de becados (.xlsx, .xls o .csv)")
+    comparar.add_argument('--out', required=True, help="carpeta de los reportes; no debe existir o debe estar vacía")
+    comparar.add_argument('--sin-pdf', action='store_true', help="no generar los reportes en PDF")
+    args = parser.parse_args(argumentos)
+
+    salida = os.path.abspath(args.out)
+    if os.path.isdir(salida) and os.listdir(salida):
+        print(f"La carpeta '{salida}' ya existe y no está vacía.", file=sys.stderr)
+        return 1
+    tarea = TareaConsola()
+    encabezados, datos = {}, {}
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_bd = os.path.join(directorio, ARCHIVO_BD)
+        with closing(sqlite3.connect(ruta_bd)) as conexion:
+            migrar_esquema(conexion)
+        for tipo_tabla, ruta in (('becados', args.becados), ('inscritos', args.inscritos)):
+            print(f"Importando {tipo_tabla} desde '{ruta}'...", file=sys.stderr)
+            try:
+                encabezados[tipo_tabla], datos[tipo_tabla], _ = importar_registros(ruta, tipo_tabla, ruta_bd, tarea)
+            except ErrorValidacion as e:
+                _imprimir_errores_validacion(ruta, e.errores)
+                return 1
+            except (ErrorImportacion, ErrorCedulaRepetida) as e:
+                print(f"{e.titulo}: {e}", file=sys.stderr)
+                return 1
+            except Exception as e:
+                print(f"No se pudo importar '{ruta}': {e}", file=sys.stderr)
+                return 1
+
+    comparacion = MotorComparacion().comparar(datos['becados'], datos['inscritos'], (1, 1))
+    resumen = {
+        'inscritos': comparacion.num_inscritos,
+        'becados': comparacion.num_becados,
+        'becados_no_inscritos': comparacion.becados_no_inscritos,
+        'incongruentes': comparacion.incongruentes,
+        'reportes': {nombre_de_reporte(tipo_tabla, color, 'csv'): int(np.count_nonzero(estados == color))
+                     for tipo_tabla, estados in (('becados', comparacion.estado_becados), ('inscritos', comparacion.estado_inscritos))
+                     for color in TITULOS_COLOR},
+    }
+    try:
+        if os.path.isdir(salida):
+            os.rmdir(salida) # Vacía: exportar_paquete_auditoria() la crea completa de una vez
+        exportar_paquete_auditoria(salida, [('becados', encabezados['becados'], datos['becados'], comparacion.estado_becados),
+                                            ('inscritos', encabezados['inscritos'], datos['inscritos'], comparacion.estado_inscritos)],
+                                   PDF_DISPONIBLE and not args.sin_pdf, tarea)
+        with open(os.path.join(salida, 'resumen.json'), 'w', encoding='utf-8') as f:
+            json.dump(resumen, f, ensure_ascii=False, indent=2)
+    except ErrorExportacion as e:
+        print(f"{e.titulo}: {e}", file=sys.stderr)
+        return 1
+    except BrokenProcessPool:
+        print("Un proceso que armaba el libro o los PDF terminó de forma inesperada; no se guardaron los reportes.", file=sys.stderr)
+        return 1
+    except Exception as e: # OSError en la carpeta de salida o el error con el que falló un libro o un PDF
+        print(f"No se pudieron guardar los reportes en '{salida}': {e}", file=sys.stderr)
+        return 1
+    print(f"Estudiantes inscritos: {resumen['inscritos']}")
+    print(f"Estudiantes becados: {resumen['becados']}")
+    print(f"Estudiantes becados no inscritos: {resumen['becados_no_inscritos']}")
+    print(f"Estudiantes con datos incongruentes: {resumen['incongruentes']}")
+    print(f"Reportes guardados en '{salida}'.")
+    return 0
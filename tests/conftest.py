@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TareaSilenciosa:
+    """Hace las veces de TareaSegundoPlano sin mostrar nada."""
+
+    def __init__(self):
+        self.lotes = []
+
+    def verificar_cancelacion(self):
+        pass
+
+    def reportar(self, porcentaje, etapa=None):
+        pass
+
+    def entregar(self, lote):
+        self.lotes.append(lote)
+
+
+@pytest.fixture
+def tarea():
+    return TareaSilenciosa()
@@ -0,0 +1,77 @@
+"""Pruebas de `python main.py compare` (ejecutar_comando): los reportes y los códigos de salida."""
+import csv
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import nucleo
+from nucleo import CARRERAS, ENCABEZADOS_VISUALIZACION, ejecutar_comando
+
+
+def escribir_csv(ruta, filas):
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f, delimiter=';')
+        escritor.writerow(ENCABEZADOS_VISUALIZACION)
+        escritor.writerows(filas)
+
+
+@pytest.fixture
+def archivos(tmp_path):
+    """Rutas de un archivo de inscritos y uno de becados válidos: un becado coincide, uno tiene otra
+    carrera y uno no está inscrito."""
+    inscritos = [['V', str(10000000 + i), "Ana María", "Pérez Gómez", CARRERAS[i % len(CARRERAS)], "CINU" if i % 10 == 0 else str(i % 10)]
+                 for i in range(50)]
+    becados = [inscritos[1], inscritos[2][:4] + [CARRERAS[(2 + 1) % len(CARRERAS)]] + inscritos[2][5:],
+               ['E', '20000000', "Luis", "Díaz", CARRERAS[0], "3"]]
+    ruta_inscritos, ruta_becados = str(tmp_path / "inscritos.csv"), str(tmp_path / "becados.csv")
+    escribir_csv(ruta_inscritos, inscritos)
+    escribir_csv(ruta_becados, becados)
+    return ruta_inscritos, ruta_becados
+
+
+def comando(ruta_inscritos, ruta_becados, salida):
+    return ejecutar_comando(['compare', '--inscritos', ruta_inscritos, '--becados', ruta_becados, '--out', str(salida), '--sin-pdf'])
+
+
+def ultima_linea_de_error(capsys):
+    """Última línea de stderr (las anteriores son las etapas que anuncia TareaConsola)."""
+    return capsys.readouterr().err.splitlines()[-1]
+
+
+def test_compare_exito(archivos, tmp_path):
+    salida = tmp_path / "reportes"
+    assert comando(*archivos, salida) == 0
+    with open(salida / 'resumen.json', encoding='utf-8') as f:
+        resumen = json.load(f)
+    assert (resumen['inscritos'], resumen['becados'], resumen['becados_no_inscritos'], resumen['incongruentes']) == (50, 3, 1, 1)
+    assert os.path.exists(salida / nucleo.ARCHIVO_LIBRO_AUDITORIA)
+
+
+def test_compare_error_de_validacion(archivos, tmp_path):
+    ruta_inscritos, ruta_becados = archivos
+    escribir_csv(ruta_becados, [['V', '12', "Ana", "Pérez", CARRERAS[0], "1"]])
+    assert comando(ruta_inscritos, ruta_becados, tmp_path / "reportes") == 1
+    assert not os.path.exists(tmp_path / "reportes")
+
+
+def test_compare_carpeta_no_vacia(archivos, tmp_path):
+    salida = tmp_path / "reportes"
+    salida.mkdir()
+    (salida / "otro.txt").write_text("")
+    assert comando(*archivos, salida) == 1
+
+
+def test_compare_carpeta_inaccesible(archivos, tmp_path, capsys):
+    (tmp_path / "archivo").write_text("")
+    assert comando(*archivos, tmp_path / "archivo" / "reportes") == 1
+    assert ultima_linea_de_error(capsys).startswith("No se pudieron guardar los reportes")
+
+
+def test_compare_fallo_de_los_procesos(archivos, tmp_path, capsys, monkeypatch):
+    def fallar(*args):
+        raise BrokenProcessPool("un proceso terminó de golpe")
+    monkeypatch.setattr(nucleo, 'exportar_paquete_auditoria', fallar)
+    assert comando(*archivos, tmp_path / "reportes") == 1
+    assert ultima_linea_de_error(capsys).startswith("Un proceso que armaba el libro o los PDF")
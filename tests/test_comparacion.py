@@ -0,0 +1,88 @@
+"""Pruebas de MotorComparacion: la actualización incremental tras un cambio en un becado."""
+import random
+
+import numpy as np
+import pytest
+
+from nucleo import CARRERAS, SEMESTRES, SEMESTRES_POR_NUMERO, TIPOS_CEDULA, MotorComparacion
+
+NOMBRES = ["Ana", "José", "María", "Luis", "Ángel", "Sofía", "Carlos", "Lucía"]
+APELLIDOS = ["Pérez", "Gómez", "Núñez", "Díaz", "Peña", "Suárez"]
+
+
+def inscrito_al_azar(aleatorio, cedula):
+    return {"T. Cédula": aleatorio.choice(TIPOS_CEDULA), "Cédula": str(cedula), "Nombres": aleatorio.choice(NOMBRES),
+            "Apellidos": aleatorio.choice(APELLIDOS), "Carrera": aleatorio.choice(CARRERAS),
+            "Semestre": aleatorio.choice(list(SEMESTRES))}
+
+
+def becado_de(inscrito, id_becado):
+    """Un becado con los mismos datos que `inscrito`, como los guarda la base de datos."""
+    return {'id': id_becado, 'tipo_cedula': inscrito["T. Cédula"], 'cedula': int(inscrito["Cédula"]), 'nombres': inscrito["Nombres"],
+            'apellidos': inscrito["Apellidos"], 'carrera': inscrito["Carrera"], 'semestre': SEMESTRES[inscrito["Semestre"]]}
+
+
+def comparar_resultados(obtenido, esperado):
+    for nombre in ('estado_becados', 'mascara_becados', 'estado_inscritos', 'mascara_inscritos'):
+        np.testing.assert_array_equal(getattr(obtenido, nombre), getattr(esperado, nombre), err_msg=nombre)
+    for nombre in ('num_becados', 'num_inscritos', 'becados_no_inscritos', 'incongruentes'):
+        assert getattr(obtenido, nombre) == getattr(esperado, nombre), nombre
+
+
+@pytest.mark.parametrize('semilla', range(5))
+def test_aplicar_cambio_becado_coincide_con_comparar(semilla):
+    """Altas, ediciones y bajas al azar: el resultado incremental es siempre el de comparar() desde cero."""
+    aleatorio = random.Random(semilla)
+    cedulas = aleatorio.sample(range(1000000, 40000000), 400)
+    inscritos = [inscrito_al_azar(aleatorio, cedula) for cedula in cedulas[:300]] # El resto no está inscrito
+    becados = [becado_de(inscrito, i) for i, inscrito in enumerate(aleatorio.sample(inscritos, 40))]
+    siguiente_id = len(becados)
+
+    def cedula_sin_usar():
+        usadas = {b['cedula'] for b in becados}
+        candidatas = [c for c in cedulas if c not in usadas]
+        return aleatorio.choice(candidatas)
+
+    motor = MotorComparacion()
+    version = 1
+    motor.comparar(becados, inscritos, (version, 1))
+    for _ in range(150):
+        operacion = aleatorio.choice(['alta', 'edicion', 'edicion', 'baja'] if becados else ['alta'])
+        cedula_anterior = None
+        if operacion == 'baja':
+            fila = aleatorio.randrange(len(becados))
+            cedula_anterior = becados.pop(fila)['cedula']
+        else:
+            cedula = cedula_sin_usar()
+            inscrito = next((i for i in inscritos if i["Cédula"] == str(cedula)), None) or inscrito_al_azar(aleatorio, cedula)
+            becado = becado_de(inscrito, siguiente_id)
+            if aleatorio.random() < 0.4: # Un dato distinto al del inscrito
+                campo = aleatorio.choice(['nombres', 'carrera', 'semestre'])
+                becado[campo] = {'nombres': aleatorio.choice(NOMBRES) + " Luis", 'carrera': aleatorio.choice(CARRERAS),
+                                 'semestre': aleatorio.choice(list(SEMESTRES_POR_NUMERO))}[campo]
+            if operacion == 'alta':
+                fila = len(becados)
+                siguiente_id += 1
+                becados.append(becado)
+            else:
+                fila = aleatorio.randrange(len(becados))
+                if aleatorio.random() < 0.5:
+                    becado['cedula'] = becados[fila]['cedula'] # Editar sin cambiar la cédula
+                becado['id'] = becados[fila]['id']
+                cedula_anterior = becados[fila]['cedula']
+                becados[fila] = becado
+        anterior = motor.comparar(becados, inscritos, (version, 1))
+        filas = motor.aplicar_cambio_becado(becados, inscritos, fila, cedula_anterior, (version, 1), (version + 1, 1))
+        version += 1
+        resultado = motor.comparar(becados, inscritos, (version, 1))
+        comparar_resultados(resultado, MotorComparacion().comparar(becados, inscritos, (1, 1)))
+        # Las filas devueltas son las únicas de inscritos que la ventana vuelve a pintar.
+        cambiadas = np.flatnonzero((anterior.estado_inscritos != resultado.estado_inscritos) |
+                                   (anterior.mascara_inscritos != resultado.mascara_inscritos))
+        assert set(cambiadas.tolist()) <= set(filas.tolist())
+
+
+def test_aplicar_cambio_becado_sin_resultado_vigente():
+    motor = MotorComparacion()
+    motor.comparar([], [], (1, 1))
+    assert motor.aplicar_cambio_becado([{'cedula': 1234567}], [], 0, None, (2, 1), (3, 1)) is None
@@ -0,0 +1,44 @@
+"""Pruebas de migrar_esquema con bases de datos del esquema anterior (inscritos como JSON)."""
+import json
+import sqlite3
+from contextlib import closing
+
+from nucleo import ARCHIVO_BD, CARRERAS, leer_inscritos, migrar_esquema, restaurar_bd
+
+ENCABEZADOS = ["T. Cédula", "Cédula", "Nombres", "Apellidos", "Carrera", "Semestre", "Correo"]
+
+
+def crear_bd_json(ruta, cedulas):
+    """Base de datos con el esquema original: cada inscrito es una fila JSON en `datos_fila`."""
+    with closing(sqlite3.connect(ruta)) as conexion, conexion:
+        conexion.execute("CREATE TABLE becados (id INTEGER PRIMARY KEY AUTOINCREMENT, tipo_cedula TEXT NOT NULL, cedula INTEGER NOT NULL UNIQUE, "
+                         "nombres TEXT NOT NULL, apellidos TEXT NOT NULL, carrera TEXT NOT NULL, semestre INTEGER NOT NULL)")
+        conexion.execute("CREATE TABLE inscritos (id INTEGER PRIMARY KEY AUTOINCREMENT, datos_fila TEXT NOT NULL)")
+        conexion.execute("CREATE TABLE inscritos_encabezados (id INTEGER PRIMARY KEY, encabezados TEXT NOT NULL)")
+        conexion.execute("INSERT INTO inscritos_encabezados (id, encabezados) VALUES (1, ?)", (json.dumps(ENCABEZADOS),))
+        conexion.executemany("INSERT INTO inscritos (datos_fila) VALUES (?)",
+                             [(json.dumps(dict(zip(ENCABEZADOS, ['V', cedula, "Ana", "Pérez", CARRERAS[0], "1", f"{i}@correo.com"]))),)
+                              for i, cedula in enumerate(cedulas)])
+
+
+def test_migrar_inscritos_json_con_cedulas_repetidas_por_ceros(tmp_path):
+    """'0123456' y '123456' pasaban la validación anterior, que comparaba el texto; la migración conserva
+    la primera fila de cada cédula en vez de fallar."""
+    ruta_bd = str(tmp_path / ARCHIVO_BD)
+    crear_bd_json(ruta_bd, ['0123456', '7654321', '123456', '00123456'])
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        assert migrar_esquema(conexion) == ['123456', '00123456']
+        encabezados, filas = leer_inscritos(conexion.cursor())
+        assert migrar_esquema(conexion) == []
+    assert encabezados == ENCABEZADOS
+    assert [(f["Cédula"], f["Correo"]) for f in filas] == [('123456', '0@correo.com'), ('7654321', '1@correo.com')]
+
+
+def test_restaurar_copia_json_con_cedulas_repetidas(tmp_path, tarea):
+    ruta_bd, ruta_copia = str(tmp_path / ARCHIVO_BD), str(tmp_path / "copia.db")
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        migrar_esquema(conexion)
+    crear_bd_json(ruta_copia, ['0123456', '123456'])
+    assert restaurar_bd(ruta_copia, ruta_bd, tarea) == ['123456']
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        assert [f["Cédula"] for f in leer_inscritos(conexion.cursor())[1]] == ['123456']
@@ -0,0 +1,151 @@
+"""Pruebas de la importación de inscritos a la base de datos, de una vez y por bloques, y de la caché de importaciones."""
+import csv
+import os
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import pytest
+
+import nucleo
+from nucleo import (ARCHIVO_BD, CARRERAS, ENCABEZADOS_VISUALIZACION, CacheImportaciones, ErrorValidacion,
+                    importar_inscritos_por_bloques, importar_registros, leer_inscritos, migrar_esquema)
+
+ENCABEZADOS = ENCABEZADOS_VISUALIZACION + ["Correo"]
+
+
+def fila(i, nombres="Ana María", apellidos="Pérez Núñez"):
+    return ['V', str(10000000 + i), nombres, apellidos, CARRERAS[i % len(CARRERAS)], "CINU" if i % 10 == 0 else str(i % 10),
+            f"{i}@correo.com" if i % 3 else ""]
+
+
+def escribir_csv(ruta, filas, codificacion='utf-8'):
+    with open(ruta, 'w', newline='', encoding=codificacion) as f:
+        escritor = csv.writer(f, delimiter=';')
+        escritor.writerow(ENCABEZADOS)
+        escritor.writerows(filas)
+    return str(ruta)
+
+
+@pytest.fixture
+def ruta_bd(tmp_path):
+    ruta = str(tmp_path / ARCHIVO_BD)
+    with closing(sqlite3.connect(ruta)) as conexion:
+        migrar_esquema(conexion)
+    return ruta
+
+
+def inscritos_guardados(ruta_bd):
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        return leer_inscritos(conexion.cursor())
+
+
+def como_tabla(filas):
+    return pd.DataFrame(list(filas))
+
+
+def test_por_bloques_da_lo_mismo_que_de_una_vez(tmp_path, ruta_bd, tarea):
+    ruta = escribir_csv(tmp_path / "inscritos.csv", [fila(i) for i in range(50)])
+    encabezados, filas, indice = importar_inscritos_por_bloques(ruta, ruta_bd, tarea, tamano_bloque=7)
+    guardados = inscritos_guardados(ruta_bd)
+
+    ruta_bd_entera = str(tmp_path / "entera.db")
+    with closing(sqlite3.connect(ruta_bd_entera)) as conexion:
+        migrar_esquema(conexion)
+    esperados = importar_registros(ruta, 'inscritos', ruta_bd_entera, tarea)
+    assert encabezados == esperados[0] == ENCABEZADOS
+    assert como_tabla(filas).equals(como_tabla(esperados[1]))
+    assert como_tabla(guardados[1]).equals(como_tabla(inscritos_guardados(ruta_bd_entera)[1]))
+    assert indice.candidatos(["maria"]).tolist() == list(range(50))
+    # La tabla recibe las filas por lotes del tamaño del bloque, con la posición de cada uno.
+    assert [(lote[1], len(lote[3])) for lote in tarea.lotes[:8]] == [(i, min(7, 50 - i)) for i in range(0, 50, 7)]
+
+
+def test_cedula_repetida_entre_bloques(tmp_path, ruta_bd, tarea):
+    filas = [fila(i) for i in range(20)]
+    filas[15][1] = '0' + filas[2][1] # Misma cédula con un cero a la izquierda, en otro bloque
+    with pytest.raises(ErrorValidacion) as error:
+        importar_inscritos_por_bloques(escribir_csv(tmp_path / "inscritos.csv", filas), ruta_bd, tarea, tamano_bloque=5)
+    errores = error.value.errores
+    assert errores["Fila"].tolist() == [4, 17]
+    assert set(errores["Regla"]) == {"Cédula repetida en las filas 4, 17."}
+    assert inscritos_guardados(ruta_bd) == (None, [])
+
+
+def test_errores_en_un_bloque_posterior(tmp_path, ruta_bd, tarea):
+    """Los bloques ya guardados se deshacen y se informan los errores de todos los bloques siguientes."""
+    importar_inscritos_por_bloques(escribir_csv(tmp_path / "anteriores.csv", [fila(i) for i in range(100, 103)]), ruta_bd, tarea)
+    filas = [fila(i) for i in range(20)]
+    filas[12][4] = "Medicina"
+    filas[18][0] = 'X'
+    with pytest.raises(ErrorValidacion) as error:
+        importar_inscritos_por_bloques(escribir_csv(tmp_path / "inscritos.csv", filas), ruta_bd, tarea, tamano_bloque=5)
+    assert error.value.errores[["Fila", "Columna"]].values.tolist() == [[14, "Carrera"], [20, "T. Cédula"]]
+    assert [f["Cédula"] for f in inscritos_guardados(ruta_bd)[1]] == ['10000100', '10000101', '10000102']
+
+
+def test_reintento_en_latin1(tmp_path, ruta_bd, tarea):
+    """La muestra con la que se detecta la codificación es UTF-8, pero una fila de un bloque posterior está
+    en Latin-1: se vuelve a importar todo, leyendo como Latin-1 solo los bytes que no son UTF-8."""
+    ruta = tmp_path / "inscritos.csv"
+    escribir_csv(ruta, [fila(i) for i in range(6000)])
+    with open(ruta, 'ab') as f:
+        f.write(";".join(fila(6000, "Ramón", "Muñoz")).encode('latin-1') + b"\r\n")
+    encabezados, filas, _ = importar_inscritos_por_bloques(str(ruta), ruta_bd, tarea, tamano_bloque=500)
+    assert [lote[1] for lote in tarea.lotes].count(0) == 2 # La tabla vuelve a recibir las filas desde el principio
+    assert encabezados == ENCABEZADOS and len(filas) == 6001
+    assert filas[0]["Nombres"] == "Ana María" and (filas[6000]["Nombres"], filas[6000]["Apellidos"]) == ("Ramón", "Muñoz")
+    assert inscritos_guardados(ruta_bd)[1][6000]["Nombres"] == "Ramón"
+
+
+def test_cache_guarda_y_devuelve_lo_validado(tmp_path):
+    cache = CacheImportaciones(tmp_path / "cache")
+    df = pd.DataFrame([fila(i) for i in range(5)], columns=ENCABEZADOS).replace("", float("nan"))
+    assert cache.obtener("abc") is None
+    cache.guardar("abc", df)
+    guardado = cache.obtener("abc")
+    assert guardado.equals(df) # Las celdas vacías vuelven como NaN
+    assert cache.obtener("def") is None
+
+
+def test_importar_con_cache(tmp_path, ruta_bd, tarea, monkeypatch):
+    """La segunda importación del mismo archivo no lo lee; si el archivo cambia o cambia la validación, sí."""
+    cache = CacheImportaciones(tmp_path / "cache")
+    ruta = escribir_csv(tmp_path / "inscritos.csv", [fila(i) for i in range(10)])
+    esperados = importar_registros(ruta, 'inscritos', ruta_bd, tarea, cache)
+    leidos = []
+    leer = nucleo.leer_archivo_registros
+    monkeypatch.setattr(nucleo, 'leer_archivo_registros', lambda ruta: leidos.append(ruta) or leer(ruta))
+
+    encabezados, filas, _ = importar_registros(ruta, 'inscritos', ruta_bd, tarea, cache)
+    assert leidos == []
+    assert encabezados == esperados[0] and como_tabla(filas).equals(como_tabla(esperados[1]))
+
+    escribir_csv(ruta, [fila(i) for i in range(11)])
+    assert len(importar_registros(ruta, 'inscritos', ruta_bd, tarea, cache)[1]) == 11
+    monkeypatch.setattr(nucleo, 'VERSION_VALIDACION', nucleo.VERSION_VALIDACION + 1)
+    importar_registros(ruta, 'inscritos', ruta_bd, tarea, cache)
+    assert leidos == [ruta, ruta]
+
+
+def test_cache_danada_se_descarta(tmp_path):
+    cache = CacheImportaciones(tmp_path / "cache")
+    cache.guardar("abc", pd.DataFrame([fila(0)], columns=ENCABEZADOS))
+    ruta, = (tmp_path / "cache").glob("abc-*.npz")
+    ruta.write_bytes(b"no es un npz")
+    assert cache.obtener("abc") is None
+    assert not ruta.exists()
+
+
+def test_cache_borra_primero_lo_usado_hace_mas_tiempo(tmp_path):
+    ruta = escribir_csv(tmp_path / "inscritos.csv", [fila(i) for i in range(200)])
+    df = pd.read_csv(ruta, sep=';', dtype=str)
+    cache = CacheImportaciones(tmp_path / "cache")
+    for i, huella in enumerate(["a", "b", "c"]):
+        cache.guardar(huella, df)
+        os.utime(cache._ruta(huella), (i, i))
+    cache.obtener("a") # Usar "a" la vuelve la más reciente
+    tamano = cache._ruta("a").stat().st_size
+    cache.limite_bytes = 2 * tamano + tamano // 2
+    cache.guardar("d", df)
+    assert [h for h in "abcd" if cache._ruta(h).exists()] == ["a", "d"]
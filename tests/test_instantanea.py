@@ -0,0 +1,77 @@
+"""Pruebas de InstantaneaSesion: lo que se carga es lo mismo que se guardó."""
+import csv
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nucleo import (ARCHIVO_BD, CARRERAS, ENCABEZADOS_VISUALIZACION, InstantaneaSesion, MotorComparacion, SEMESTRES, columnas_tabla,
+                    importar_inscritos_por_bloques, importar_registros, migrar_esquema, preparar_filas)
+
+ENCABEZADOS = ENCABEZADOS_VISUALIZACION + ["Correo"]
+
+
+def importar_inscritos(tmp_path, tarea, por_bloques):
+    ruta = str(tmp_path / "inscritos.csv")
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f, delimiter=';')
+        escritor.writerow(ENCABEZADOS)
+        escritor.writerows(['V', str(10000000 + i), "José Ángel", "Núñez", CARRERAS[i % len(CARRERAS)], "CINU" if i % 10 == 0 else str(i % 10),
+                            f"{i}@correo.com" if i % 3 else ""] for i in range(40))
+    ruta_bd = str(tmp_path / ARCHIVO_BD)
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        migrar_esquema(conexion)
+    if por_bloques:
+        return importar_inscritos_por_bloques(ruta, ruta_bd, tarea, tamano_bloque=15)
+    return importar_registros(ruta, 'inscritos', ruta_bd, tarea)
+
+
+@pytest.mark.parametrize('por_bloques', [False, True])
+def test_guardar_y_cargar(tmp_path, tarea, por_bloques):
+    encabezados, filas, indice = importar_inscritos(tmp_path, tarea, por_bloques)
+    columnas, cedulas = columnas_tabla('inscritos', encabezados, filas)
+    busqueda, codigos = preparar_filas(encabezados, columnas, len(cedulas))
+    becados = [{'id': 1, 'tipo_cedula': 'V', 'cedula': 10000003, 'nombres': "José Ángel", 'apellidos': "Núñez", 'carrera': CARRERAS[3], 'semestre': SEMESTRES['3']},
+               {'id': 2, 'tipo_cedula': 'V', 'cedula': 10000005, 'nombres': "Ana", 'apellidos': "Núñez", 'carrera': CARRERAS[5], 'semestre': SEMESTRES['5']},
+               {'id': 3, 'tipo_cedula': 'E', 'cedula': 99999999, 'nombres': "Luis", 'apellidos': "Díaz", 'carrera': CARRERAS[0], 'semestre': 1}]
+    comparacion = MotorComparacion().comparar_con_indice(becados, filas, (1, 1))
+
+    instantanea = InstantaneaSesion(tmp_path / "instantanea")
+    instantanea.guardar(["a", 1], encabezados, (columnas, cedulas, busqueda, codigos, indice), filas, comparacion)
+    assert instantanea.vigente(["a", 1]) and not instantanea.vigente(["a", 2])
+    assert instantanea.cargar(["a", 2]) is None
+    encabezados_c, (columnas_c, cedulas_c, busqueda_c, codigos_c, indice_c), filas_c, (resultado_c, indice_cedulas_c) = \
+        instantanea.cargar(["a", 1])
+
+    assert encabezados_c == encabezados
+    assert [list(c) for c in columnas_c] == [list(c) for c in columnas]
+    assert list(cedulas_c) == list(cedulas) and busqueda_c == busqueda
+    for enc in codigos:
+        np.testing.assert_array_equal(codigos_c[enc], codigos[enc])
+    assert indice_c.candidatos(["angel"]).tolist() == indice.candidatos(["angel"]).tolist() == list(range(40))
+    assert indice_c.candidatos(["10000007"]).tolist() == [7]
+    assert pd.DataFrame(list(filas_c)).equals(pd.DataFrame(list(filas))) # Los correos vacíos vuelven como NaN
+    resultado, indice_cedulas = comparacion
+    for nombre in ('estado_becados', 'mascara_becados', 'estado_inscritos', 'mascara_inscritos'):
+        np.testing.assert_array_equal(getattr(resultado_c, nombre), getattr(resultado, nombre))
+    assert (resultado_c.becados_no_inscritos, resultado_c.incongruentes) == (resultado.becados_no_inscritos, resultado.incongruentes) == (1, 1)
+    np.testing.assert_array_equal(indice_cedulas_c[0], indice_cedulas[0])
+    np.testing.assert_array_equal(indice_cedulas_c[1], indice_cedulas[1])
+    assert indice_cedulas_c[2].posiciones([10000005]).tolist() == indice_cedulas[2].posiciones([10000005]).tolist()
+
+
+def test_nuevo_guardado_reemplaza_al_anterior(tmp_path, tarea):
+    encabezados, filas, indice = importar_inscritos(tmp_path, tarea, False)
+    columnas, cedulas = columnas_tabla('inscritos', encabezados, filas)
+    partes = (columnas, cedulas, *preparar_filas(encabezados, columnas, len(cedulas)), indice)
+    comparacion = MotorComparacion().comparar_con_indice([], filas, (1, 1))
+    instantanea = InstantaneaSesion(tmp_path / "instantanea")
+    instantanea.guardar(["a", 1], encabezados, partes, filas, comparacion)
+    instantanea.guardar(["a", 2], encabezados, partes, filas, comparacion)
+    assert instantanea.cargar(["a", 1]) is None
+    assert len(instantanea.cargar(["a", 2])[2]) == 40
+    assert {ruta.stem.rsplit('-', 1)[-1] for ruta in (tmp_path / "instantanea").glob('*.npy')} == {'2'}
+    instantanea.borrar()
+    assert instantanea.cargar(["a", 2]) is None
@@ -0,0 +1,98 @@
+"""Pruebas de la lectura de archivos de estudiantes: detección del formato de los CSV y lectura de Excel."""
+import pandas as pd
+import pytest
+
+from nucleo import ENCABEZADOS_VISUALIZACION, ErrorImportacion, detectar_formato_csv, leer_archivo_registros, leer_hoja_excel
+
+FILA = ['V', '12345678', "José Ángel", "Núñez Peña", "Contaduría", "CINU"]
+
+
+def escribir(ruta, texto, codificacion='utf-8'):
+    with open(ruta, 'wb') as f:
+        f.write(texto.encode(codificacion))
+    return str(ruta)
+
+
+def test_detectar_encabezados_debajo_de_un_titulo(tmp_path):
+    ruta = escribir(tmp_path / "a.csv", "Listado de inscritos\n\n;" + ";".join(ENCABEZADOS_VISUALIZACION) + ";Correo;;Notas\n;"
+                    + ";".join(FILA) + ";a@b.com;;\n")
+    formato = detectar_formato_csv(ruta)
+    assert (formato.codificacion, formato.separador, formato.fila_encabezados, formato.columna_inicio) == ('utf-8', ';', 2, 1)
+    assert formato.encabezados == ENCABEZADOS_VISUALIZACION + ["Correo", "", "Notas"]
+    assert formato.con_nombre == [0, 1, 2, 3, 4, 5, 6, 8]
+
+
+@pytest.mark.parametrize('separador', [',', '\t', '|'])
+def test_detectar_separador(tmp_path, separador):
+    ruta = escribir(tmp_path / "a.csv", separador.join(ENCABEZADOS_VISUALIZACION) + "\n" + separador.join(FILA) + "\n")
+    assert detectar_formato_csv(ruta).separador == separador
+
+
+@pytest.mark.parametrize('codificacion, esperada', [('utf-8-sig', 'utf-8-sig'), ('utf-16', 'utf-16'), ('latin-1', 'latin-1')])
+def test_detectar_codificacion(tmp_path, codificacion, esperada):
+    ruta = escribir(tmp_path / "a.csv", ";".join(ENCABEZADOS_VISUALIZACION) + "\r\n" + ";".join(FILA) + "\r\n", codificacion)
+    formato = detectar_formato_csv(ruta)
+    assert formato.codificacion == esperada
+    assert formato.encabezados == ENCABEZADOS_VISUALIZACION
+
+
+def test_muestra_que_corta_un_caracter_utf8(tmp_path):
+    """Si la muestra termina a mitad de una 'é' (dos bytes), el archivo sigue siendo UTF-8."""
+    encabezados = (";".join(ENCABEZADOS_VISUALIZACION) + "\n").encode('utf-8')
+    datos = ("V;12345678;José;Pérez;Contaduría;1\n" * 20).encode('utf-8')
+    corte = len(encabezados) + datos.index("é".encode('utf-8')) + 1
+    ruta = tmp_path / "a.csv"
+    ruta.write_bytes(encabezados + datos)
+    assert detectar_formato_csv(str(ruta), tamano_muestra=corte).codificacion == 'utf-8'
+
+
+def test_sin_encabezados(tmp_path):
+    ruta = escribir(tmp_path / "a.csv", "Cédula;Nombres\n12345678;Ana\n")
+    with pytest.raises(ErrorImportacion):
+        detectar_formato_csv(ruta)
+
+
+def test_leer_csv_que_deja_de_ser_utf8_despues_de_la_muestra(tmp_path):
+    ruta = tmp_path / "a.csv"
+    inicio = (";".join(ENCABEZADOS_VISUALIZACION) + "\n" + ";".join(FILA) + "\n").encode('utf-8')
+    ruta.write_bytes(inicio + b"\n" * 70000 + ";".join(FILA[:2] + ["Ramón", "Muñoz"] + FILA[4:]).encode('latin-1') + b"\n")
+    df, filas = leer_archivo_registros(str(ruta))
+    assert df.iloc[0].tolist() == FILA # Las filas en UTF-8 y la que está en Latin-1 se leen bien
+    assert df["Nombres"].iloc[-1] == "Ramón" and df["Apellidos"].iloc[-1] == "Muñoz"
+    assert filas[0] == 2 and filas[-1] == len(df) + 1
+
+
+def escribir_xlsx(ruta, filas):
+    openpyxl = pytest.importorskip('openpyxl')
+    libro = openpyxl.Workbook()
+    for fila in filas:
+        libro.active.append(fila)
+    libro.create_sheet("Otra").append(ENCABEZADOS_VISUALIZACION)
+    libro.save(ruta)
+    return str(ruta)
+
+
+def test_leer_hoja_excel(tmp_path):
+    """Solo la zona de datos de la primera hoja: debajo de los encabezados, desde el primero requerido hasta
+    el último con nombre, con los números como texto y sin las filas vacías del final."""
+    ruta = escribir_xlsx(tmp_path / "a.xlsx", [
+        ["Listado de inscritos"],
+        [],
+        ["Nro.", *ENCABEZADOS_VISUALIZACION, None, "Correo"],
+        [1, 'V', 12345678, "José Ángel", "Núñez Peña", "Contaduría", 3, None, "a@b.com", "fuera de la tabla"],
+        [2, 'E', "87654321", "Ana", "Pérez", "Contaduría", "CINU"],
+        [],
+        [None, None],
+    ])
+    df, filas = leer_hoja_excel(ruta)
+    assert df.columns.tolist() == ENCABEZADOS_VISUALIZACION + ["", "Correo"]
+    assert df.iloc[0, :6].tolist() + [df.iloc[0, 7]] == ['V', '12345678', "José Ángel", "Núñez Peña", "Contaduría", '3', "a@b.com"]
+    assert df.iloc[1, :6].tolist() == ['E', '87654321', "Ana", "Pérez", "Contaduría", "CINU"]
+    assert df.iloc[:, 6].isna().all() and pd.isna(df.iloc[1, 7]) # Celdas vacías: NaN, como pd.read_excel
+    assert filas.tolist() == [4, 5]
+
+
+def test_leer_hoja_excel_sin_encabezados(tmp_path):
+    ruta = escribir_xlsx(tmp_path / "a.xlsx", [["Cédula", "Nombres"], ["12345678", "Ana"]])
+    with pytest.raises(ErrorImportacion):
+        leer_hoja_excel(ruta)
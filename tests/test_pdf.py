@@ -0,0 +1,44 @@
+"""Pruebas de generar_pdf: el texto de cada celda cabe en el ancho de su columna."""
+import csv
+
+import pytest
+
+from nucleo import generar_pdf
+
+platypus = pytest.importorskip('reportlab.platypus')
+from reportlab.pdfbase.pdfmetrics import stringWidth # noqa: E402
+
+ENCABEZADOS = ["Cédula", "Nombres y apellidos de los estudiantes", "Carrera", "Observaciones"]
+
+
+def test_texto_que_no_cabe_se_corta(tmp_path, monkeypatch):
+    """La muestra con la que se miden las columnas no tiene las filas más largas, y la columna más ancha se
+    angosta para caber en la página apaisada: ningún texto pasa del ancho de su celda."""
+    filas = [[str(10000000 + i), "Ana Pérez", "Contaduría", "Sin observaciones"] for i in range(60)]
+    filas[45] = ["10000045", "María de los Ángeles Fernández Rodríguez de la Santísima Trinidad", "Contaduría",
+                 "Inscrita fuera de lapso por problemas con el pago de la matrícula " * 4]
+    ruta_filas = tmp_path / "filas.csv"
+    with open(ruta_filas, 'w', encoding='utf-8-sig', newline='') as f:
+        csv.writer(f).writerows([ENCABEZADOS] + filas)
+    muestra = [filas[0], ["10000001", "Ana Pérez", "Contaduría", "Observaciones muy largas " * 4]]
+    tablas = []
+
+    class LongTable(platypus.LongTable):
+        def __init__(self, datos, colWidths, **opciones):
+            tablas.append((datos, colWidths))
+            super().__init__(datos, colWidths, **opciones)
+
+    monkeypatch.setattr(platypus, 'LongTable', LongTable)
+    generar_pdf(str(ruta_filas), str(tmp_path / "reporte.pdf"), "Reporte", len(filas), muestra)
+
+    for datos, anchos in tablas:
+        for i, fila in enumerate(datos):
+            fuente = 'Helvetica-Bold' if i == 0 else 'Helvetica'
+            assert all(stringWidth(texto, fuente, 10) <= ancho - 12 for texto, ancho in zip(fila, anchos))
+    impresas = [fila for datos, _ in tablas for fila in datos[1:]]
+    assert [fila[0] for fila in impresas] == [fila[0] for fila in filas] # Las columnas cortas no se angostan
+    assert [fila[1] for fila in impresas[:45]] == ["Ana Pérez"] * 45 # Lo que cabe no cambia
+    nombre, observaciones = impresas[45][1], impresas[45][3]
+    assert nombre.startswith("María de") and nombre.endswith("…")
+    assert observaciones.startswith("Inscrita fuera de lapso") and observaciones.endswith("…")
+    assert (tmp_path / "reporte.pdf").stat().st_size > 0
@@ -0,0 +1,37 @@
+"""Pruebas de la copia y la restauración de la base de datos."""
+import sqlite3
+from contextlib import closing
+
+from nucleo import ARCHIVO_BD, CARRERAS, leer_marca_cambios, migrar_esquema, respaldar_bd, restaurar_bd
+
+
+def agregar_becado(ruta_bd, cedula):
+    with closing(sqlite3.connect(ruta_bd)) as conexion, conexion:
+        conexion.execute("INSERT INTO becados (tipo_cedula, cedula, nombres, apellidos, carrera, semestre) VALUES (?, ?, ?, ?, ?, ?)",
+                         ('V', cedula, "Ana", "Pérez", CARRERAS[0], 1))
+
+
+def marca_de(ruta_bd):
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        return leer_marca_cambios(conexion.cursor())
+
+
+def test_restaurar_renueva_la_marca_de_cambios(tmp_path, tarea):
+    """Tras restaurar, los mismos cambios que llevaron a la marca de una instantánea anterior no la repiten."""
+    ruta_bd, ruta_copia = str(tmp_path / ARCHIVO_BD), str(tmp_path / "copia.db.gz")
+    with closing(sqlite3.connect(ruta_bd)) as conexion:
+        migrar_esquema(conexion)
+    agregar_becado(ruta_bd, 1000001)
+    respaldar_bd(ruta_bd, ruta_copia, tarea)
+    agregar_becado(ruta_bd, 1000002)
+    agregar_becado(ruta_bd, 1000003)
+    marca_instantanea = marca_de(ruta_bd) # La que guardaría la instantánea al cerrar
+
+    restaurar_bd(ruta_copia, ruta_bd, tarea)
+    marca_restaurada = marca_de(ruta_bd)
+    assert marca_restaurada[0] != marca_instantanea[0]
+    agregar_becado(ruta_bd, 1000004)
+    agregar_becado(ruta_bd, 1000005)
+    marca_final = marca_de(ruta_bd)
+    assert marca_final[1] == marca_instantanea[1]
+    assert marca_final != marca_instantanea